@@ -122,6 +122,7 @@ class CustomTextBox(QTextEdit):
         self.memory = memory
         self.view_mode = False
         self.original_text = ""  # 원본 텍스트 저장용
+        self.model = None  # 편집 중인 텍스트 박스 모델 (TextBoxLayer의 편집기로 쓰일 때)
         
         # 패딩과 마진 설정
         self.padding = 5
@@ -213,8 +214,13 @@ class CustomTextBox(QTextEdit):
             self.updateResizeHandlePosition()
             self.resize_handle.hide()  # 초기에는 숨김
             
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self.sync_model()
+        
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        self.sync_model()
         if self.drag_handle:
             self.updateDragHandlePosition()
         if self.resize_handle:
@@ -222,6 +228,11 @@ class CustomTextBox(QTextEdit):
         if self.html_button and self.view_mode:
             self.html_button.updatePosition(self.size())
             
+    def sync_model(self):
+        """편집 중인 텍스트 박스 모델에 바뀐 위치/크기 반영"""
+        if self.model is not None and hasattr(self.parent(), 'text_layer'):
+            self.parent().text_layer.editor_geometry_changed()
+            
     def updateDragHandlePosition(self):
         """드래그 핸들 위치 업데이트"""
         if self.drag_handle:
@@ -237,6 +248,9 @@ class CustomTextBox(QTextEdit):
             
     def cleanup(self):
         """위젯 삭제 전 정리 작업"""
+        if self.model is not None and hasattr(self.parent(), 'text_layer'):
+            self.model = None
+            self.parent().text_layer.editor_deleted()
         if self.parent() and hasattr(self.parent(), 'text_boxes'):
             if self in self.parent().text_boxes:
                 self.parent().text_boxes.remove(self)
@@ -287,6 +301,14 @@ class CustomTextBox(QTextEdit):
         # 줄바꿈 설정 복원
         doc.setTextWidth(text_width - self.total_spacing)
         
+    def focusOutEvent(self, event):
+        """편집기로 쓰이는 경우 포커스를 잃으면 편집 종료 (메뉴/대화상자는 제외)"""
+        super().focusOutEvent(event)
+        if event.reason() in (Qt.FocusReason.PopupFocusReason, Qt.FocusReason.ActiveWindowFocusReason):
+            return
+        if self.model is not None and hasattr(self.parent(), 'text_layer'):
+            self.parent().text_layer.end_edit()
+        
     def mousePressEvent(self, event):
         super().mousePressEvent(event)
             
@@ -0,0 +1,134 @@
+import base64
+import html
+import re
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QRect
+
+# 태그 버튼 텍스트 중 HTML 요소 이름으로 쓸 수 없는 것은 div로 출력
+_TAG_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9-]*$")
+_RESERVED_TAGS = {"html", "head", "body", "script", "style", "title", "meta", "link"}
+
+def element_name(tag):
+    """태그 버튼 텍스트를 HTML 요소 이름으로 변환
+
+    Args:
+        tag (str): 태그 버튼 텍스트
+
+    Returns:
+        str: 요소 이름 (쓸 수 없는 이름이면 "div")
+    """
+    tag = (tag or "").strip()
+    if not _TAG_NAME.match(tag) or tag.lower() in _RESERVED_TAGS:
+        return "div"
+    return tag.lower()
+
+def image_to_png(image):
+    """QImage를 PNG 바이트로 인코딩"""
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(data)
+
+def image_to_data_uri(image):
+    """QImage를 PNG data URI로 인코딩"""
+    return "data:image/png;base64," + base64.b64encode(image_to_png(image)).decode("ascii")
+
+class NoteHtmlExporter:
+    """텍스트 박스 모델과 잉크 레이어에서 바로 HTML 생성
+
+    화면을 캡처해 다시 OCR하는 대신, 텍스트 박스가 가진 문자열·태그·위치·
+    폰트를 그대로 사용하고 잉크는 잉크가 있는 영역만 PNG로 잘라 포함합니다.
+
+    Attributes:
+        title (str): 문서 제목
+    """
+
+    def __init__(self, title="MarkUpNote"):
+        self.title = title
+
+    def ink_rect(self, ink, strokes=None):
+        """잉크가 있는 영역 (획 문서가 있으면 획 경계, 없으면 할당된 타일 경계)"""
+        bounds = ink.bounding_rect()
+        if strokes is not None:
+            bounds = bounds.intersected(strokes.bounds())
+        return bounds
+
+    def export(self, text_boxes, ink=None, strokes=None):
+        """HTML 문서 생성
+
+        Args:
+            text_boxes (iterable): TextBoxModel 목록
+            ink (TiledCanvas): 잉크 레이어 (None이면 제외)
+            strokes (StrokeDocument): 잉크 영역 계산에 쓸 획 문서
+
+        Returns:
+            str: HTML 문서
+        """
+        boxes = [box for box in text_boxes if box.isVisible()]
+        ink_rect = self.ink_rect(ink, strokes) if ink is not None else QRect()
+
+        page = QRect(0, 0, 1, 1)
+        for box in boxes:
+            page = page.united(box.geometry())
+        if not ink_rect.isEmpty():
+            page = page.united(ink_rect)
+        origin = page.topLeft()
+
+        parts = []
+        if not ink_rect.isEmpty():
+            parts.append(self.ink_element(ink.copy(ink_rect), ink_rect.translated(-origin)))
+        # 읽는 순서(위에서 아래, 왼쪽에서 오른쪽)로 배치
+        for box in sorted(boxes, key=lambda box: (box.geometry().top(), box.geometry().left())):
+            parts.append(self.text_box_element(box, box.geometry().translated(-origin)))
+
+        body = "\n".join(parts)
+        return f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{html.escape(self.title)}</title>
+    <style>
+        body {{
+            margin: 20px;
+        }}
+        .page {{
+            position: relative;
+            width: {page.width()}px;
+            height: {page.height()}px;
+            background-color: white;
+        }}
+        .ink, .text-box {{
+            position: absolute;
+            box-sizing: border-box;
+            margin: 0;
+        }}
+        .text-box {{
+            padding: 8px;
+            white-space: pre-wrap;
+            overflow-wrap: break-word;
+        }}
+    </style>
+</head>
+<body>
+<div class="page">
+{body}
+</div>
+</body>
+</html>
+"""
+
+    def ink_element(self, image, rect):
+        """잉크 이미지 요소"""
+        return (f'<img class="ink" alt="" src="{image_to_data_uri(image)}" '
+                f'style="left: {rect.x()}px; top: {rect.y()}px; width: {rect.width()}px; height: {rect.height()}px;">')
+
+    def text_box_element(self, box, rect):
+        """텍스트 박스 요소 (태그 버튼 텍스트를 요소 이름으로 사용)"""
+        name = element_name(box.tag)
+        font = box.font()
+        text = html.escape(box.toPlainText())
+        style = (f"left: {rect.x()}px; top: {rect.y()}px; width: {rect.width()}px; min-height: {rect.height()}px; "
+                 f"font-family: '{html.escape(font.family(), quote=True)}'; font-size: {box.font_size}pt;")
+        return f'<{name} class="text-box" data-tag="{html.escape(box.tag, quote=True)}" style="{style}">{text}</{name}>'
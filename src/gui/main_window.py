@@ -1,15 +1,22 @@
-from PyQt5.QtWidgets import QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QShortcut, QFileDialog, QMessageBox
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QKeySequence
 
 from src.gui.note_canvas import NoteCanvas
+from src.gui.note_file import NOTE_EXTENSION
+from src.utils.text_processor import text_processor
 
 class MainWindow(QMainWindow):
+    # OCR 모델 로딩 완료 시그널 (성공 여부)
+    ocr_ready = pyqtSignal(bool)
+
     def __init__(self, debug_mode=False):
         super().__init__()
         self.debug_mode = debug_mode
+        self.ocr_warmup_started = False
         self.init_ui()
         self.current_mode = "text"  # 초기 모드 설정
+        self.ocr_ready.connect(self.on_ocr_ready)
         
     def init_ui(self):
         """UI 초기화"""
@@ -33,6 +40,15 @@ class MainWindow(QMainWindow):
         self.note_canvas.text_recognition_mode.debug_mode = self.debug_mode
         layout.addWidget(self.note_canvas)
         
+        # 실행 취소/다시 실행 단축키 (텍스트 박스 편집 중에는 텍스트 박스가 우선 처리)
+        QShortcut(QKeySequence.StandardKey.Undo, self, self.note_canvas.undo)
+        QShortcut(QKeySequence.StandardKey.Redo, self, self.note_canvas.redo)
+        
+        # 저장 진행 상황은 상태 표시줄에 표시
+        self.note_canvas.saver.progress.connect(self.on_save_progress)
+        self.note_canvas.saver.saved.connect(self.on_save_finished)
+        self.note_canvas.saver.failed.connect(self.on_save_failed)
+        
     def setup_control_panel(self, parent_layout):
         """컨트롤 패널 설정"""
         control_widget = QWidget()
@@ -82,6 +98,7 @@ class MainWindow(QMainWindow):
         # 텍스트 인식 버튼
         self.text_recognition_btn = QPushButton("텍스트 인식")
         self.text_recognition_btn.clicked.connect(self.process_text)
+        self.text_recognition_btn.setToolTip("텍스트 인식 모델 로딩 중...")
         
         # View 모드 버튼 추가
         self.view_btn = QPushButton("View")
@@ -105,6 +122,11 @@ class MainWindow(QMainWindow):
             }
         """)
         
+        # 열기 버튼
+        self.open_btn = QPushButton("열기")
+        self.open_btn.clicked.connect(self.open_note)
+        self.open_btn.setStyleSheet(self.default_style)
+        
         # 모든 모드 버튼에 기본 스타일 적용
         self.mode_buttons = {
             "text": self.text_btn,
@@ -126,6 +148,7 @@ class MainWindow(QMainWindow):
         control_layout.addWidget(self.view_btn)
         control_layout.addSpacing(20)  # 저장 버튼 위에 여백 추가
         control_layout.addWidget(self.save_btn)
+        control_layout.addWidget(self.open_btn)
         control_layout.addStretch()
         
         # 컨트롤 위젯에 마우스 이벤트 추가
@@ -140,6 +163,27 @@ class MainWindow(QMainWindow):
         """)
         parent_layout.addWidget(control_widget)
         
+    def showEvent(self, event):
+        """윈도우 표시 이벤트 처리"""
+        super().showEvent(event)
+        # 첫 화면이 그려진 뒤 OCR 모델 워밍업 시작
+        if not self.ocr_warmup_started:
+            self.ocr_warmup_started = True
+            QTimer.singleShot(0, self.start_ocr_warmup)
+
+    def start_ocr_warmup(self):
+        """백그라운드에서 OCR 모델 로딩 시작"""
+        # 콜백은 로딩 스레드에서 호출되므로 시그널로 GUI 스레드에 전달
+        text_processor.add_ready_callback(self.ocr_ready.emit)
+        text_processor.warmup()
+
+    def on_ocr_ready(self, success):
+        """OCR 모델 로딩 완료 처리"""
+        if success:
+            self.text_recognition_btn.setToolTip("")
+        else:
+            self.text_recognition_btn.setToolTip("텍스트 인식 모델을 불러오지 못했습니다.")
+
     def update_button_styles(self, active_mode):
         """현재 모드에 따라 버튼 스타일 업데이트"""
         self.current_mode = active_mode
@@ -164,8 +208,7 @@ class MainWindow(QMainWindow):
         self.note_canvas.set_mode("text")
         self.update_button_styles("text")
         # View 모드 해제
-        for text_box in self.note_canvas.text_mode.text_box_memory.get_text_boxes():
-            text_box.setViewMode(False)
+        self.note_canvas.text_layer.set_view_mode(False)
         
     def set_draw_mode(self):
         """그리기 모드로 전환"""
@@ -190,6 +233,37 @@ class MainWindow(QMainWindow):
         # 텍스트 모드로 초기화
         self.set_text_mode()
 
+    def open_note(self):
+        """저장된 노트 문서 열기"""
+        path, _ = QFileDialog.getOpenFileName(self, "노트 열기", "saved_notes",
+                                              f"MarkUpNote 노트 (*{NOTE_EXTENSION})")
+        if not path:
+            return
+        try:
+            self.note_canvas.open_document(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "노트 열기", f"노트를 열 수 없습니다: {str(e)}")
+            return
+        self.set_text_mode()
+
+    def on_save_progress(self, percent, stage):
+        """저장 진행 상황 표시"""
+        self.statusBar().showMessage(f"저장 중... {stage} ({percent}%)")
+
+    def on_save_finished(self, paths):
+        """저장 완료 표시"""
+        self.statusBar().showMessage(f"저장 완료: {paths[0]}", 3000)
+
+    def on_save_failed(self, message):
+        """저장 실패 표시"""
+        self.statusBar().showMessage(f"저장 실패: {message}")
+
+    def closeEvent(self, event):
+        """종료 전 노트 문서 자동 저장과 진행 중인 저장 마치기"""
+        self.note_canvas.autosave()
+        self.note_canvas.saver.wait()
+        super().closeEvent(event)
+
     def set_view_mode(self):
         """View 모드로 전환"""
         self.note_canvas.set_mode("view")
@@ -1,7 +1,17 @@
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QPen, QCursor, QPixmap, QColor
+import os
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPainter, QPen, QCursor, QPixmap, QColor, QPolygon
 from .base_mode import BaseMode
+from ..stroke_model import STROKE_ERASER, STROKE_PEN, Stroke
 from ..text_box_memory import TextBoxMemory
+from ..undo_history import StrokeChange
+
+# 입력 점을 모아 그리는 간격 (약 60fps)
+FRAME_INTERVAL_MS = 16
+
+# 완성된 획을 단순화할 때의 허용 오차(px)
+DEFAULT_SIMPLIFY_TOLERANCE = float(os.environ.get("MARKUPNOTE_STROKE_TOLERANCE", "0.75"))
 
 class DrawMode(BaseMode):
     def __init__(self, canvas):
@@ -10,6 +20,13 @@ class DrawMode(BaseMode):
         self.drawing = False
         self.erasing = False
         self.last_point = None
+        self.current_stroke = None  # 그리는 중인 획
+        self.pending_points = []  # 아직 그리지 않은 입력 점
+        self.simplify_tolerance = DEFAULT_SIMPLIFY_TOLERANCE
+        self.flush_timer = QTimer()
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(FRAME_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush_pending_points)
         self.pen_width = 2
         self.eraser_width = 10  # 지우개 크기를 10px로 설정
         self.default_cursor = QCursor(Qt.CursorShape.ArrowCursor)
@@ -36,19 +53,65 @@ class DrawMode(BaseMode):
         self.eraser_cursor = QCursor(pixmap, cursor_size//2, cursor_size//2)
         
     def mouse_move_event(self, event):
-        painter = QPainter(self.canvas.image)
-        if self.drawing:
-            painter.setPen(QPen(Qt.GlobalColor.black, self.pen_width, Qt.PenStyle.SolidLine))
-            painter.drawLine(self.last_point, event.pos())
-            self.last_point = event.pos()
-            self.canvas.update()
-        elif self.erasing:
-            painter.setPen(QPen(Qt.GlobalColor.white, self.eraser_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-            painter.drawLine(self.last_point, event.pos())
-            self.last_point = event.pos()
-            self.canvas.update()
+        if self.current_stroke is None:
+            return
+        # 점만 모아 두고 실제 그리기는 프레임마다 한 번에 처리
+        pos = event.pos()
+        self.current_stroke.add_point(pos.x(), pos.y())
+        self.pending_points.append(pos)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+            
+    def flush_pending_points(self):
+        """모아 둔 점들을 하나의 폴리라인으로 잉크 캐시에 그리고 변경 영역만 갱신"""
+        if self.current_stroke is None or not self.pending_points:
+            self.pending_points = []
+            return
+        points = [self.last_point] + self.pending_points
+        dirty = self.draw_polyline(self.current_stroke.pen(), points,
+                                   allocate=self.current_stroke.kind == STROKE_PEN)
+        self.last_point = self.pending_points[-1]
+        self.pending_points = []
+        self.canvas.update(dirty)
+            
+    def draw_polyline(self, pen, points, allocate=True):
+        """잉크 타일에 연결된 선분들 그리기
+        
+        Args:
+            pen (QPen): 사용할 펜
+            points (list[QPoint]): 이어 그릴 점들
+            allocate (bool): 잉크가 없는 타일을 새로 할당할지 여부
+            
+        Returns:
+            QRect: 펜 두께와 안티앨리어싱 여유를 포함한 변경 영역
+        """
+        polygon = QPolygon(points)
+        margin = pen.width() // 2 + 2
+        rect = polygon.boundingRect().adjusted(-margin, -margin, margin, margin)
+        
+        def draw(painter):
+            painter.setPen(pen)
+            painter.drawPolyline(polygon)
+
+        self.canvas.history.capture(rect)  # 바뀔 타일의 이전 상태 기록
+        self.canvas.ink.paint(rect, draw, allocate=allocate)
+        return rect
             
     def mouse_release_event(self, event):
+        self.finish_stroke()
+        
+    def finish_stroke(self):
+        """남은 점을 그리고 그리는 중인 획을 마무리"""
+        self.flush_timer.stop()
+        self.flush_pending_points()
+        # 완성된 획은 점을 단순화해 벡터 문서에 저장 (클릭만 한 경우는 제외)
+        if self.current_stroke is not None and len(self.current_stroke) > 1:
+            self.current_stroke.simplify(self.simplify_tolerance)
+            self.canvas.strokes.add(self.current_stroke)
+            self.canvas.history.add_change(StrokeChange(self.canvas.strokes, added=[self.current_stroke]))
+        if self.current_stroke is not None:
+            self.canvas.history.commit()
+        self.current_stroke = None
         self.drawing = False
         self.erasing = False
         
@@ -58,6 +121,7 @@ class DrawMode(BaseMode):
         
     def deactivate(self):
         """모드 비활성화"""
+        self.finish_stroke()
         self.canvas.setCursor(self.default_cursor)
         
     def mouse_press_event(self, event):
@@ -66,10 +130,16 @@ class DrawMode(BaseMode):
             self.drawing = True
             self.erasing = False
             self.last_point = event.pos()
+            self.current_stroke = Stroke(STROKE_PEN, width=self.pen_width)
+            self.canvas.history.begin("그리기", self.canvas.ink)
+            self.current_stroke.add_point(event.pos().x(), event.pos().y())
             self.canvas.setCursor(self.default_cursor)
         ## 지우개
         elif event.button() == Qt.MouseButton.RightButton:
             self.drawing = False
             self.erasing = True
             self.last_point = event.pos()
+            self.current_stroke = Stroke(STROKE_ERASER, width=self.eraser_width)
+            self.canvas.history.begin("지우기", self.canvas.ink)
+            self.current_stroke.add_point(event.pos().x(), event.pos().y())
             self.canvas.setCursor(self.eraser_cursor)
\ No newline at end of file
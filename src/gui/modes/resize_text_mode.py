@@ -28,15 +28,14 @@ class ResizeTextMode(BaseMode):
     def mouse_press_event(self, event):
         """마우스 클릭 이벤트 처리"""
         if event.button() == Qt.MouseButton.LeftButton:
-            # 모든 텍스트 박스를 검사하여 클릭된 위치의 텍스트 박스 찾기
+            # 공간 인덱스에서 클릭된 위치의 가장 위에 있는 텍스트 박스 찾기
             pos = event.pos()
-            for text_box in self.canvas.text_boxes:
-                if text_box.geometry().contains(pos):
-                    self.resizing = True
-                    self.resize_start = pos
-                    self.resizing_text_box = text_box
-                    self.original_size = text_box.size()
-                    break
+            text_box = self.canvas.text_layer.model_at(pos)
+            if text_box is not None:
+                self.resizing = True
+                self.resize_start = pos
+                self.resizing_text_box = text_box
+                self.original_size = text_box.size()
             
     def mouse_move_event(self, event):
         """마우스 이동 이벤트 처리"""
@@ -2,6 +2,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QTextEdit
 from .base_mode import BaseMode
 from ..text_box_memory import TextBoxMemory
+from ..undo_history import TextBoxChange
 
 class TextMode(BaseMode):
     def __init__(self, canvas):
@@ -12,6 +13,7 @@ class TextMode(BaseMode):
     def mouse_press_event(self, event):
         ## 텍스트 상자 생성, 폰트 사이즈에 맞게끔 크기 조절되게 생성해야함.
         self.current_text_box = self.create_text_box(event.pos())
+        self.canvas.history.push("텍스트 상자 추가", [TextBoxChange(self.text_box_memory, self.current_text_box)])
         self.canvas.set_mode("resize_text")
             
     def mouse_move_event(self, event):
@@ -1,10 +1,11 @@
-from PyQt5.QtCore import Qt, QRect, QPoint, QSize
+from PyQt5.QtCore import Qt, QRect, QPoint, QSize, QThreadPool
 from PyQt5.QtWidgets import QRubberBand, QWidget, QPushButton, QHBoxLayout
 from PyQt5.QtGui import QPainter, QColor, QImage
-from PIL import Image
 from datetime import datetime
 import os
 from .base_mode import BaseMode
+from src.gui.ocr_worker import OcrJob
+from src.gui.undo_history import StrokeChange, TextBoxChange
 from src.utils.text_processor import text_processor
 
 class TextRecognitionMode(BaseMode):
@@ -17,10 +18,21 @@ class TextRecognitionMode(BaseMode):
         self.buttons_widget = None
         self.selection_fixed = False
         self.processed_area = None
-        self.original_image = None
         self.debug_mode = False  # 디버그 모드 기본값 설정
         
+        # 백그라운드 인식 작업 관련 변수
+        self.thread_pool = QThreadPool.globalInstance()
+        self.next_job_id = 0
+        self.pending_job = None  # 진행 중인 인식 작업
+        self.pending_text_box = None  # 결과를 기다리는 자리 표시 텍스트 박스
+        self.pending_area = None  # 인식 중인 영역
+        self.pending_clear = None  # 인식 영역을 지운 획 (취소 시 제거해 복원)
+        self.pending_entry = None  # 인식 시작 실행 취소 기록
+        self.pending_cancel_btn = None
+        
     def activate(self):
+        # 새로운 선택을 시작하면 이전 인식 작업은 취소
+        self.cancel_pending_recognition()
         self.selecting = True
         self.selection_fixed = False
         self.selection_start = None
@@ -102,35 +114,46 @@ class TextRecognitionMode(BaseMode):
         self.buttons_widget.show()
         
     def process_selection(self, area):
-        """선택 영역 처리"""
+        """선택 영역 처리
+        
+        인식은 백그라운드 스레드에서 수행되고, 결과가 나올 때까지
+        선택 영역 위치에 자리 표시 텍스트 박스를 보여줍니다.
+        """
         if not self.selection_fixed:
             return
             
-        # 원본 이미지와 영역 저장
+        # 이전 작업이 남아 있다면 취소
+        self.cancel_pending_recognition()
+            
+        # 처리 영역 저장
         self.processed_area = area
-        self.original_image = self.canvas.image.copy()
         
-        # 선택 영역의 이미지를 추출하고 처리
-        selected_image = self.canvas.image.copy(area)
+        # 지우기 전에 선택 영역의 타일을 바로 PIL 이미지로 합성 (복사 1회)
+        pil_image = self.canvas.ink.to_pil(area)
         
-        # 선택 영역을 완전히 지우기
-        painter = QPainter(self.canvas.image)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
-        painter.eraseRect(area)
-        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-        painter.fillRect(area, Qt.GlobalColor.white)
-                
-        # QImage를 PIL Image로 변환
-        buffer = selected_image.bits().asarray(selected_image.byteCount())
-        pil_image = Image.frombytes('RGBA', (selected_image.width(), selected_image.height()), buffer, 'raw', 'BGRA')
+        # 선택 영역을 완전히 지우기 (취소하면 이 지우기 획만 제거)
+        history = self.canvas.history
+        history.begin("텍스트 변환", self.canvas.ink)
+        history.capture(area)
+        clear_stroke = self.canvas.erase_area(area)
+        history.add_change(StrokeChange(self.canvas.strokes, added=[clear_stroke]))
+
+        # 자리 표시 텍스트 박스 생성 (결과가 나오면 내용이 채워짐)
+        placeholder = "인식 중..." if text_processor.is_ready() else "모델 로딩 중..."
+        self.pending_text_box = self.canvas.text_mode.create_text_box(area.topLeft(), placeholder)
+        self.pending_text_box.setReadOnly(True)
+        history.add_change(TextBoxChange(self.canvas.text_mode.text_box_memory, self.pending_text_box))
+        self.pending_entry = history.commit()
+        self.pending_area = area
+        self.pending_clear = clear_stroke
+        self.show_pending_cancel_button(area)
         
-        # 텍스트 처리
-        text = text_processor.process_image(pil_image)
-        if text:
-            # 텍스트 박스 생성 (크기는 자동으로 조절됨)
-            text_box = self.canvas.text_mode.create_text_box(area.topLeft(), text)
-            # 피드백 저장
-            self.store_feedback(pil_image, text)
+        # 백그라운드에서 텍스트 처리
+        self.next_job_id += 1
+        self.pending_job = OcrJob(self.next_job_id, pil_image)
+        self.pending_job.signals.finished.connect(self.on_recognition_finished)
+        self.pending_job.signals.failed.connect(self.on_recognition_failed)
+        self.pending_job.start(self.thread_pool)
             
         # 선택 영역과 버튼 숨기기
         self.cleanup_selection()
@@ -139,6 +162,99 @@ class TextRecognitionMode(BaseMode):
         self.canvas.set_mode("resize_text")
         self.canvas.update()
         
+    def show_pending_cancel_button(self, area):
+        """인식 중인 작업의 취소 버튼 표시"""
+        self.pending_cancel_btn = QPushButton("인식 취소", self.canvas)
+        self.pending_cancel_btn.setStyleSheet("""
+            QPushButton {
+                padding: 5px 10px;
+                border: 1px solid #ccc;
+                border-radius: 3px;
+                background-color: white;
+            }
+            QPushButton:hover {
+                background-color: #f0f0f0;
+            }
+        """)
+        self.pending_cancel_btn.clicked.connect(self.cancel_pending_recognition)
+        self.pending_cancel_btn.move(area.bottomRight() + QPoint(10, 10))
+        self.pending_cancel_btn.show()
+        
+    def on_recognition_finished(self, job_id, text):
+        """인식 완료 처리 (GUI 스레드)"""
+        if not self.pending_job or job_id != self.pending_job.job_id:
+            return  # 취소되었거나 오래된 작업의 결과
+            
+        job = self.pending_job
+        text_box = self.pending_text_box
+        entry = self.pending_entry
+        self.finish_pending_recognition()
+        
+        # 인식 중에 사용자가 텍스트 박스를 삭제했다면 등록부에 없으므로 보이지 않음
+        if text:
+            text_box.setReadOnly(False)
+            text_box.setText(text)
+            # 피드백 저장
+            self.store_feedback(job.image, text)
+        else:
+            # 자리 표시 박스 제거를 인식 시작 기록에 덧붙여 실행 취소/다시 실행해도 되살아나지 않게 함
+            memory = self.canvas.text_mode.text_box_memory
+            entry.changes.append(TextBoxChange(memory, text_box, removed=True))
+            if text_box in self.canvas.text_boxes:
+                memory.detach_text_box(text_box)
+        self.canvas.update()
+        
+    def on_recognition_failed(self, job_id, message):
+        """인식 실패 처리 (GUI 스레드)"""
+        print(f"텍스트 인식 작업 실패: {message}")
+        if self.pending_job and job_id == self.pending_job.job_id:
+            self.cancel_pending_recognition()
+        
+    def cancel_pending_recognition(self):
+        """진행 중인 인식 작업을 취소하고 지운 영역을 복원
+        
+        인식 중에 다른 동작이 기록되었을 수 있으므로 인식 시작 기록을 지우지 않고,
+        복원을 별도의 실행 취소 기록으로 남깁니다.
+        """
+        if not self.pending_job:
+            return
+            
+        self.pending_job.cancel(self.thread_pool)
+        
+        history = self.canvas.history
+        history.begin("텍스트 변환 취소", self.canvas.ink)
+        
+        # 자리 표시 텍스트 박스 제거 (인식 중에 사용자가 삭제했다면 그대로 둠)
+        memory = self.canvas.text_mode.text_box_memory
+        if self.pending_text_box in self.canvas.text_boxes:
+            memory.detach_text_box(self.pending_text_box)
+            history.add_change(TextBoxChange(memory, self.pending_text_box, removed=True))
+            
+        # 인식을 위해 지웠던 영역 복원
+        strokes = self.canvas.strokes
+        if self.pending_clear in strokes.index:
+            history.capture(self.pending_area)
+            index = strokes.strokes.index(self.pending_clear)
+            strokes.remove(self.pending_clear)
+            strokes.rasterize(self.canvas.ink, self.pending_area)
+            history.add_change(StrokeChange(strokes, removed=[(index, self.pending_clear)]))
+        history.commit()
+            
+        self.finish_pending_recognition()
+        self.canvas.update()
+        
+    def finish_pending_recognition(self):
+        """인식 작업 상태 정리"""
+        if self.pending_cancel_btn:
+            self.pending_cancel_btn.hide()
+            self.pending_cancel_btn.deleteLater()
+            self.pending_cancel_btn = None
+        self.pending_job = None
+        self.pending_text_box = None
+        self.pending_area = None
+        self.pending_clear = None
+        self.pending_entry = None
+        
     def cleanup_selection(self):
         """선택 모드 정리"""
         if self.rubber_band:
@@ -152,7 +268,6 @@ class TextRecognitionMode(BaseMode):
         self.selection_start = None
         self.selection_end = None
         self.processed_area = None
-        self.original_image = None
         
     def deactivate(self):
         self.cleanup_selection() 
@@ -9,14 +9,12 @@ class ViewMode(BaseMode):
     def activate(self):
         """View 모드 활성화"""
         # 모든 텍스트 박스에 View 모드 적용
-        for text_box in self.text_box_memory.get_text_boxes():
-            text_box.setViewMode(True)
+        self.canvas.text_layer.set_view_mode(True)
             
     def deactivate(self):
         """View 모드 비활성화"""
         # 모든 텍스트 박스의 View 모드 해제
-        for text_box in self.text_box_memory.get_text_boxes():
-            text_box.setViewMode(False)
+        self.canvas.text_layer.set_view_mode(False)
             
     def mouse_press_event(self, event):
         pass
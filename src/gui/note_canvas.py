@@ -1,18 +1,25 @@
 from PyQt5.QtWidgets import QWidget, QLineEdit, QRubberBand, QPushButton, QVBoxLayout, QHBoxLayout, QTextEdit, QLabel, QApplication
-from PyQt5.QtCore import Qt, QPoint, QRect, QSize
+from PyQt5.QtCore import Qt, QPoint, QRect, QSize, QTimer
 from PyQt5.QtGui import QPainter, QPen, QColor, QImage, QFont, QPixmap
 import os
 import uuid
-from PIL import Image
 
-from src.utils.text_processor import text_processor
-from src.utils.image_to_html_converter import ImageToHtmlConverter
 from src.gui.modes.text_mode import TextMode
 from src.gui.modes.draw_mode import DrawMode
 from src.gui.modes.resize_text_mode import ResizeTextMode
 from src.gui.modes.text_recognition_mode import TextRecognitionMode
 from src.gui.modes.view_mode import ViewMode
-from src.gui.custom_text_box import CustomTextBox
+from src.gui.text_box_layer import TextBoxLayer, TextBoxModel
+from src.gui.page_renderer import PageRenderer
+from src.gui.save_worker import NoteSaver
+from src.gui.note_file import NOTE_EXTENSION, NoteJournal
+from src.gui.stroke_model import STROKE_CLEAR, Stroke, StrokeDocument
+from src.gui.tiled_canvas import TiledCanvas
+from src.gui.undo_history import UndoHistory
+from src.gui.spatial_index import ObjectRegistry
+
+# 노트 문서 파일 자동 저장 간격
+AUTOSAVE_INTERVAL_MS = int(os.environ.get("MARKUPNOTE_AUTOSAVE_MS", "5000"))
 
 class NoteCanvas(QWidget):
     def __init__(self):
@@ -25,9 +32,16 @@ class NoteCanvas(QWidget):
         self.previous_mode = "text"  # 이전 모드 저장
         self.drawing = False
         self.last_point = None
-        self.text_boxes = []
-        self.image = QImage(self.size(), QImage.Format.Format_RGB32)
-        self.image.fill(Qt.GlobalColor.white)
+        self.text_boxes = ObjectRegistry()  # 캔버스의 모든 텍스트 박스 (공간 인덱스)
+        self.text_layer = TextBoxLayer(self, self.text_boxes)  # 텍스트 박스 그리기와 편집
+        self.strokes = StrokeDocument()  # 벡터 잉크 (원본)
+        self.ink = TiledCanvas()  # 획을 래스터화한 캐시 (타일 단위로 필요할 때 할당)
+        self.history = UndoHistory()  # 실행 취소/다시 실행 기록
+        self.saver = NoteSaver(self)  # 백그라운드 저장 큐
+        self.journal = None  # 노트 문서 파일(.mun) 기록기 (내용이 생기면 자동 저장 시 생성)
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.autosave_timer.start(AUTOSAVE_INTERVAL_MS)
         
         # 선택 모드 관련 변수
         self.selecting = False
@@ -37,7 +51,6 @@ class NoteCanvas(QWidget):
         self.buttons_widget = None
         self.selection_fixed = False
         self.processed_area = None  # 처리된 영역 저장
-        self.original_image = None  # 원본 이미지 저장
         self.markup_text_box = None  # 현재 처리 중인 텍스트 박스
         self.resizing_text_box = None  # 크기 조절 중인 텍스트 박스
         self.current_font_size = 12  # 기본 폰트 크기를 12pt로 설정
@@ -52,211 +65,76 @@ class NoteCanvas(QWidget):
         self.text_recognition_mode = TextRecognitionMode(self)
         self.view_mode = ViewMode(self)
         
+        # 텍스트 박스 저장소가 이 캔버스의 등록부를 사용하도록 연결
+        self.text_mode.text_box_memory.bind(self.text_boxes)
+        
         # 현재 모드 설정
         self.current_mode = self.text_mode
         
-    def resizeEvent(self, event):
-        """캔버스 크기 변경 이벤트 처리"""
-        if self.width() > 0 and self.height() > 0:
-            new_image = QImage(self.size(), QImage.Format.Format_RGB32)
-            new_image.fill(Qt.GlobalColor.white)
-            painter = QPainter(new_image)
-            painter.drawImage(0, 0, self.image)
-            self.image = new_image
+    def render_image(self):
+        """현재 보이는 영역의 잉크를 하나의 QImage로 합성 (호출할 때마다 새로 복사)
+        
+        잉크는 획(self.strokes)과 그 래스터 캐시(self.ink)에 저장됩니다.
+        """
+        return self.ink.copy(self.rect())
+        
+    def undo(self):
+        """마지막 동작 실행 취소"""
+        if self.current_mode is self.draw_mode:
+            self.draw_mode.finish_stroke()  # 그리는 중인 획 마무리
+        entry = self.history.undo()
+        if entry:
+            self.update()
+        return entry
+        
+    def redo(self):
+        """마지막으로 취소한 동작 다시 실행"""
+        entry = self.history.redo()
+        if entry:
+            self.update()
+        return entry
         
     def paintEvent(self, event):
         """페인트 이벤트 처리"""
         painter = QPainter(self)
-        # 배경 이미지 그리기
-        painter.drawImage(0, 0, self.image)
+        # 배경(잉크 타일) 중 노출된 영역만 그리기
+        self.ink.render(painter, event.rect())
+        
+        # 텍스트 박스와 핸들 오버레이
+        self.text_layer.paint(painter, event.rect())
         
         # HTMLMemo의 내용 그리기
         if hasattr(self, 'html_memo'):
             self.html_memo.draw(painter, self)
         
     def mousePressEvent(self, event):
-        """마우스 클릭 이벤트 처리"""
+        """마우스 클릭 이벤트 처리 (텍스트 박스 위 클릭은 텍스트 레이어가 우선 처리)"""
+        if self.text_layer.mouse_press_event(event):
+            return
         self.current_mode.mouse_press_event(event)
         
     def mouseMoveEvent(self, event):
         """마우스 이동 이벤트 처리"""
+        if self.text_layer.mouse_move_event(event):
+            return
         self.current_mode.mouse_move_event(event)
         
     def mouseReleaseEvent(self, event):
         """마우스 릴리즈 이벤트 처리"""
-        self.current_mode.mouse_release_event(event)
-
-    def process_selection(self, area):
-        """선택 영역 처리"""
-        if not self.selection_fixed:
+        if self.text_layer.mouse_release_event(event):
             return
-            
-        # 원본 이미지와 영역 저장
-        self.processed_area = area
-        self.original_image = self.image.copy()
-        
-        # 선택 영역의 이미지를 추출하고 처리
-        selected_image = self.image.copy(area)
-        
-        # 선택 영역을 회색조로 변환
-        painter = QPainter(self.image)
-        for y in range(area.top(), area.bottom() + 1):
-            for x in range(area.left(), area.right() + 1):
-                color = self.image.pixelColor(x, y)
-                gray = (color.red() + color.green() + color.blue()) // 3
-                painter.setPen(QColor(gray, gray, gray))
-                painter.drawPoint(x, y)
-
-        # QImage를 PIL Image로 변환
-        buffer = selected_image.bits().asarray(selected_image.byteCount())
-        pil_image = Image.frombytes('RGBA', (selected_image.width(), selected_image.height()), buffer, 'raw', 'BGRA')
+        self.current_mode.mouse_release_event(event)
         
-        # 텍스트 처리
-        text = text_processor.process_image(pil_image)
-        if text:
-            # 텍스트 박스 생성
-            self.markup_text_box = self.create_text_box(area.topLeft(), text)
-            self.markup_text_box.resize(area.width(), area.height())
-                
-        # 버튼 위젯 숨기기
-        if self.buttons_widget:
-            self.buttons_widget.hide()
-            
-        # 선택 영역 숨기기
-        if self.rubber_band:
-            self.rubber_band.hide()
-            
-        self.update()
-
-    def show_selection_buttons(self):
-        """선택 영역 버튼 표시"""
-        if not self.rubber_band or not self.selection_fixed:
+    def mouseDoubleClickEvent(self, event):
+        """더블 클릭 이벤트 처리 (View 모드의 태그 버튼 수정)"""
+        if self.text_layer.mouse_double_click_event(event):
             return
-            
-        if self.buttons_widget:
-            self.buttons_widget.hide()
-            self.buttons_widget.deleteLater()
-            
-        selection_area = self.rubber_band.geometry()
-        self.buttons_widget = QWidget(self)
-        layout = QHBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)  # 여백 제거
-        
-        process_btn = QPushButton("텍스트 변환")
-        cancel_btn = QPushButton("취소")
-        
-        process_btn.clicked.connect(lambda: self.process_selection(selection_area))
-        cancel_btn.clicked.connect(self.revert_changes)
-        
-        layout.addWidget(process_btn)
-        layout.addWidget(cancel_btn)
-        
-        # 버튼 스타일 설정
-        button_style = """
-            QPushButton {
-                padding: 5px 10px;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """
-        for btn in [process_btn, cancel_btn]:
-            btn.setStyleSheet(button_style)
-        
-        self.buttons_widget.setLayout(layout)
-        
-        # 버튼 위치 조정
-        button_pos = selection_area.bottomRight() + QPoint(10, 10)
-        self.buttons_widget.move(button_pos)
-        self.buttons_widget.show()
-
-    def show_text_control_buttons(self, area):
-        """텍스트 컨트롤 버튼 표시"""
-        if self.buttons_widget:
-            self.buttons_widget.hide()
-            self.buttons_widget.deleteLater()
-            
-        self.buttons_widget = QWidget(self)
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # 텍스트 크기 조절 버튼
-        size_layout = QHBoxLayout()
-        decrease_btn = QPushButton("-")
-        increase_btn = QPushButton("+")
-        size_label = QPushButton(f"{self.current_font_size}pt")
-        size_label.setEnabled(False)
-        
-        decrease_btn.setFixedSize(30, 30)
-        increase_btn.setFixedSize(30, 30)
-        size_label.setFixedWidth(50)
-        
-        decrease_btn.clicked.connect(self.decrease_font_size)
-        increase_btn.clicked.connect(self.increase_font_size)
-        
-        size_layout.addWidget(decrease_btn)
-        size_layout.addWidget(size_label)
-        size_layout.addWidget(increase_btn)
-        
-        # Commit/Revert 버튼
-        button_layout = QHBoxLayout()
-        commit_btn = QPushButton("Commit")
-        revert_btn = QPushButton("Revert")
-        
-        button_style = """
-            QPushButton {
-                padding: 5px 10px;
-                border: 1px solid #ccc;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """
-        for btn in [commit_btn, revert_btn, decrease_btn, increase_btn, size_label]:
-            btn.setStyleSheet(button_style)
-        
-        commit_btn.clicked.connect(self.commit_changes)
-        revert_btn.clicked.connect(self.revert_changes)
-        
-        button_layout.addWidget(commit_btn)
-        button_layout.addWidget(revert_btn)
-        
-        main_layout.addLayout(size_layout)
-        main_layout.addLayout(button_layout)
-        
-        self.buttons_widget.setLayout(main_layout)
-        button_pos = area.bottomRight() + QPoint(10, 10)
-        self.buttons_widget.move(button_pos)
-        self.buttons_widget.show()
+        super().mouseDoubleClickEvent(event)
 
-    def commit_changes(self):
-        """변경사항 확정"""
-        if self.markup_text_box:
-            self.text_boxes.append(self.markup_text_box)
-            self.markup_text_box = None
-            
-        # 회색 영역을 완전히 제거 (흰색이 아닌 투명하게)
-        if self.processed_area:
-            painter = QPainter(self.image)
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Clear)
-            painter.eraseRect(self.processed_area)
-            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
-            painter.fillRect(self.processed_area, Qt.GlobalColor.white)
-            
-        self.cleanup_selection()
-        self.mode = self.previous_mode  # 이전 모드로 복귀
-        self.update()
-        
     def revert_changes(self):
         """변경사항 취소"""
         if self.markup_text_box:
-            self.markup_text_box.hide()
-            self.markup_text_box.deleteLater()
+            self.text_layer.remove(self.markup_text_box)
             self.markup_text_box = None
             
         self.cleanup_selection()
@@ -276,85 +154,99 @@ class NoteCanvas(QWidget):
         self.selection_start = None
         self.selection_end = None
         self.processed_area = None
-        self.original_image = None
         
     def save_canvas(self):
-        """캔버스 저장"""
-        if not os.path.exists("saved_notes"):
-            os.makedirs("saved_notes")
-            
-        # UUID 생성
-        file_uuid = str(uuid.uuid4())
-        image_path = f"saved_notes/{file_uuid}.png"
-        html_path = f"saved_notes/{file_uuid}.html"
-            
-        # 현재 모드 저장
-        previous_mode = self.current_mode
-        
-        # 임시로 View 모드 적용
-        self.set_mode("view")
-        
-        # 텍스트 박스에 태그 추가
-        for text_box in self.text_boxes:
-            text_box.wrapTextWithTags()
-            
-        # text_box_memory의 텍스트 박스들도 처리
-        if hasattr(self.text_mode, 'text_box_memory'):
-            for text_box in self.text_mode.text_box_memory.get_text_boxes():
-                text_box.wrapTextWithTags()
-        
-        # 캔버스 내용 반영 기다리기
-        QApplication.processEvents()
-        # 현재 화면의 모든 내용을 이미지로 저장
-        pixmap = self.grab()
-        pixmap.save(image_path)
-        
-        # 텍스트 박스 원래대로 복원
-        for text_box in self.text_boxes:
-            text_box.restoreOriginalText()
-            
-        # text_box_memory의 텍스트 박스들도 복원
-        if hasattr(self.text_mode, 'text_box_memory'):
-            for text_box in self.text_mode.text_box_memory.get_text_boxes():
-                text_box.restoreOriginalText()
-        
-        # 이미지를 HTML로 변환
-        try:
-            converter = ImageToHtmlConverter()
-            html_content = converter.convert_to_html(image_path)
+        """캔버스 저장
+
+        GUI 스레드에서는 잉크와 텍스트 박스 스냅샷만 만들고, 이미지/HTML 변환과
+        파일 쓰기는 백그라운드 저장 작업에서 처리합니다. 저장할 때마다 새 파일에
+        쓰고 캔버스를 비우므로, 저장 중에 다시 저장한 노트는 합쳐지지 않고 순서대로
+        저장됩니다.
+
+        Returns:
+            int: 저장 작업 ID (건너뛴 경우 None)
+        """
+        # 빈 캔버스는 저장하지 않음 (저장 직후 캔버스를 비우므로 연속 클릭도 여기서 걸러짐)
+        if self.is_empty():
+            return None
+
+        # 노트 문서를 최종 상태의 스냅샷으로 정리하고, 내보내기 파일은 문서와 같은 이름으로 저장
+        self.autosave()
+        stem = f"saved_notes/{uuid.uuid4()}"
+        if self.journal is not None:
+            stem = os.path.splitext(self.journal.path)[0]
+            try:
+                self.journal.compact(self.strokes, self.document_boxes())
+            except OSError as e:
+                print(f"노트 문서 저장 중 오류 발생: {str(e)}")
+            self.journal = None
+        image_path = f"{stem}.png"
+        html_path = f"{stem}.html"
             
-            # HTML 파일 저장
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-        except Exception as e:
-            print(f"HTML 변환 중 오류 발생: {str(e)}")
-        
-        # 원래 모드로 복원
-        if previous_mode != self.view_mode:
-            if previous_mode == self.text_mode:
-                self.set_mode("text")
-            elif previous_mode == self.draw_mode:
-                self.set_mode("draw")
-            elif previous_mode == self.resize_text_mode:
-                self.set_mode("resize_text")
-            elif previous_mode == self.text_recognition_mode:
-                self.set_mode("text_recognition")
+        # 잉크와 텍스트 박스를 스냅샷해 화면 밖에서 렌더링 (모드 전환/위젯 변경 없음)
+        job_id = self.saver.save(PageRenderer.from_canvas(self), image_path, html_path)
                 
         # 캔버스 초기화
-        self.image.fill(Qt.GlobalColor.white)
+        self.strokes.clear()
+        self.ink.clear()
+        self.history.clear()
         
         # 텍스트 박스들 제거
-        for text_box in self.text_boxes[:]:
-            text_box.hide()
-            text_box.deleteLater()
-        self.text_boxes.clear()
-        
-        # text_box_memory의 텍스트 박스들도 제거
-        if hasattr(self.text_mode, 'text_box_memory'):
-            self.text_mode.text_box_memory.clear_all()
+        self.text_layer.clear()
         
         # 캔버스 업데이트
         self.update()
+        return job_id
+
+    def document_boxes(self):
+        """노트 문서에 기록할 (텍스트 박스, 편집기 내용을 반영한 박스) 목록"""
+        return [(text_box, self.text_layer.current(text_box)) for text_box in self.text_boxes]
+
+    def autosave(self):
+        """마지막 자동 저장 이후 바뀐 내용을 노트 문서 파일에 덧붙이기
+
+        문서 파일이 없으면 캔버스에 내용이 생겼을 때 saved_notes에 새로 만듭니다.
+        """
+        try:
+            if self.journal is None:
+                if not self.is_empty():
+                    self.journal = NoteJournal.create(f"saved_notes/{uuid.uuid4()}{NOTE_EXTENSION}",
+                                                      self.strokes, self.document_boxes())
+                return
+            self.journal.sync(self.strokes, self.document_boxes())
+            if self.journal.needs_compaction():
+                self.journal.compact(self.strokes, self.document_boxes())
+        except OSError as e:
+            print(f"자동 저장 중 오류 발생: {str(e)}")
+
+    def open_document(self, path):
+        """노트 문서 파일 열기 (현재 노트는 자동 저장 후 닫음)
+
+        Args:
+            path (str): .mun 파일 경로
+        """
+        # 현재 노트의 편집 내용을 먼저 기록하고 문서에서 분리한 뒤 읽어야
+        # 열려는 파일이 지금 편집 중인 문서여도 최신 내용을 불러옴
+        self.autosave()
+        previous, self.journal = self.journal, None
+        try:
+            journal, strokes, text_boxes = NoteJournal.load(path, self.strokes.background)
+        except (OSError, ValueError):
+            self.journal = previous  # 읽지 못하면 현재 노트를 계속 편집
+            raise
+        self.clear_canvas()
+
+        for stroke in strokes:
+            self.strokes.add(stroke)
+        self.strokes.rasterize(self.ink)
+        for text_box in text_boxes:
+            self.text_layer.add(text_box)
+        self.journal = journal
+        self.update()
+
+    def is_empty(self):
+        """획과 보이는 텍스트 박스가 없는지 여부"""
+        return len(self.strokes) == 0 and not any(text_box.isVisible() for text_box in self.text_boxes)
 
     def increase_font_size(self):
         """폰트 크기 증가"""
@@ -399,67 +291,37 @@ class NoteCanvas(QWidget):
         # 새로운 모드 활성화
         self.current_mode.activate()
         
-    def process_selection(self, area):
-        """선택 영역 처리"""
-        if not self.selection_fixed:
-            return
-            
-        # 원본 이미지와 영역 저장
-        self.processed_area = area
-        self.original_image = self.image.copy()
-        
-        # 선택 영역의 이미지를 추출하고 처리
-        selected_image = self.image.copy(area)
+    def erase_area(self, rect):
+        """사각형 영역의 잉크 지우기
         
-        # 선택 영역을 회색조로 변환
-        painter = QPainter(self.image)
-        for y in range(area.top(), area.bottom() + 1):
-            for x in range(area.left(), area.right() + 1):
-                color = self.image.pixelColor(x, y)
-                gray = (color.red() + color.green() + color.blue()) // 3
-                painter.setPen(QColor(gray, gray, gray))
-                painter.drawPoint(x, y)
-
-        # QImage를 PIL Image로 변환
-        buffer = selected_image.bits().asarray(selected_image.byteCount())
-        pil_image = Image.frombytes('RGBA', (selected_image.width(), selected_image.height()), buffer, 'raw', 'BGRA')
-        
-        # 텍스트 처리
-        text = text_processor.process_image(pil_image)
-        if text:
-            # 텍스트 박스 생성
-            self.markup_text_box = self.create_text_box(area.topLeft(), text)
-            self.markup_text_box.resize(area.width(), area.height())
-                
-        # 버튼 위젯 숨기기
-        if self.buttons_widget:
-            self.buttons_widget.hide()
-            
-        # 선택 영역 숨기기
-        if self.rubber_band:
-            self.rubber_band.hide()
+        Args:
+            rect (QRect): 지울 캔버스 좌표 영역
             
-        self.update()
-
+        Returns:
+            Stroke: 문서에 추가된 영역 지우기 획 (제거하면 복원됨)
+        """
+        rect = QRect(rect).normalized()
+        stroke = Stroke(STROKE_CLEAR, points=(rect.left(), rect.top(), rect.right() + 1, rect.bottom() + 1))
+        self.strokes.add(stroke)
+        self.ink.fill_rect(rect)
+        return stroke
+        
     def clear_canvas(self):
         """캔버스의 모든 내용을 초기화"""
-        # 이미지 초기화
-        self.image.fill(Qt.GlobalColor.white)
+        # 획과 잉크 타일 해제
+        self.strokes.clear()
+        self.ink.clear()
+        self.history.clear()
         
         # 텍스트 박스들 제거
-        for text_box in self.text_boxes[:]:
-            text_box.hide()
-            text_box.deleteLater()
-        self.text_boxes.clear()
+        self.text_layer.clear()
         
         # 캔버스 업데이트
         self.update()
 
     def create_text_box(self, pos, text=""):
         """텍스트 박스 생성"""
-        text_box = CustomTextBox(self)
+        text_box = TextBoxModel(pos)
         text_box.setPlainText(text)
-        text_box.move(pos)
-        text_box.show()
-        self.text_boxes.append(text_box)  # 텍스트 박스를 리스트에 추가
+        self.text_layer.add(text_box)  # 텍스트 박스를 등록부에 추가
         return text_box 
\ No newline at end of file
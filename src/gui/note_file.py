@@ -0,0 +1,295 @@
+import json
+import os
+import struct
+import time
+import zlib
+
+from PyQt5.QtCore import Qt
+
+from src.gui.stroke_model import Stroke, StrokeDocument
+from src.gui.text_box_layer import TextBoxModel
+from src.utils.atomic_file import atomic_write
+
+# 노트 문서 파일 확장자
+NOTE_EXTENSION = ".mun"
+
+_MAGIC = b"MUNJ"
+_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sH")
+_RECORD_HEADER = struct.Struct("<BII")  # 종류, 내용 길이, CRC32
+_ID = struct.Struct("<I")
+_ADD_STROKE = struct.Struct("<II")  # 획 ID, 삽입 위치
+_BATCH_ITEM = struct.Struct("<BI")  # 묶음 안 기록의 종류, 내용 길이
+
+# 기록 종류
+REC_SNAPSHOT = 1      # 문서 전체 (압축 시 파일의 첫 기록)
+REC_ADD_STROKE = 2    # 획 추가
+REC_REMOVE_STROKE = 3  # 획 삭제
+REC_BOX = 4           # 텍스트 박스 추가/변경 (전체 상태)
+REC_REMOVE_BOX = 5    # 텍스트 박스 삭제
+REC_META = 6          # 메타데이터
+REC_BATCH = 7         # sync() 한 번의 기록 묶음 (함께 적용되거나 함께 버려짐)
+
+# 스냅샷 뒤에 쌓인 기록이 이 크기와 스냅샷 크기를 모두 넘으면 압축
+COMPACT_MIN_BYTES = int(os.environ.get("MARKUPNOTE_JOURNAL_COMPACT_KB", "256")) * 1024
+
+class NoteJournal:
+    """추가 기록 방식의 노트 문서 파일 (.mun)
+
+    파일은 문서 전체 스냅샷 하나와 그 뒤에 이어 쓴 변경 기록으로 이루어집니다.
+    sync()는 마지막으로 기록한 상태와 비교해 바뀐 획과 텍스트 박스만 파일 끝에
+    덧붙이므로 자동 저장 비용이 문서 크기가 아니라 변경량에 비례합니다.
+    기록이 스냅샷보다 커지면 compact()로 새 스냅샷 하나로 다시 씁니다.
+    sync() 한 번의 변경은 CRC로 검사하는 기록 하나로 묶어 쓰므로, 쓰는 중에 종료되어
+    잘린 마지막 변경은 읽을 때 통째로 버려집니다.
+
+    Attributes:
+        path (str): 파일 경로
+        meta (dict): 제목, 생성/수정 시각 등 메타데이터
+        snapshot_bytes (int): 스냅샷 기록 크기
+        journal_bytes (int): 스냅샷 뒤에 쌓인 기록 크기
+    """
+
+    def __init__(self, path, meta=None):
+        self.path = path
+        self.meta = dict(meta or {})
+        self.snapshot_bytes = 0
+        self.journal_bytes = 0
+        self._length = 0  # 유효한 기록이 끝나는 위치 (이후는 잘린 기록)
+        self._next_id = 1
+        self._stroke_ids = {}  # id(획) -> 획 ID
+        self._strokes = {}  # 획 ID -> 획 (id() 재사용 방지를 위해 참조 유지)
+        self._box_ids = {}  # id(박스) -> 박스 ID
+        self._boxes = {}  # 박스 ID -> (박스, 마지막으로 기록한 상태)
+
+    # 만들기와 읽기
+
+    @classmethod
+    def create(cls, path, strokes, text_boxes, title=None):
+        """현재 문서로 새 파일 만들기
+
+        Args:
+            path (str): 파일 경로
+            strokes (StrokeDocument): 획 문서
+            text_boxes (iterable): (박스, 저장할 상태의 박스) 목록
+            title (str): 문서 제목 (None이면 파일 이름)
+
+        Returns:
+            NoteJournal: 파일과 동기화된 기록기
+        """
+        now = time.time()
+        title = title or os.path.splitext(os.path.basename(path))[0]
+        journal = cls(path, {"title": title, "created": now, "modified": now})
+        journal.compact(strokes, text_boxes)
+        return journal
+
+    @classmethod
+    def load(cls, path, background=Qt.GlobalColor.white):
+        """파일에서 문서 읽기
+
+        Args:
+            path (str): 파일 경로
+            background (QColor): 획 문서 배경색
+
+        Returns:
+            tuple: (NoteJournal, StrokeDocument, list[TextBoxModel])
+                기록기는 읽은 획/박스 객체와 동기화되어 이후 변경만 덧붙입니다.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _FILE_HEADER.size:
+            raise ValueError("노트 파일 형식이 올바르지 않습니다.")
+        magic, version = _FILE_HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("노트 파일 형식이 올바르지 않습니다.")
+
+        journal = cls(path)
+        strokes = {}  # 획 ID -> 획 (순서는 order)
+        order = []
+        boxes = {}  # 박스 ID -> 상태 (삽입 순서 유지)
+        offset = _FILE_HEADER.size
+        while offset + _RECORD_HEADER.size <= len(data):
+            kind, length, crc = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + _RECORD_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break  # 쓰는 중에 잘린 기록
+            offset = start + length
+
+            if kind == REC_SNAPSHOT:
+                (header_size,) = _ID.unpack_from(payload, 0)
+                header = json.loads(payload[_ID.size:_ID.size + header_size])
+                document = StrokeDocument.from_bytes(payload[_ID.size + header_size:])
+                order = list(header["strokes"])
+                strokes = dict(zip(order, document.strokes))
+                boxes = {box_id: state for box_id, state in header["boxes"]}
+                journal.meta = header["meta"]
+                journal._next_id = header["next_id"]
+                journal.snapshot_bytes = offset - _FILE_HEADER.size
+                journal.journal_bytes = 0
+                continue
+            journal.journal_bytes += _RECORD_HEADER.size + length
+            records = _unpack_batch(payload) if kind == REC_BATCH else [(kind, payload)]
+            for kind, payload in records:
+                record_id = 0
+                if kind == REC_ADD_STROKE:
+                    record_id, position = _ADD_STROKE.unpack_from(payload, 0)
+                    strokes[record_id], _ = Stroke.from_bytes(payload, _ADD_STROKE.size)
+                    order.insert(position, record_id)
+                elif kind == REC_REMOVE_STROKE:
+                    (record_id,) = _ID.unpack_from(payload, 0)
+                    if strokes.pop(record_id, None) is not None:
+                        order.remove(record_id)
+                elif kind == REC_BOX:
+                    record_id, state = json.loads(payload)
+                    boxes[record_id] = state
+                elif kind == REC_REMOVE_BOX:
+                    (record_id,) = _ID.unpack_from(payload, 0)
+                    boxes.pop(record_id, None)
+                elif kind == REC_META:
+                    journal.meta.update(json.loads(payload))
+                journal._next_id = max(journal._next_id, record_id + 1)
+        journal._length = offset
+
+        document = StrokeDocument(background)
+        for stroke_id in order:
+            stroke = strokes[stroke_id]
+            document.add(stroke)
+            journal._track_stroke(stroke_id, stroke)
+        models = []
+        for box_id, state in boxes.items():
+            model = TextBoxModel.from_state(state)
+            journal._box_ids[id(model)] = box_id
+            journal._boxes[box_id] = (model, state)
+            models.append(model)
+        return journal, document, models
+
+    # 쓰기
+
+    def sync(self, strokes, text_boxes):
+        """마지막 기록 이후 바뀐 내용만 파일 끝에 덧붙이기
+
+        Args:
+            strokes (StrokeDocument): 획 문서
+            text_boxes (iterable): (박스, 저장할 상태의 박스) 목록
+                편집 중인 박스는 편집기 내용을 반영한 사본을 함께 전달합니다.
+
+        Returns:
+            int: 덧붙인 바이트 수 (바뀐 것이 없으면 0)
+        """
+        records = []
+
+        # 획: 삭제를 먼저 기록한 뒤 최종 위치 순서로 추가를 기록
+        current = {id(stroke) for stroke in strokes}
+        for stroke_id in [sid for key, sid in self._stroke_ids.items() if key not in current]:
+            stroke = self._strokes.pop(stroke_id)
+            del self._stroke_ids[id(stroke)]
+            records.append((REC_REMOVE_STROKE, _ID.pack(stroke_id)))
+        for position, stroke in enumerate(strokes):
+            if id(stroke) not in self._stroke_ids:
+                stroke_id = self._new_id()
+                self._track_stroke(stroke_id, stroke)
+                records.append((REC_ADD_STROKE, _ADD_STROKE.pack(stroke_id, position) + stroke.to_bytes()))
+
+        # 텍스트 박스: 상태가 바뀐 박스만 전체 상태로 기록
+        seen = set()
+        for model, current_model in text_boxes:
+            box_id = self._box_ids.get(id(model))
+            if box_id is None:
+                box_id = self._new_id()
+                self._box_ids[id(model)] = box_id
+                last_state = None
+            else:
+                last_state = self._boxes[box_id][1]
+            seen.add(box_id)
+            state = current_model.state()
+            if state != last_state:
+                self._boxes[box_id] = (model, state)
+                records.append((REC_BOX, json.dumps([box_id, state], ensure_ascii=False).encode("utf-8")))
+        for box_id in [box_id for box_id in self._boxes if box_id not in seen]:
+            model, _ = self._boxes.pop(box_id)
+            del self._box_ids[id(model)]
+            records.append((REC_REMOVE_BOX, _ID.pack(box_id)))
+
+        if not records:
+            return 0
+        self.meta["modified"] = time.time()
+        records.append((REC_META, json.dumps({"modified": self.meta["modified"]}).encode("utf-8")))
+        batch = b"".join(_BATCH_ITEM.pack(kind, len(payload)) + payload for kind, payload in records)
+        data = _pack_record(REC_BATCH, batch)
+        self._append(data)
+        self.journal_bytes += len(data)
+        return len(data)
+
+    def needs_compaction(self):
+        """스냅샷 뒤의 기록이 충분히 커져 다시 쓸 때가 되었는지 여부"""
+        return self.journal_bytes > max(COMPACT_MIN_BYTES, self.snapshot_bytes)
+
+    def compact(self, strokes, text_boxes):
+        """현재 문서를 스냅샷 하나로 다시 쓰기 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            strokes (StrokeDocument): 획 문서
+            text_boxes (iterable): (박스, 저장할 상태의 박스) 목록
+        """
+        self._stroke_ids.clear()
+        self._strokes.clear()
+        stroke_ids = []
+        for stroke in strokes:
+            stroke_id = self._new_id()
+            self._track_stroke(stroke_id, stroke)
+            stroke_ids.append(stroke_id)
+
+        boxes = []
+        known = self._box_ids
+        self._box_ids = {}
+        self._boxes = {}
+        for model, current_model in text_boxes:
+            box_id = known.get(id(model)) or self._new_id()
+            state = current_model.state()
+            self._box_ids[id(model)] = box_id
+            self._boxes[box_id] = (model, state)
+            boxes.append([box_id, state])
+
+        self.meta["modified"] = time.time()
+        header = json.dumps({"meta": self.meta, "next_id": self._next_id, "strokes": stroke_ids, "boxes": boxes},
+                            ensure_ascii=False).encode("utf-8")
+        payload = _ID.pack(len(header)) + header + strokes.to_bytes()
+        record = _pack_record(REC_SNAPSHOT, payload)
+        atomic_write(self.path, _FILE_HEADER.pack(_MAGIC, _VERSION) + record)
+        self._length = _FILE_HEADER.size + len(record)
+        self.snapshot_bytes = len(record)
+        self.journal_bytes = 0
+
+    def _append(self, data):
+        with open(self.path, "r+b") as f:
+            # 잘린 기록이 남아 있으면 그 위에 덮어씀
+            f.seek(self._length)
+            f.truncate()
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._length += len(data)
+
+    def _new_id(self):
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
+
+    def _track_stroke(self, stroke_id, stroke):
+        self._stroke_ids[id(stroke)] = stroke_id
+        self._strokes[stroke_id] = stroke
+
+def _pack_record(kind, payload):
+    return _RECORD_HEADER.pack(kind, len(payload), zlib.crc32(payload)) + payload
+
+def _unpack_batch(payload):
+    """기록 묶음을 (종류, 내용) 목록으로 나누기"""
+    records = []
+    offset = 0
+    while offset < len(payload):
+        kind, length = _BATCH_ITEM.unpack_from(payload, offset)
+        offset += _BATCH_ITEM.size
+        records.append((kind, payload[offset:offset + length]))
+        offset += length
+    return records
@@ -0,0 +1,76 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from src.utils.text_processor import OCR_ERROR_PREFIX, text_processor
+
+class OcrJobSignals(QObject):
+    """OCR 작업 결과 시그널
+
+    QRunnable은 QObject가 아니므로 시그널을 별도 객체로 분리합니다.
+    GUI 스레드에서 생성되므로 연결된 슬롯은 GUI 스레드에서 호출됩니다.
+    """
+    finished = pyqtSignal(int, object)  # 작업 ID, 인식된 텍스트
+    failed = pyqtSignal(int, str)  # 작업 ID, 오류 메시지
+    done = pyqtSignal()  # 취소 여부와 관계없이 실행이 끝나면 발생
+
+class OcrJob(QRunnable):
+    """백그라운드 스레드에서 이미지 한 장을 인식하는 작업
+
+    취소된 작업은 실행 전이면 건너뛰고, 실행 중이면 결과를 전달하지 않습니다.
+    스레드 풀이 작업을 삭제하지 않으므로 실행이 끝날 때까지 클래스 쪽에서 참조를 보관합니다.
+
+    Attributes:
+        job_id (int): 작업 식별자
+        image (PIL.Image): 인식할 이미지
+        signals (OcrJobSignals): 결과 시그널
+    """
+
+    # 스레드 풀에 넘겼지만 아직 실행이 끝나지 않은 작업
+    # (취소한 쪽이 참조를 놓아도 실행 중에 해제되지 않도록 보관)
+    _active = set()
+
+    def __init__(self, job_id, image):
+        super().__init__()
+        # 완료 후에도 취소(tryTake)할 수 있도록 스레드 풀이 삭제하지 않게 함 (파이썬 쪽 참조가 수명을 관리)
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.image = image
+        self.signals = OcrJobSignals()
+        self.signals.done.connect(self._release)  # GUI 스레드에서 참조 해제
+        self.cancelled = False
+
+    def start(self, thread_pool):
+        """스레드 풀에서 실행 시작"""
+        OcrJob._active.add(self)
+        thread_pool.start(self)
+
+    def cancel(self, thread_pool=None):
+        """작업 취소 (아직 시작 전이면 스레드 풀 큐에서 제거)"""
+        self.cancelled = True
+        if thread_pool is not None and thread_pool.tryTake(self):
+            self._release()
+
+    def _release(self):
+        OcrJob._active.discard(self)
+
+    def run(self):
+        try:
+            self._recognize()
+        finally:
+            self.signals.done.emit()
+
+    def _recognize(self):
+        if self.cancelled:
+            return
+        try:
+            text = text_processor.process_image(self.image)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(self.job_id, str(e))
+            return
+        if self.cancelled:
+            return
+        if isinstance(text, str) and text.startswith(OCR_ERROR_PREFIX):
+            # 처리기가 오류 메시지로 알린 실패는 결과 대신 실패로 전달
+            self.signals.failed.emit(self.job_id, text[len(OCR_ERROR_PREFIX):])
+        else:
+            self.signals.finished.emit(self.job_id, text)
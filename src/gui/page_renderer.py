@@ -0,0 +1,104 @@
+import math
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QImage, QPainter
+
+from src.gui.stroke_model import Stroke, StrokeDocument
+
+# 캔버스 좌표 1px에 해당하는 해상도
+BASE_DPI = 96
+
+# 1인치 = 0.0254m (QImage 해상도는 미터당 점 수로 저장)
+_INCHES_PER_METER = 1 / 0.0254
+
+class PageRenderer:
+    """잉크와 텍스트 박스를 화면과 별개로 QImage에 그리는 렌더러
+
+    생성 시점의 잉크 타일, 획, 텍스트 박스를 사본으로 가지고 있으므로
+    렌더링 중에 위젯을 건드리거나 모드를 바꾸지 않고, 이후 사용자가 계속
+    편집해도 결과가 바뀌지 않습니다. 잉크 타일은 암시적 공유로 복사되어
+    스냅샷 비용이 거의 없습니다.
+
+    Attributes:
+        ink (TiledCanvas): 잉크 타일 사본
+        strokes (StrokeDocument): 획 사본 (배율 렌더링용)
+        text_boxes (list[TextBoxModel]): 텍스트 박스 사본
+        page_rect (QRect): 기본 렌더링 영역 (캔버스 좌표)
+    """
+
+    def __init__(self, ink, strokes, text_boxes, page_rect):
+        self.ink = ink
+        self.strokes = strokes
+        self.text_boxes = list(text_boxes)
+        self.page_rect = QRect(page_rect)
+
+    @classmethod
+    def from_canvas(cls, canvas, page_rect=None):
+        """노트 캔버스의 현재 상태로 렌더러 생성
+
+        Args:
+            canvas (NoteCanvas): 노트 캔버스
+            page_rect (QRect): 렌더링 영역 (None이면 캔버스 위젯 영역)
+
+        Returns:
+            PageRenderer: 스냅샷을 가진 렌더러
+        """
+        strokes = StrokeDocument(canvas.strokes.background)
+        for stroke in canvas.strokes:
+            strokes.add(Stroke(stroke.kind, stroke.color, stroke.width, stroke.points))
+        return cls(canvas.ink.clone(), strokes, canvas.text_layer.snapshot(),
+                   canvas.rect() if page_rect is None else page_rect)
+
+    def render(self, dpi=BASE_DPI, rect=None, wrap_tags=True):
+        """페이지를 새 이미지로 렌더링
+
+        기본 해상도에서는 잉크 타일을 그대로 복사하고, 그 밖의 해상도에서는
+        획을 벡터로 다시 그려 선명하게 출력합니다.
+
+        Args:
+            dpi (float): 출력 해상도 (BASE_DPI이면 캔버스와 같은 크기)
+            rect (QRect): 렌더링할 캔버스 좌표 영역 (None이면 page_rect)
+            wrap_tags (bool): 텍스트를 태그 버튼 텍스트로 감싸 그릴지 여부 (저장 이미지 형식)
+
+        Returns:
+            QImage: RGB32 이미지
+        """
+        rect = QRect(self.page_rect if rect is None else rect).normalized()
+        scale = dpi / BASE_DPI
+        image = QImage(max(1, math.ceil(rect.width() * scale)), max(1, math.ceil(rect.height() * scale)),
+                       QImage.Format.Format_RGB32)
+        dots_per_meter = round(dpi * _INCHES_PER_METER)
+        image.setDotsPerMeterX(dots_per_meter)
+        image.setDotsPerMeterY(dots_per_meter)
+        image.fill(self.ink.background)
+
+        painter = QPainter(image)
+        painter.scale(scale, scale)
+        painter.translate(-rect.x(), -rect.y())
+        painter.setClipRect(rect)
+        if scale == 1.0:
+            self.ink.render(painter, rect)
+        else:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            self.strokes.render(painter, rect)
+        for text_box in self.text_boxes:
+            if text_box.isVisible() and text_box.geometry().intersects(rect):
+                document = text_box.build_document(text_box.tagged_text()) if wrap_tags else None
+                text_box.paint(painter, document)
+        painter.end()
+        return image
+
+    def save(self, path, dpi=BASE_DPI, rect=None, wrap_tags=True):
+        """페이지를 렌더링해 파일로 저장
+
+        Args:
+            path (str): 저장 경로 (형식은 확장자로 결정)
+            dpi (float): 출력 해상도
+            rect (QRect): 렌더링할 캔버스 좌표 영역
+            wrap_tags (bool): 텍스트를 태그로 감싸 그릴지 여부
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        return self.render(dpi, rect, wrap_tags).save(path)
@@ -0,0 +1,141 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal
+
+from src.gui.html_exporter import NoteHtmlExporter, image_to_png
+from src.utils.atomic_file import atomic_write
+
+class SaveJobSignals(QObject):
+    """SaveJob이 저장 스레드에서 보내는 단계별 진행률과 결과
+
+    모든 시그널의 첫 인자는 작업 ID이며, NoteSaver가 받아 실행 중인 작업을
+    정리하고 다음 작업을 시작합니다. finished와 failed 중 하나만 발생합니다.
+    """
+    progress = pyqtSignal(int, int, str)  # 작업 ID, 진행률(%), 단계
+    finished = pyqtSignal(int, object)  # 작업 ID, 저장한 파일 경로 목록
+    failed = pyqtSignal(int, str)  # 작업 ID, 오류 메시지
+
+class SaveJob(QRunnable):
+    """백그라운드 스레드에서 스냅샷을 PNG/HTML로 변환해 저장하는 작업
+
+    GUI 스레드에서 만든 PageRenderer 스냅샷만 사용하므로 위젯에 접근하지 않습니다.
+    각 파일은 임시 파일에 쓴 뒤 교체하여, 중간에 종료되어도 반쯤 쓰인 파일이 남지 않습니다.
+
+    Attributes:
+        job_id (int): 작업 식별자
+        renderer (PageRenderer): 저장할 페이지 스냅샷
+        image_path (str): PNG 저장 경로
+        html_path (str): HTML 저장 경로 (None이면 생략)
+        signals (SaveJobSignals): 진행/결과 시그널
+    """
+
+    def __init__(self, job_id, renderer, image_path, html_path=None):
+        super().__init__()
+        self.job_id = job_id
+        self.renderer = renderer
+        self.image_path = image_path
+        self.html_path = html_path
+        self.signals = SaveJobSignals()
+
+    def run(self):
+        try:
+            self.signals.progress.emit(self.job_id, 0, "이미지 렌더링")
+            png = image_to_png(self.renderer.render())
+            html_content = None
+            if self.html_path:
+                self.signals.progress.emit(self.job_id, 40, "HTML 생성")
+                renderer = self.renderer
+                html_content = NoteHtmlExporter().export(renderer.text_boxes, renderer.ink, renderer.strokes)
+            self.signals.progress.emit(self.job_id, 80, "파일 쓰기")
+            atomic_write(self.image_path, png)
+            paths = [self.image_path]
+            if html_content is not None:
+                atomic_write(self.html_path, html_content)
+                paths.append(self.html_path)
+        except Exception as e:
+            self.signals.failed.emit(self.job_id, str(e))
+            return
+        self.signals.progress.emit(self.job_id, 100, "저장 완료")
+        self.signals.finished.emit(self.job_id, paths)
+
+class NoteSaver(QObject):
+    """저장 작업을 한 번에 하나씩 백그라운드에서 실행하는 큐
+
+    요청은 들어온 순서대로 실행됩니다. 아직 시작하지 않은 요청과 같은 대상(key)으로
+    다시 저장하면 그 요청을 최신 스냅샷으로 바꾸므로, 같은 파일을 여러 번 덮어쓰는
+    호출자는 마지막 상태만 한 번 씁니다. 대상이 다른 요청은 합쳐지지 않습니다.
+
+    Attributes:
+        thread_pool (QThreadPool): 저장 전용 스레드 풀 (스레드 1개)
+        running (SaveJob): 실행 중인 작업
+        pending (OrderedDict): 대상 key -> 기다리는 SaveJob
+    """
+    progress = pyqtSignal(int, str)  # 진행률(%), 단계
+    saved = pyqtSignal(object)  # 저장한 파일 경로 목록
+    failed = pyqtSignal(str)  # 오류 메시지
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.next_job_id = 0
+        self.running = None
+        self.pending = OrderedDict()
+
+    def save(self, renderer, image_path, html_path=None, key=None):
+        """저장 요청 (즉시 반환)
+
+        Args:
+            renderer (PageRenderer): 저장할 페이지 스냅샷
+            image_path (str): PNG 저장 경로
+            html_path (str): HTML 저장 경로
+            key (str): 기다리는 요청과 합칠 대상 식별자 (None이면 image_path)
+
+        Returns:
+            int: 작업 ID
+        """
+        self.next_job_id += 1
+        job = SaveJob(self.next_job_id, renderer, image_path, html_path)
+        job.signals.progress.connect(self.on_job_progress)
+        job.signals.finished.connect(self.on_job_finished)
+        job.signals.failed.connect(self.on_job_failed)
+        # 같은 대상의 기다리던 요청은 최신 스냅샷으로 교체
+        self.pending[image_path if key is None else key] = job
+        self.start_next()
+        return job.job_id
+
+    def is_busy(self):
+        """실행 중이거나 기다리는 작업이 있는지 여부"""
+        return self.running is not None or bool(self.pending)
+
+    def start_next(self):
+        """실행 중인 작업이 없으면 가장 오래 기다린 작업 시작"""
+        if self.running is not None or not self.pending:
+            return
+        _, job = self.pending.popitem(last=False)
+        self.running = job
+        self.thread_pool.start(job)
+
+    def wait(self):
+        """모든 저장 작업이 끝날 때까지 대기 (종료 시 사용)"""
+        while self.is_busy():
+            self.thread_pool.waitForDone()
+            # 완료 시그널을 처리해 다음 작업 시작
+            QCoreApplication.sendPostedEvents()
+            if self.running is not None and self.thread_pool.activeThreadCount() == 0:
+                # 완료 시그널이 전달되지 않은 경우에도 멈추지 않도록 다음 작업으로 진행
+                self.running = None
+                self.start_next()
+
+    def on_job_progress(self, job_id, percent, stage):
+        self.progress.emit(percent, stage)
+
+    def on_job_finished(self, job_id, paths):
+        self.running = None
+        self.saved.emit(paths)
+        self.start_next()
+
+    def on_job_failed(self, job_id, message):
+        self.running = None
+        self.failed.emit(message)
+        self.start_next()
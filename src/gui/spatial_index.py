@@ -0,0 +1,169 @@
+from PyQt5.QtCore import QPoint, QRect
+
+# 격자 한 칸의 픽셀 수 (잉크 타일과 같은 크기)
+CELL_SIZE = 256
+
+class SpatialIndex:
+    """캔버스 객체의 경계 영역을 균일 격자로 색인하는 공간 인덱스
+
+    객체는 자신의 경계 영역이 걸친 격자 칸마다 등록되므로 점/영역 조회는
+    해당 칸의 객체만 검사합니다. 삭제와 갱신은 객체가 걸친 칸 수에만 비례합니다.
+    조회 결과는 등록 순서(그려지는 순서, 아래에서 위로)로 정렬됩니다.
+
+    Attributes:
+        cell_size (int): 격자 한 칸의 픽셀 수
+    """
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}  # (칸 x, 칸 y) -> {객체: None}
+        self._rects = {}  # 객체 -> QRect
+        self._order = {}  # 객체 -> 정렬 순서
+        self._next_order = 0
+
+    def __len__(self):
+        return len(self._rects)
+
+    def __contains__(self, key):
+        return key in self._rects
+
+    def __iter__(self):
+        return iter(sorted(self._rects, key=self._order.__getitem__))
+
+    def _cell_keys(self, rect):
+        if rect.isEmpty():
+            return []
+        size = self.cell_size
+        return [
+            (cx, cy)
+            for cy in range(rect.top() // size, rect.bottom() // size + 1)
+            for cx in range(rect.left() // size, rect.right() // size + 1)
+        ]
+
+    def insert(self, key, rect, order=None):
+        """객체 등록 (이미 있으면 영역만 갱신)
+
+        Args:
+            key: 해시 가능한 객체
+            rect (QRect): 캔버스 좌표 경계 영역
+            order (float): 정렬 순서 (None이면 맨 위)
+        """
+        if key in self._rects:
+            self.update(key, rect)
+            return
+        if order is None:
+            order = self._next_order
+        self._next_order = max(self._next_order, order) + 1
+        rect = QRect(rect).normalized()
+        self._rects[key] = rect
+        self._order[key] = order
+        for cell in self._cell_keys(rect):
+            self._cells.setdefault(cell, {})[key] = None
+
+    def update(self, key, rect):
+        """이동/크기 변경된 객체의 영역 갱신 (바뀐 칸만 수정)"""
+        old = self._rects.get(key)
+        if old is None:
+            self.insert(key, rect)
+            return
+        rect = QRect(rect).normalized()
+        self._rects[key] = rect
+        old_cells = set(self._cell_keys(old))
+        new_cells = set(self._cell_keys(rect))
+        for cell in old_cells - new_cells:
+            self._remove_from_cell(cell, key)
+        for cell in new_cells - old_cells:
+            self._cells.setdefault(cell, {})[key] = None
+
+    def remove(self, key):
+        """객체 삭제 (없으면 KeyError)"""
+        rect = self._rects.pop(key)
+        del self._order[key]
+        for cell in self._cell_keys(rect):
+            self._remove_from_cell(cell, key)
+
+    def discard(self, key):
+        """객체 삭제 (없으면 무시)"""
+        if key in self._rects:
+            self.remove(key)
+
+    def _remove_from_cell(self, cell, key):
+        members = self._cells.get(cell)
+        if members is not None:
+            members.pop(key, None)
+            if not members:
+                del self._cells[cell]
+
+    def rect(self, key):
+        """등록된 경계 영역"""
+        return self._rects[key]
+
+    def order(self, key):
+        """정렬 순서"""
+        return self._order[key]
+
+    def query_rect(self, rect):
+        """영역과 겹치는 객체 목록
+
+        Args:
+            rect (QRect): 캔버스 좌표 영역
+
+        Returns:
+            list: 등록 순서(아래에서 위로)로 정렬된 객체
+        """
+        rect = QRect(rect).normalized()
+        found = {}
+        for cell in self._cell_keys(rect):
+            for key in self._cells.get(cell, ()):
+                if key not in found and self._rects[key].intersects(rect):
+                    found[key] = None
+        return sorted(found, key=self._order.__getitem__)
+
+    def query_point(self, point):
+        """점을 포함하는 객체 목록
+
+        Args:
+            point (QPoint): 캔버스 좌표
+
+        Returns:
+            list: 등록 순서(아래에서 위로)로 정렬된 객체
+        """
+        size = self.cell_size
+        members = self._cells.get((point.x() // size, point.y() // size), ())
+        found = [key for key in members if self._rects[key].contains(point)]
+        return sorted(found, key=self._order.__getitem__)
+
+    def clear(self):
+        """모든 객체 삭제"""
+        self._cells.clear()
+        self._rects.clear()
+        self._order.clear()
+        self._next_order = 0
+
+class ObjectRegistry(SpatialIndex):
+    """geometry()를 가진 캔버스 위젯(텍스트 박스 등)의 등록부
+
+    위젯 목록과 공간 인덱스를 하나로 합친 것으로, 위젯은 이동/크기 변경 시
+    refresh()로 자신의 영역을 갱신합니다.
+    """
+
+    def add(self, obj):
+        """위젯 등록 (이미 있으면 영역만 갱신)"""
+        self.insert(obj, obj.geometry())
+
+    def refresh(self, obj):
+        """위젯의 현재 geometry()로 영역 갱신 (등록되지 않았으면 무시)"""
+        if obj in self:
+            self.update(obj, obj.geometry())
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def object_at(self, point):
+        """점 위의 가장 위에 있는 위젯 (없으면 None)"""
+        found = self.query_point(QPoint(point))
+        return found[-1] if found else None
+
+    def objects_in(self, rect):
+        """영역과 겹치는 위젯 목록 (아래에서 위로)"""
+        return self.query_rect(rect)
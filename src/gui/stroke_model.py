@@ -0,0 +1,379 @@
+import math
+import struct
+from array import array
+
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF, QRect, QRectF
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
+
+from .spatial_index import SpatialIndex
+
+# 획 종류
+STROKE_PEN = 0      # 펜으로 그린 잉크
+STROKE_ERASER = 1   # 배경색으로 칠하는 지우개 궤적
+STROKE_CLEAR = 2    # 사각형 영역 지우기 (points는 왼쪽 위, 오른쪽 아래 두 점)
+
+# 직렬화 형식
+_MAGIC = b"MUNS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_STROKE_HEADER = struct.Struct("<BIfI")
+
+def simplify_points(points, tolerance):
+    """Ramer–Douglas–Peucker 알고리즘으로 점 줄이기
+
+    양 끝점을 잇는 선분에서 tolerance 이상 떨어진 점만 남기며, 재귀 대신
+    스택을 사용하고 구간별 거리 계산은 벡터 연산으로 처리합니다.
+
+    Args:
+        points (numpy.ndarray): (N, 2) 좌표 배열
+        tolerance (float): 허용 오차(px)
+
+    Returns:
+        numpy.ndarray: 남은 점의 (M, 2) 좌표 배열 (M <= N, 양 끝점은 항상 유지)
+    """
+    count = len(points)
+    if count < 3 or tolerance <= 0:
+        return points
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        origin = points[start]
+        direction = points[end] - origin
+        inner = points[start + 1:end] - origin
+        length = math.hypot(direction[0], direction[1])
+        if length == 0:
+            distances = np.hypot(inner[:, 0], inner[:, 1])
+        else:
+            distances = np.abs(direction[0] * inner[:, 1] - direction[1] * inner[:, 0]) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            index = start + 1 + farthest
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return points[keep]
+
+class Stroke:
+    """펜 속성과 점 좌표 배열로 이루어진 획
+
+    점은 array('f')에 x, y 순서로 연속 저장되므로 점 하나에 8바이트만 사용합니다.
+
+    Attributes:
+        kind (int): 획 종류 (STROKE_PEN, STROKE_ERASER, STROKE_CLEAR)
+        color (int): 0xAARRGGBB 색상
+        width (float): 펜 두께(px)
+        points (array.array): x0, y0, x1, y1, ... 좌표
+    """
+
+    __slots__ = ("kind", "color", "width", "points")
+
+    def __init__(self, kind=STROKE_PEN, color=0xFF000000, width=2.0, points=()):
+        self.kind = kind
+        self.color = color
+        self.width = float(width)
+        self.points = array("f", points)
+
+    def __len__(self):
+        return len(self.points) // 2
+
+    def add_point(self, x, y):
+        """점 추가"""
+        self.points.append(x)
+        self.points.append(y)
+
+    def point_array(self):
+        """점 좌표의 (N, 2) float32 배열
+
+        points를 복사 없이 감싼 뷰이므로, 뷰를 가지고 있는 동안에는 점을 추가할 수 없습니다.
+
+        Returns:
+            numpy.ndarray: 점 좌표
+        """
+        if not self.points:
+            return np.empty((0, 2), dtype=np.float32)
+        return np.frombuffer(self.points, dtype=np.float32).reshape(-1, 2)
+
+    def simplify(self, tolerance):
+        """허용 오차 안에서 점 수 줄이기 (영역 지우기 획은 그대로)
+
+        Args:
+            tolerance (float): 허용 오차(px)
+        """
+        if self.kind == STROKE_CLEAR:
+            return
+        simplified = simplify_points(self.point_array(), tolerance)
+        points = array("f")
+        points.frombytes(np.ascontiguousarray(simplified, dtype=np.float32).tobytes())
+        self.points = points
+
+    def bounds(self):
+        """펜 두께와 안티앨리어싱 여유를 포함한 경계 영역
+
+        Returns:
+            QRect: 캔버스 좌표 영역 (점이 없으면 빈 QRect)
+        """
+        if not self.points:
+            return QRect()
+        xs = self.points[0::2]
+        ys = self.points[1::2]
+        margin = 0 if self.kind == STROKE_CLEAR else self.width / 2 + 2
+        left = math.floor(min(xs) - margin)
+        top = math.floor(min(ys) - margin)
+        right = math.ceil(max(xs) + margin)
+        bottom = math.ceil(max(ys) + margin)
+        return QRect(left, top, right - left, bottom - top)
+
+    def pen(self, background=Qt.GlobalColor.white):
+        """획을 그릴 QPen
+
+        Args:
+            background (QColor): 지우개 획에 사용할 배경색
+
+        Returns:
+            QPen: 펜
+        """
+        if self.kind == STROKE_ERASER:
+            return QPen(QColor(background), self.width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+        return QPen(QColor.fromRgba(self.color), self.width, Qt.PenStyle.SolidLine)
+
+    def render(self, painter, background=Qt.GlobalColor.white):
+        """획 그리기
+
+        Args:
+            painter (QPainter): 대상 페인터 (좌표 변환은 호출자가 설정)
+            background (QColor): 지우개/영역 지우기에 사용할 배경색
+        """
+        if self.kind == STROKE_CLEAR:
+            x0, y0, x1, y1 = self.points[:4]
+            painter.fillRect(QRectF(x0, y0, x1 - x0, y1 - y0), QColor(background))
+            return
+        if len(self) < 2:
+            return
+        painter.setPen(self.pen(background))
+        points = self.points
+        painter.drawPolyline(QPolygonF([QPointF(points[i], points[i + 1]) for i in range(0, len(points), 2)]))
+
+    def to_bytes(self):
+        """획 하나를 바이너리로 직렬화 (종류, 색, 두께, 점 수, float32 좌표)"""
+        return (_STROKE_HEADER.pack(self.kind, self.color, self.width, len(self))
+                + self.point_array().astype("<f4", copy=False).tobytes())
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """to_bytes()로 만든 바이너리에서 획 복원
+
+        Args:
+            data (bytes): 직렬화된 데이터
+            offset (int): 획이 시작하는 위치
+
+        Returns:
+            tuple: (Stroke, 다음 획이 시작하는 위치)
+        """
+        kind, color, width, num_points = _STROKE_HEADER.unpack_from(data, offset)
+        offset += _STROKE_HEADER.size
+        coords = np.frombuffer(data, dtype="<f4", count=num_points * 2, offset=offset)
+        stroke = cls(kind, color, width)
+        stroke.points.frombytes(coords.astype(np.float32, copy=False).tobytes())
+        return stroke, offset + coords.nbytes
+
+    def distance_to(self, x, y):
+        """점에서 획의 선분들까지의 최단 거리
+
+        Args:
+            x (float): x 좌표
+            y (float): y 좌표
+
+        Returns:
+            float: 거리 (점이 없으면 inf)
+        """
+        points = self.point_array()
+        if len(points) == 0:
+            return math.inf
+        if len(points) == 1:
+            return float(np.hypot(points[0, 0] - x, points[0, 1] - y))
+        start = points[:-1]
+        segment = points[1:] - start
+        length_sq = np.maximum((segment ** 2).sum(axis=1), 1e-12)
+        t = np.clip(((np.array([x, y], dtype=np.float32) - start) * segment).sum(axis=1) / length_sq, 0, 1)
+        nearest = start + segment * t[:, np.newaxis]
+        return float(np.hypot(nearest[:, 0] - x, nearest[:, 1] - y).min())
+
+class StrokeDocument:
+    """캔버스의 벡터 잉크 문서
+
+    획 목록이 원본이며, 잉크 타일(TiledCanvas)은 여기서 파생된 래스터 캐시입니다.
+    획 단위 삭제, 임의 배율 렌더링, 압축된 바이너리 직렬화를 지원합니다.
+    영역/점 조회는 획 경계 영역의 공간 인덱스를 사용합니다.
+
+    Attributes:
+        strokes (list[Stroke]): 그려진 순서대로의 획 목록
+        background (QColor): 배경색
+        index (SpatialIndex): 획 경계 영역 인덱스 (정렬 순서는 그려진 순서)
+    """
+
+    def __init__(self, background=Qt.GlobalColor.white):
+        self.strokes = []
+        self.background = QColor(background)
+        self.index = SpatialIndex()
+
+    def __len__(self):
+        return len(self.strokes)
+
+    def __iter__(self):
+        return iter(self.strokes)
+
+    def add(self, stroke):
+        """획 추가"""
+        self.strokes.append(stroke)
+        self.index.insert(stroke, stroke.bounds())
+
+    def insert(self, position, stroke):
+        """획을 목록의 position 위치에 다시 넣기 (삭제 취소용)"""
+        position = min(position, len(self.strokes))
+        below = self.index.order(self.strokes[position - 1]) if position > 0 else -1
+        above = self.index.order(self.strokes[position]) if position < len(self.strokes) else below + 2
+        self.strokes.insert(position, stroke)
+        self.index.insert(stroke, stroke.bounds(), order=(below + above) / 2)
+
+    def remove(self, stroke):
+        """획 삭제 (없으면 무시)"""
+        if stroke not in self.index:
+            return
+        self.index.remove(stroke)
+        # 실행 취소처럼 마지막 획을 지우는 경우가 대부분이므로 끝에서부터 확인
+        if self.strokes[-1] is stroke:
+            self.strokes.pop()
+        else:
+            self.strokes.remove(stroke)
+
+    def clear(self):
+        """모든 획 삭제"""
+        self.strokes.clear()
+        self.index.clear()
+
+    def bounds(self):
+        """모든 획을 감싸는 영역"""
+        bounds = QRect()
+        for stroke in self.strokes:
+            bounds = bounds.united(stroke.bounds())
+        return bounds
+
+    def strokes_in(self, rect):
+        """영역과 겹치는 획 목록 (그려진 순서)"""
+        return self.index.query_rect(rect)
+
+    def hit_test(self, point, tolerance=4):
+        """점 근처의 가장 위에 있는 펜 획 찾기
+
+        Args:
+            point (QPoint): 캔버스 좌표
+            tolerance (float): 펜 두께에 더할 허용 거리(px)
+
+        Returns:
+            Stroke: 찾은 획 (없으면 None)
+        """
+        margin = math.ceil(tolerance)
+        area = QRect(point.x() - margin, point.y() - margin, 2 * margin + 1, 2 * margin + 1)
+        for stroke in reversed(self.strokes_in(area)):
+            if stroke.kind != STROKE_PEN:
+                continue
+            if stroke.distance_to(point.x(), point.y()) <= stroke.width / 2 + tolerance:
+                return stroke
+        return None
+
+    def render(self, painter, rect=None):
+        """획 그리기 (rect가 주어지면 겹치는 획만)
+
+        Args:
+            painter (QPainter): 대상 페인터
+            rect (QRect): 캔버스 좌표 영역
+        """
+        strokes = self.strokes if rect is None else self.strokes_in(rect)
+        for stroke in strokes:
+            stroke.render(painter, self.background)
+
+    def rasterize(self, ink, rect=None):
+        """잉크 타일 캐시를 획 목록으로 다시 만들기
+
+        Args:
+            ink (TiledCanvas): 잉크 타일 캐시
+            rect (QRect): 다시 만들 영역 (None이면 전체)
+        """
+        if rect is None:
+            ink.clear()
+            strokes = self.strokes
+        else:
+            rect = QRect(rect).normalized()
+            ink.fill_rect(rect)
+            strokes = self.strokes_in(rect)
+
+        for stroke in strokes:
+            area = stroke.bounds() if rect is None else stroke.bounds().intersected(rect)
+
+            def draw(painter, stroke=stroke):
+                if rect is not None:
+                    painter.setClipRect(rect)
+                stroke.render(painter, self.background)
+
+            # 배경을 칠하는 획은 잉크가 있는 타일에만 적용
+            ink.paint(area, draw, allocate=stroke.kind == STROKE_PEN)
+
+    def render_image(self, rect=None, scale=1.0):
+        """획을 배율에 맞춰 새 이미지로 렌더링 (해상도 독립 내보내기)
+
+        Args:
+            rect (QRect): 렌더링할 캔버스 좌표 영역 (None이면 전체 획 영역)
+            scale (float): 배율
+
+        Returns:
+            QImage: 배경색으로 채운 RGB32 이미지
+        """
+        rect = self.bounds() if rect is None else QRect(rect).normalized()
+        width = max(1, math.ceil(rect.width() * scale))
+        height = max(1, math.ceil(rect.height() * scale))
+        image = QImage(width, height, QImage.Format.Format_RGB32)
+        image.fill(self.background)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, scale != 1.0)
+        painter.scale(scale, scale)
+        painter.translate(-rect.x(), -rect.y())
+        self.render(painter, rect)
+        painter.end()
+        return image
+
+    def to_bytes(self):
+        """획 목록을 바이너리로 직렬화
+
+        Returns:
+            bytes: 헤더와 획별 (종류, 색, 두께, 점 수, float32 좌표)
+        """
+        chunks = [_HEADER.pack(_MAGIC, _VERSION, len(self.strokes))]
+        chunks.extend(stroke.to_bytes() for stroke in self.strokes)
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data, background=Qt.GlobalColor.white):
+        """to_bytes()로 만든 바이너리에서 문서 복원
+
+        Args:
+            data (bytes): 직렬화된 데이터
+            background (QColor): 배경색
+
+        Returns:
+            StrokeDocument: 복원된 문서
+        """
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("획 데이터 형식이 올바르지 않습니다.")
+        document = cls(background)
+        offset = _HEADER.size
+        for _ in range(count):
+            stroke, offset = Stroke.from_bytes(data, offset)
+            document.add(stroke)
+        return document
@@ -0,0 +1,600 @@
+from PyQt5.QtCore import Qt, QPoint, QRect, QRectF, QSize
+from PyQt5.QtGui import QColor, QFont, QPen, QTextDocument
+from PyQt5.QtWidgets import QApplication, QInputDialog, QLineEdit, QMenu
+
+from .custom_text_box import CustomTextBox
+from .undo_history import TextBoxChange, TextBoxGeometryChange, TextEditChange
+
+# 텍스트 박스 스타일 (편집기 스타일시트와 같은 값)
+PADDING = 5
+MARGIN = 3
+BORDER = 1
+TOTAL_SPACING = (PADDING + MARGIN) * 2
+
+# 오버레이 핸들 크기
+HANDLE_SIZE = 25
+TAG_BUTTON_SIZE = QSize(50, 25)
+HANDLE_COLOR = QColor(100, 100, 100, 150)
+TAG_COLOR = QColor(100, 100, 100, 100)
+
+class TextBoxModel:
+    """캔버스가 직접 그리는 가벼운 텍스트 박스
+
+    위젯 없이 내용과 위치만 가지며, 편집할 때만 TextBoxLayer의 편집기 위젯이
+    붙습니다. CustomTextBox의 텍스트/위치 관련 메서드 이름을 그대로 사용하므로
+    기존 모드 코드는 위젯 대신 모델을 다룰 수 있습니다.
+
+    Attributes:
+        layer (TextBoxLayer): 소속 레이어 (변경 시 다시 그리기 요청)
+        font_size (int): 폰트 크기(pt)
+        tag (str): View 모드의 태그 버튼 텍스트
+        read_only (bool): 편집 불가 여부
+        visible (bool): 표시 여부
+        tag_visible (bool): 태그 버튼 표시 여부 (저장 중에는 숨김)
+        original_text (str): 태그로 감싸기 전 텍스트
+    """
+
+    __slots__ = ("layer", "font_size", "tag", "read_only", "visible", "tag_visible",
+                 "original_text", "_rect", "_text", "_html", "_document")
+
+    def __init__(self, pos=QPoint(), text=None, font_size=12):
+        self.layer = None
+        self.font_size = font_size
+        self.tag = "HTML"
+        self.read_only = False
+        self.visible = True
+        self.tag_visible = True
+        self.original_text = ""
+        self._rect = QRect(QPoint(pos), QSize(200, 50))
+        self._text = text or ""  # 일반 텍스트 (HTML로 설정했으면 None)
+        self._html = None
+        self._document = None  # 그리기/크기 계산용 캐시 (필요할 때 생성)
+
+    def _changed(self, old_rect=None, content=False):
+        if content:
+            self._document = None
+        if self.layer is not None:
+            self.layer.changed(self, old_rect)
+
+    # 위치와 크기
+
+    def geometry(self):
+        return QRect(self._rect)
+
+    def pos(self):
+        return self._rect.topLeft()
+
+    def size(self):
+        return self._rect.size()
+
+    def width(self):
+        return self._rect.width()
+
+    def height(self):
+        return self._rect.height()
+
+    def move(self, pos):
+        old_rect = QRect(self._rect)
+        self._rect.moveTopLeft(QPoint(pos))
+        self._changed(old_rect)
+
+    def resize(self, width, height=None):
+        if height is None:  # QSize
+            width, height = width.width(), width.height()
+        old_rect = QRect(self._rect)
+        self._rect.setSize(QSize(width, height))
+        if self._document is not None:
+            self._document.setTextWidth(self.text_width())
+        self._changed(old_rect)
+
+    def set_geometry(self, rect):
+        """편집기에서 바뀐 위치/크기 반영 (다시 알리지 않음)"""
+        self._rect = QRect(rect)
+        if self._document is not None:
+            self._document.setTextWidth(self.text_width())
+
+    def text_width(self):
+        """내용이 줄바꿈되는 너비"""
+        return max(1, self._rect.width() - TOTAL_SPACING - BORDER * 2)
+
+    # 표시 여부
+
+    def isVisible(self):
+        return self.visible
+
+    def show(self):
+        self.visible = True
+        self._changed()
+
+    def hide(self):
+        self.visible = False
+        self._changed()
+
+    # 내용
+
+    def font(self):
+        font = QFont(QApplication.font())
+        font.setPointSize(self.font_size)
+        return font
+
+    def setFont(self, font):
+        self.font_size = font.pointSize()
+        self._changed(content=True)
+
+    def isReadOnly(self):
+        return self.read_only
+
+    def setReadOnly(self, read_only):
+        self.read_only = read_only
+        self._changed()
+
+    def build_document(self, text=None):
+        """내용(또는 주어진 일반 텍스트)을 배치한 새 QTextDocument"""
+        document = QTextDocument()
+        document.setDefaultFont(self.font())
+        if text is not None:
+            document.setPlainText(text)
+        elif self._html is not None:
+            document.setHtml(self._html)
+        else:
+            document.setPlainText(self._text)
+        document.setTextWidth(self.text_width())
+        return document
+
+    def document(self):
+        """내용을 배치한 QTextDocument (캐시)"""
+        if self._document is None:
+            self._document = self.build_document()
+        return self._document
+
+    def clone(self):
+        """레이어에 속하지 않은 사본 (렌더링/저장용 스냅샷)"""
+        copy = TextBoxModel(self.pos(), font_size=self.font_size)
+        copy._rect = QRect(self._rect)
+        copy._text = self._text
+        copy._html = self._html
+        for name in ("tag", "read_only", "visible", "tag_visible", "original_text"):
+            setattr(copy, name, getattr(self, name))
+        return copy
+
+    def state(self):
+        """문서 파일에 저장할 상태
+
+        Returns:
+            dict: 위치/크기, 폰트, 태그, 내용(html 또는 text), 표시/편집 여부
+        """
+        state = {
+            "x": self._rect.x(), "y": self._rect.y(),
+            "w": self._rect.width(), "h": self._rect.height(),
+            "font_size": self.font_size, "tag": self.tag,
+            "read_only": self.read_only, "visible": self.visible,
+        }
+        if self._html is not None:
+            state["html"] = self._html
+        else:
+            state["text"] = self._text
+        return state
+
+    @classmethod
+    def from_state(cls, state):
+        """state()로 만든 상태에서 텍스트 박스 복원"""
+        model = cls(QPoint(state["x"], state["y"]), font_size=state.get("font_size", 12))
+        model._rect.setSize(QSize(state["w"], state["h"]))
+        model.tag = state.get("tag", "HTML")
+        model.read_only = state.get("read_only", False)
+        model.visible = state.get("visible", True)
+        model.set_content(html=state.get("html"), text=state.get("text"))
+        return model
+
+    def tagged_text(self):
+        """저장용으로 태그 버튼 텍스트로 감싼 텍스트"""
+        return f"<{self.tag}>{self.toPlainText()}</{self.tag}>"
+
+    def toPlainText(self):
+        return self._text if self._html is None else self.document().toPlainText()
+
+    def toHtml(self):
+        return self.document().toHtml()
+
+    def set_content(self, html=None, text=None):
+        """내용 교체 (크기 자동 조절 없이)"""
+        self._html = html
+        self._text = None if html is not None else (text or "")
+        self._changed(content=True)
+
+    def setPlainText(self, text):
+        self.set_content(text=text)
+        self.adjust_size()
+
+    def setText(self, text):
+        self.setPlainText(text)
+
+    def setHtml(self, html):
+        self.set_content(html=html)
+        self.adjust_size()
+
+    def adjust_size(self):
+        """텍스트 내용에 따라 크기 자동 조절 (CustomTextBox.adjust_size와 같은 규칙)"""
+        doc = self.document()
+        doc.setTextWidth(-1)
+        text_width = int(doc.idealWidth() * 1.3 + TOTAL_SPACING)
+        text_height = int(doc.size().height() * 1.5 + TOTAL_SPACING)
+        text_width = max(min(text_width, 500), 100)
+        text_height = max(min(text_height, 300), 50)
+        self.resize(text_width, text_height)
+
+    def wrapTextWithTags(self):
+        """View 모드에서 텍스트를 태그 버튼의 텍스트로 감싸기"""
+        if self.layer is not None and self.layer.view_mode and self.tag_visible:
+            self.original_text = self.toPlainText()
+            self.set_content(text=self.tagged_text())
+            self.tag_visible = False
+
+    def restoreOriginalText(self):
+        """원본 텍스트로 복원"""
+        if not self.tag_visible:
+            self.tag_visible = True
+            self.set_content(text=self.original_text)
+            self.original_text = ""
+
+    # 그리기
+
+    def paint(self, painter, document=None):
+        """박스와 내용 그리기 (캔버스 좌표)
+
+        Args:
+            painter (QPainter): 대상 페인터
+            document (QTextDocument): 대신 그릴 내용 (None이면 박스 내용)
+        """
+        box = self._rect.adjusted(MARGIN, MARGIN, -MARGIN, -MARGIN)
+        painter.fillRect(box, Qt.GlobalColor.white)
+        painter.setPen(QPen(Qt.GlobalColor.gray, BORDER, Qt.PenStyle.DashLine))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(box.adjusted(0, 0, -1, -1))
+
+        inset = BORDER + PADDING
+        clip = QRectF(0, 0, box.width() - inset * 2, box.height() - inset * 2)
+        painter.save()
+        painter.translate(box.left() + inset, box.top() + inset)
+        (document or self.document()).drawContents(painter, clip)
+        painter.restore()
+
+class TextBoxLayer:
+    """캔버스의 텍스트 박스 레이어
+
+    텍스트 박스는 TextBoxModel로 보관하고 paint()에서 한 번에 그립니다.
+    실제 QTextEdit(CustomTextBox) 편집기는 편집 중인 박스 하나에만 붙고,
+    드래그/크기 조절 핸들과 태그 버튼은 위젯 대신 오버레이로 그려 마우스
+    이벤트를 직접 처리합니다.
+
+    Attributes:
+        canvas (NoteCanvas): 대상 캔버스
+        registry (ObjectRegistry): 텍스트 박스 등록부 (canvas.text_boxes)
+        view_mode (bool): View 모드 여부
+        editing (TextBoxModel): 편집 중인 박스
+        editor (CustomTextBox): 편집기 위젯 (처음 편집할 때 생성)
+    """
+
+    def __init__(self, canvas, registry):
+        self.canvas = canvas
+        self.registry = registry
+        self.view_mode = False
+        self.editing = None
+        self.editor = None
+        self.html_before_edit = None
+        self.rect_before_edit = None
+        self.hover = None  # 마우스가 올라간 박스 (크기 조절 핸들 표시)
+        self.dragging = None  # (박스, 클릭 위치와 박스 위치의 차이)
+        self.resizing = None  # (박스, 시작 위치, 원래 크기)
+
+    # 등록과 변경
+
+    def add(self, model, edit=False):
+        """박스 추가
+
+        Args:
+            model (TextBoxModel): 추가할 박스
+            edit (bool): 바로 편집을 시작할지 여부
+        """
+        model.layer = self
+        self.registry.add(model)
+        self.canvas.update(model.geometry())
+        if edit:
+            self.begin_edit(model)
+
+    def remove(self, model):
+        """박스 제거"""
+        self.registry.discard(model)
+        self.changed(model)
+
+    def delete(self, model):
+        """사용자가 지운 박스 제거 (캔버스에 실행 취소 기록이 있으면 추가)"""
+        if not hasattr(self.canvas, 'history'):
+            self.remove(model)
+            return
+        memory = self.canvas.text_mode.text_box_memory
+        memory.detach_text_box(model)
+        self.canvas.history.push("텍스트 상자 삭제", [TextBoxChange(memory, model, removed=True)])
+
+    def record_geometry(self, model, before, label):
+        """박스 위치/크기가 before에서 바뀌었으면 실행 취소 기록에 추가"""
+        after = model.geometry()
+        if after != before and hasattr(self.canvas, 'history'):
+            self.canvas.history.push(label, [TextBoxGeometryChange(model, before, after)])
+
+    def clear(self):
+        """모든 박스 제거"""
+        self.end_edit(record=False)
+        self.registry.clear()
+        self.hover = self.dragging = self.resizing = None
+        self.canvas.update()
+
+    def models(self):
+        """모든 박스 (생성 순서)"""
+        return list(self.registry)
+
+    def changed(self, model, old_rect=None):
+        """박스의 위치/내용이 바뀌었을 때 인덱스 갱신과 다시 그리기"""
+        self.registry.refresh(model)
+        if model is self.editing:
+            if not model.visible or model not in self.registry:
+                self.end_edit(record=False)
+            else:
+                # 코드에서 바꾼 내용은 편집 기록에 포함하지 않음
+                self.load_editor(model)
+                self.html_before_edit = self.editor.toHtml()
+                self.rect_before_edit = model.geometry()
+        dirty = model.geometry()
+        if old_rect is not None:
+            dirty = dirty.united(old_rect)
+        self.canvas.update(dirty)
+
+    def model_at(self, pos):
+        """점 위의 가장 위에 있는 보이는 박스 (편집 중인 박스 제외)"""
+        for model in reversed(self.registry.query_point(QPoint(pos))):
+            if model.visible and model is not self.editing:
+                return model
+        return None
+
+    def snapshot(self):
+        """보이는 텍스트 박스의 사본 목록 (편집 중인 박스는 편집기 내용과 위치 반영)
+
+        Returns:
+            list[TextBoxModel]: 레이어에 속하지 않은 사본 (생성 순서)
+        """
+        return [self.current(model) if model is self.editing else model.clone()
+                for model in self.registry if model.visible]
+
+    def current(self, model):
+        """편집기 내용까지 반영한 박스 (편집 중이면 사본, 아니면 모델 자체)"""
+        if model is not self.editing:
+            return model
+        copy = model.clone()
+        copy.set_content(html=self.editor.toHtml())
+        copy.set_geometry(self.editor.geometry())
+        if self.editor.html_button:
+            copy.tag = self.editor.html_button.text()
+        return copy
+
+    def set_view_mode(self, enabled):
+        """View 모드 설정 (태그 버튼 표시, 핸들 숨김)"""
+        self.view_mode = enabled
+        if self.editor is not None:
+            self.editor.setViewMode(enabled)
+        self.canvas.update()
+
+    # 편집기
+
+    def ensure_editor(self):
+        if self.editor is None:
+            editor = CustomTextBox(self.canvas)
+            editor.margin = MARGIN
+            editor.total_spacing = TOTAL_SPACING
+            editor.updateStyle()
+            editor.hide()
+            self.editor = editor
+        return self.editor
+
+    def load_editor(self, model):
+        """편집기에 박스 내용과 위치 적용"""
+        editor = self.editor
+        editor.model = None  # 적용하는 동안 모델로 되돌려 쓰지 않음
+        editor.blockSignals(True)
+        editor.setFont(model.font())
+        if editor.toHtml() != model.toHtml():
+            editor.setHtml(model.toHtml())
+        editor.blockSignals(False)
+        editor.setReadOnly(model.read_only)
+        editor.setViewMode(self.view_mode)
+        if editor.html_button:
+            editor.html_button.setText(model.tag)
+        editor.setGeometry(model.geometry())
+        editor.model = model
+
+    def begin_edit(self, model, pos=None):
+        """박스에 편집기를 붙여 편집 시작
+
+        Args:
+            model (TextBoxModel): 편집할 박스
+            pos (QPoint): 커서를 둘 캔버스 좌표 (None이면 끝)
+        """
+        if self.editing is model:
+            return
+        self.end_edit()
+        editor = self.ensure_editor()
+        self.editing = model
+        self.load_editor(model)
+        self.html_before_edit = editor.toHtml()
+        self.rect_before_edit = model.geometry()
+        if pos is not None:
+            editor.setTextCursor(editor.cursorForPosition(editor.viewport().mapFrom(self.canvas, pos)))
+        editor.show()
+        editor.raise_()
+        editor.setFocus()
+        self.canvas.update(model.geometry())
+
+    def end_edit(self, record=True):
+        """편집기 내용을 박스에 반영하고 편집기 숨기기
+
+        Args:
+            record (bool): 바뀐 내용을 실행 취소 기록에 추가할지 여부
+        """
+        model = self.editing
+        if model is None:
+            return
+        editor = self.editor
+        self.editing = None
+        editor.model = None
+        if editor.html_button:
+            model.tag = editor.html_button.text()
+        model.set_geometry(editor.geometry())
+        before, self.html_before_edit = self.html_before_edit, None
+        before_rect, self.rect_before_edit = self.rect_before_edit, None
+        after = editor.toHtml()
+        if after != before:
+            model.set_content(html=after)
+            if record and not model.read_only and hasattr(self.canvas, 'history'):
+                change = TextEditChange(model, before, after, before_rect, model.geometry())
+                self.canvas.history.push("텍스트 편집", [change])
+        elif record and before_rect is not None and model.geometry() != before_rect:
+            self.record_geometry(model, before_rect, "텍스트 상자 이동")
+        editor.hide()
+        self.changed(model)
+
+    def editor_geometry_changed(self):
+        """편집기가 이동/크기 변경되면 박스에 반영"""
+        model = self.editing
+        if model is not None:
+            old_rect = model.geometry()
+            model.set_geometry(self.editor.geometry())
+            self.registry.refresh(model)
+            self.canvas.update(old_rect)
+
+    def editor_deleted(self):
+        """편집기의 드래그 핸들로 박스를 삭제한 경우"""
+        model = self.editing
+        self.editing = None
+        self.editor = None
+        if model is not None:
+            self.delete(model)
+
+    # 그리기
+
+    def handle_rects(self, model):
+        """박스의 오버레이 영역 (드래그 핸들, 크기 조절 핸들, 태그 버튼)"""
+        rect = model.geometry()
+        drag = QRect(rect.topLeft(), QSize(HANDLE_SIZE, HANDLE_SIZE))
+        resize = QRect(rect.right() - HANDLE_SIZE + 1, rect.bottom() - HANDLE_SIZE + 1, HANDLE_SIZE, HANDLE_SIZE)
+        tag_width = max(TAG_BUTTON_SIZE.width(), self.canvas.fontMetrics().horizontalAdvance(model.tag) + 20)
+        tag = QRect(rect.right() - tag_width - 4, rect.bottom() - TAG_BUTTON_SIZE.height() - 4,
+                    tag_width, TAG_BUTTON_SIZE.height())
+        return drag, resize, tag
+
+    def paint(self, painter, rect):
+        """영역과 겹치는 박스와 오버레이 그리기
+
+        Args:
+            painter (QPainter): 캔버스 페인터
+            rect (QRect): 다시 그릴 영역
+        """
+        for model in self.registry.query_rect(rect):
+            if not model.visible or model is self.editing:
+                continue
+            model.paint(painter)
+            drag, resize, tag = self.handle_rects(model)
+            if self.view_mode:
+                if model.tag_visible:
+                    painter.setPen(Qt.PenStyle.NoPen)
+                    painter.setBrush(TAG_COLOR)
+                    painter.drawRoundedRect(tag, 3, 3)
+                    painter.setPen(Qt.GlobalColor.white)
+                    painter.drawText(tag, Qt.AlignmentFlag.AlignCenter, model.tag)
+            else:
+                painter.fillRect(drag, HANDLE_COLOR)
+                if model is self.hover:
+                    painter.fillRect(resize, HANDLE_COLOR)
+
+    # 마우스 처리 (처리했으면 True 반환)
+
+    def mouse_press_event(self, event):
+        pos = event.pos()
+        model = self.model_at(pos)
+        if model is None:
+            self.end_edit()
+            return False
+        drag, resize, tag = self.handle_rects(model)
+        if not self.view_mode and drag.contains(pos):
+            if event.button() == Qt.MouseButton.LeftButton:
+                self.dragging = (model, pos - model.pos(), model.geometry())
+            elif event.button() == Qt.MouseButton.RightButton and event.modifiers() & Qt.KeyboardModifier.AltModifier:
+                self.delete(model)
+            return True
+        if not self.view_mode and resize.contains(pos) and event.button() == Qt.MouseButton.LeftButton:
+            self.resizing = (model, pos, model.geometry())
+            return True
+        if self.view_mode and model.tag_visible and tag.contains(pos):
+            if event.button() == Qt.MouseButton.RightButton:
+                self.show_tag_menu(model, pos)
+            return True
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.begin_edit(model, pos)
+        return True
+
+    def mouse_move_event(self, event):
+        pos = event.pos()
+        if self.dragging:
+            model, offset, _ = self.dragging
+            model.move(pos - offset)
+            return True
+        if self.resizing:
+            model, start, rect = self.resizing
+            size = rect.size()
+            diff = pos - start
+            model.resize(max(100, size.width() + diff.x()), max(50, size.height() + diff.y()))
+            return True
+        hover = self.model_at(pos)
+        if hover is not self.hover:
+            for model in (self.hover, hover):
+                if model is not None:
+                    self.canvas.update(model.geometry())
+            self.hover = hover
+        return False
+
+    def mouse_release_event(self, event):
+        if self.dragging:
+            model, _, before = self.dragging
+            self.dragging = None
+            self.record_geometry(model, before, "텍스트 상자 이동")
+            return True
+        if self.resizing:
+            model, _, before = self.resizing
+            self.resizing = None
+            self.record_geometry(model, before, "텍스트 상자 크기 조절")
+            return True
+        return False
+
+    def mouse_double_click_event(self, event):
+        if not self.view_mode:
+            return False
+        model = self.model_at(event.pos())
+        if model is None or not model.tag_visible or not self.handle_rects(model)[2].contains(event.pos()):
+            return False
+        self.edit_tag(model)
+        return True
+
+    def show_tag_menu(self, model, pos):
+        """태그 버튼 컨텍스트 메뉴"""
+        menu = QMenu(self.canvas)
+        edit_action = menu.addAction("텍스트 수정")
+        edit_action.triggered.connect(lambda: self.edit_tag(model))
+        menu.exec_(self.canvas.mapToGlobal(pos))
+
+    def edit_tag(self, model):
+        """태그 버튼 텍스트 수정"""
+        text, ok = QInputDialog.getText(self.canvas, '버튼 텍스트 수정',
+                                        '새로운 텍스트를 입력하세요:',
+                                        QLineEdit.EchoMode.Normal,
+                                        model.tag)
+        if ok and text:
+            model.tag = text
+            self.canvas.update(model.geometry())
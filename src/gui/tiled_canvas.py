@@ -0,0 +1,225 @@
+import numpy as np
+from PIL import Image
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor, QImage, QPainter
+
+from src.utils.qimage_bridge import array_to_qimage
+
+# 타일 한 변의 픽셀 수
+TILE_SIZE = 256
+
+class TiledCanvas:
+    """잉크를 고정 크기 타일로 나누어 저장하는 희소 캔버스
+
+    타일은 처음 그려질 때 할당되므로 메모리는 창 크기가 아니라 잉크가 있는
+    영역에 비례합니다. 좌표에 제한이 없어 창을 줄여도 보이지 않는 영역의 잉크가
+    보존되고, 크기 변경 시 재할당이나 복사가 일어나지 않습니다.
+    할당되지 않은 타일은 배경색으로 간주합니다.
+
+    Attributes:
+        tile_size (int): 타일 한 변의 픽셀 수
+        background (QColor): 배경색
+        image_format (QImage.Format): 타일 이미지 포맷
+        tiles (dict): (타일 x, 타일 y) -> QImage
+    """
+
+    def __init__(self, tile_size=TILE_SIZE, background=Qt.GlobalColor.white,
+                 image_format=QImage.Format.Format_RGB32):
+        self.tile_size = tile_size
+        self.background = QColor(background)
+        self.image_format = image_format
+        self.tiles = {}
+
+    def tile_keys(self, rect):
+        """영역과 겹치는 타일 좌표 목록
+
+        Args:
+            rect (QRect): 캔버스 좌표 영역
+
+        Returns:
+            list[tuple]: (타일 x, 타일 y) 목록
+        """
+        rect = QRect(rect).normalized()
+        if rect.isEmpty():
+            return []
+        size = self.tile_size
+        return [
+            (tx, ty)
+            for ty in range(rect.top() // size, rect.bottom() // size + 1)
+            for tx in range(rect.left() // size, rect.right() // size + 1)
+        ]
+
+    def tile_rect(self, key):
+        """타일이 차지하는 캔버스 좌표 영역"""
+        return QRect(key[0] * self.tile_size, key[1] * self.tile_size, self.tile_size, self.tile_size)
+
+    def tile(self, key, create=False):
+        """타일 이미지 조회
+
+        Args:
+            key (tuple): (타일 x, 타일 y)
+            create (bool): 없으면 배경색으로 채운 타일을 할당할지 여부
+
+        Returns:
+            QImage: 타일 이미지 (없고 create가 False이면 None)
+        """
+        tile = self.tiles.get(key)
+        if tile is None and create:
+            tile = QImage(self.tile_size, self.tile_size, self.image_format)
+            tile.fill(self.background)
+            self.tiles[key] = tile
+        return tile
+
+    def paint(self, rect, draw, allocate=True):
+        """영역에 걸친 타일마다 캔버스 좌표계의 QPainter로 그리기
+
+        Args:
+            rect (QRect): 그리기가 영향을 주는 캔버스 좌표 영역
+            draw (callable): QPainter를 받아 캔버스 좌표로 그리는 함수 (타일마다 호출)
+            allocate (bool): 없는 타일을 할당할지 여부 (배경색으로 지우는 경우 False)
+        """
+        for key in self.tile_keys(rect):
+            tile = self.tile(key, create=allocate)
+            if tile is None:
+                continue
+            origin = self.tile_rect(key).topLeft()
+            painter = QPainter(tile)
+            painter.translate(-origin.x(), -origin.y())
+            draw(painter)
+            painter.end()
+
+    def fill_rect(self, rect, color=None):
+        """영역을 단색으로 채우기
+
+        배경색으로 채우면 영역에 완전히 덮이는 타일은 해제됩니다.
+
+        Args:
+            rect (QRect): 캔버스 좌표 영역
+            color (QColor): 채울 색 (None이면 배경색)
+        """
+        color = self.background if color is None else QColor(color)
+        erase = color == self.background
+        rect = QRect(rect).normalized()
+        for key in self.tile_keys(rect):
+            tile_rect = self.tile_rect(key)
+            if erase and rect.contains(tile_rect):
+                self.tiles.pop(key, None)
+                continue
+            tile = self.tile(key, create=not erase)
+            if tile is None:
+                continue
+            painter = QPainter(tile)
+            painter.fillRect(rect.intersected(tile_rect).translated(-tile_rect.topLeft()), color)
+            painter.end()
+
+    def draw_image(self, point, image):
+        """이미지를 캔버스 좌표 point에 그리기
+
+        Args:
+            point (QPoint): 이미지 왼쪽 위 위치
+            image (QImage): 그릴 이미지
+        """
+        self.paint(QRect(point, image.size()), lambda painter: painter.drawImage(point, image))
+
+    def apply(self, rect, func):
+        """할당된 타일의 겹치는 부분에 이미지 처리 함수 적용
+
+        Args:
+            rect (QRect): 캔버스 좌표 영역
+            func (callable): (타일 QImage, 타일 내부 QRect)를 받아 타일을 제자리에서 수정하는 함수
+        """
+        rect = QRect(rect).normalized()
+        for key in self.tile_keys(rect):
+            tile = self.tiles.get(key)
+            if tile is not None:
+                tile_rect = self.tile_rect(key)
+                func(tile, rect.intersected(tile_rect).translated(-tile_rect.topLeft()))
+
+    def render(self, painter, rect):
+        """영역과 겹치는 타일을 QPainter에 그리기 (캔버스 좌표 기준)
+
+        Args:
+            painter (QPainter): 대상 페인터
+            rect (QRect): 그릴 캔버스 좌표 영역
+        """
+        rect = QRect(rect).normalized()
+        painter.fillRect(rect, self.background)
+        for key in self.tile_keys(rect):
+            tile = self.tiles.get(key)
+            if tile is not None:
+                # 타일 중 영역과 겹치는 부분만 복사
+                tile_rect = self.tile_rect(key)
+                target = rect.intersected(tile_rect)
+                painter.drawImage(target, tile, target.translated(-tile_rect.topLeft()))
+
+    def _render_into(self, image, rect):
+        painter = QPainter(image)
+        painter.translate(-rect.x(), -rect.y())
+        painter.setClipRect(rect)
+        self.render(painter, rect)
+        painter.end()
+        return image
+
+    def copy(self, rect):
+        """영역을 하나의 QImage로 합쳐 복사
+
+        Args:
+            rect (QRect): 캔버스 좌표 영역
+
+        Returns:
+            QImage: 영역 크기의 이미지
+        """
+        rect = QRect(rect).normalized()
+        return self._render_into(QImage(rect.size(), self.image_format), rect)
+
+    def to_pil(self, rect):
+        """영역을 RGBA PIL 이미지로 변환 (타일을 한 번만 복사)
+
+        NumPy 버퍼를 감싼 QImage에 타일을 합성하고, PIL 이미지는 그 버퍼를 공유합니다.
+
+        Args:
+            rect (QRect): 캔버스 좌표 영역
+
+        Returns:
+            PIL.Image: RGBA 이미지
+        """
+        rect = QRect(rect).normalized()
+        pixels = np.empty((max(0, rect.height()), max(0, rect.width()), 4), dtype=np.uint8)
+        if pixels.size:
+            self._render_into(array_to_qimage(pixels), rect)
+        return Image.frombuffer("RGBA", (pixels.shape[1], pixels.shape[0]), pixels, "raw", "RGBA", 0, 1)
+
+    def bounding_rect(self):
+        """할당된 타일 전체를 감싸는 영역 (타일이 없으면 빈 QRect)"""
+        bounds = QRect()
+        for key in self.tiles:
+            bounds = bounds.united(self.tile_rect(key))
+        return bounds
+
+    def snapshot(self):
+        """현재 타일 상태 스냅샷
+
+        QImage는 암시적 공유를 사용하므로 픽셀은 이후 해당 타일에 그릴 때만 복사됩니다.
+
+        Returns:
+            dict: restore()에 전달할 타일 사본
+        """
+        return {key: QImage(tile) for key, tile in self.tiles.items()}
+
+    def clone(self):
+        """타일을 암시적 공유로 복사한 독립된 사본 (이후 원본에 그려도 사본은 바뀌지 않음)"""
+        copy = TiledCanvas(self.tile_size, self.background, self.image_format)
+        copy.restore(self.snapshot())
+        return copy
+
+    def restore(self, snapshot):
+        """snapshot()으로 저장한 상태로 되돌리기"""
+        self.tiles = {key: QImage(tile) for key, tile in snapshot.items()}
+
+    def clear(self):
+        """모든 타일 해제"""
+        self.tiles.clear()
+
+    def memory_bytes(self):
+        """할당된 타일이 사용하는 픽셀 메모리(바이트)"""
+        return sum(tile.sizeInBytes() for tile in self.tiles.values())
@@ -0,0 +1,373 @@
+import os
+import zlib
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QImage
+
+# 실행 취소 기록이 사용할 최대 메모리 (MB)
+DEFAULT_MEMORY_LIMIT = int(os.environ.get("MARKUPNOTE_UNDO_MEMORY_MB", "64")) * 1024 * 1024
+
+def _compress_tile(tile):
+    """타일 픽셀을 압축 (할당되지 않은 타일은 None)"""
+    if tile is None:
+        return None
+    pointer = tile.constBits()
+    pointer.setsize(tile.sizeInBytes())
+    return zlib.compress(pointer.asstring(), 1)
+
+def _decompress_tile(data, ink):
+    """압축된 픽셀로 타일 QImage 복원"""
+    size = ink.tile_size
+    image = QImage(zlib.decompress(data), size, size, size * 4, ink.image_format)
+    return image.copy()  # 임시 버퍼에서 분리
+
+class TileChange:
+    """잉크 타일의 변경 전/후 상태 (변경된 타일만 압축해 저장)
+
+    Attributes:
+        ink (TiledCanvas): 대상 잉크 캐시
+        before (dict): 타일 좌표 -> 변경 전 압축 픽셀 (None은 빈 타일)
+        after (dict): 타일 좌표 -> 변경 후 압축 픽셀
+    """
+
+    __slots__ = ("ink", "before", "after")
+
+    def __init__(self, ink):
+        self.ink = ink
+        self.before = {}
+        self.after = {}
+
+    def capture(self, rect):
+        """영역의 타일 중 아직 기록하지 않은 타일의 현재 상태 기록 (그리기 전에 호출)"""
+        for key in self.ink.tile_keys(rect):
+            if key not in self.before:
+                self.before[key] = _compress_tile(self.ink.tiles.get(key))
+
+    def finish(self):
+        """변경 후 상태를 기록하고 바뀌지 않은 타일은 버림"""
+        for key, before in list(self.before.items()):
+            after = _compress_tile(self.ink.tiles.get(key))
+            if after == before:
+                del self.before[key]
+            else:
+                self.after[key] = after
+
+    def _apply(self, states):
+        for key, data in states.items():
+            if data is None:
+                self.ink.tiles.pop(key, None)
+            else:
+                self.ink.tiles[key] = _decompress_tile(data, self.ink)
+
+    def undo(self):
+        self._apply(self.before)
+
+    def redo(self):
+        self._apply(self.after)
+
+    def is_empty(self):
+        return not self.before
+
+    def nbytes(self):
+        return sum(len(data or b"") for data in self.before.values()) + \
+            sum(len(data or b"") for data in self.after.values())
+
+    def rect(self):
+        """변경된 타일 전체 영역"""
+        bounds = QRect()
+        for key in self.before:
+            bounds = bounds.united(self.ink.tile_rect(key))
+        return bounds
+
+class StrokeChange:
+    """벡터 문서의 획 추가/삭제
+
+    Attributes:
+        document (StrokeDocument): 대상 문서
+        added (list[Stroke]): 추가된 획
+        removed (list[tuple]): (원래 위치, 획) 목록
+    """
+
+    __slots__ = ("document", "added", "removed")
+
+    def __init__(self, document, added=(), removed=()):
+        self.document = document
+        self.added = list(added)
+        self.removed = sorted(removed, key=lambda item: item[0])
+
+    def undo(self):
+        for stroke in self.added:
+            self.document.remove(stroke)
+        for index, stroke in self.removed:
+            self.document.insert(index, stroke)
+
+    def redo(self):
+        for _, stroke in reversed(self.removed):
+            self.document.remove(stroke)
+        for stroke in self.added:
+            self.document.add(stroke)
+
+    def nbytes(self):
+        strokes = self.added + [stroke for _, stroke in self.removed]
+        return sum(len(stroke.points) * stroke.points.itemsize for stroke in strokes)
+
+class TextBoxChange:
+    """텍스트 박스 생성 또는 제거 (생성 취소 시 숨기고 목록에서 분리)
+
+    Attributes:
+        memory (TextBoxMemory): 텍스트 박스 저장소
+        text_box (TextBoxModel): 생성(또는 제거)된 텍스트 박스
+        removed (bool): 제거 동작이면 True
+    """
+
+    __slots__ = ("memory", "text_box", "removed")
+
+    def __init__(self, memory, text_box, removed=False):
+        self.memory = memory
+        self.text_box = text_box
+        self.removed = removed
+
+    def _show(self, visible):
+        if visible:
+            self.memory.attach_text_box(self.text_box)
+        else:
+            self.memory.detach_text_box(self.text_box)
+
+    def undo(self):
+        self._show(self.removed)
+
+    def redo(self):
+        self._show(not self.removed)
+
+    def nbytes(self):
+        return 0
+
+class TextEditChange:
+    """텍스트 박스 내용 편집
+
+    편집기가 입력에 맞춰 바꾼 크기도 함께 되돌리며, 내용을 되돌릴 때 크기를
+    자동 조절하지 않습니다.
+
+    Attributes:
+        text_box (TextBoxModel): 편집된 텍스트 박스
+        before (str): 편집 전 HTML
+        after (str): 편집 후 HTML
+        before_rect (QRect): 편집 전 위치/크기 (None이면 유지)
+        after_rect (QRect): 편집 후 위치/크기 (None이면 유지)
+    """
+
+    __slots__ = ("text_box", "before", "after", "before_rect", "after_rect")
+
+    def __init__(self, text_box, before, after, before_rect=None, after_rect=None):
+        self.text_box = text_box
+        self.before = before
+        self.after = after
+        self.before_rect = before_rect
+        self.after_rect = after_rect
+
+    def _apply(self, html, rect):
+        self.text_box.set_content(html=html)
+        if rect is not None:
+            self.text_box.resize(rect.size())
+            self.text_box.move(rect.topLeft())
+
+    def undo(self):
+        self._apply(self.before, self.before_rect)
+
+    def redo(self):
+        self._apply(self.after, self.after_rect)
+
+    def nbytes(self):
+        return (len(self.before) + len(self.after)) * 2
+
+class TextBoxGeometryChange:
+    """텍스트 박스 이동 또는 크기 조절
+
+    Attributes:
+        text_box (TextBoxModel): 옮겨진 텍스트 박스
+        before (QRect): 이전 위치/크기
+        after (QRect): 이후 위치/크기
+    """
+
+    __slots__ = ("text_box", "before", "after")
+
+    def __init__(self, text_box, before, after):
+        self.text_box = text_box
+        self.before = before
+        self.after = after
+
+    def _apply(self, rect):
+        self.text_box.resize(rect.size())
+        self.text_box.move(rect.topLeft())
+
+    def undo(self):
+        self._apply(self.before)
+
+    def redo(self):
+        self._apply(self.after)
+
+    def nbytes(self):
+        return 0
+
+class HistoryEntry:
+    """한 번의 사용자 동작에 해당하는 변경 묶음
+
+    Attributes:
+        label (str): 동작 이름
+        changes (list): undo()/redo()/nbytes()를 가진 변경 목록
+    """
+
+    __slots__ = ("label", "changes", "size")
+
+    def __init__(self, label, changes=()):
+        self.label = label
+        self.changes = list(changes)
+        self.size = 0
+
+    def undo(self):
+        for change in reversed(self.changes):
+            change.undo()
+
+    def redo(self):
+        for change in self.changes:
+            change.redo()
+
+    def rect(self):
+        """잉크가 바뀐 영역 (잉크 변경이 없으면 빈 QRect)"""
+        bounds = QRect()
+        for change in self.changes:
+            if isinstance(change, TileChange):
+                bounds = bounds.united(change.rect())
+        return bounds
+
+class UndoHistory:
+    """메모리 상한이 있는 실행 취소/다시 실행 기록
+
+    잉크는 전체 캔버스 복사본 대신 바뀐 타일만 압축해 저장하며, 기록의 총
+    크기가 memory_limit을 넘으면 가장 오래된 기록부터 버립니다.
+
+    Attributes:
+        memory_limit (int): 최대 메모리(바이트)
+    """
+
+    def __init__(self, memory_limit=DEFAULT_MEMORY_LIMIT):
+        self.memory_limit = memory_limit
+        self._undo_stack = []
+        self._redo_stack = []
+        self._pending = None
+        self._pending_tiles = None
+
+    def begin(self, label, ink=None):
+        """동작 기록 시작
+
+        Args:
+            label (str): 동작 이름
+            ink (TiledCanvas): 잉크를 바꾸는 동작이면 대상 잉크 캐시
+        """
+        if self._pending is not None:
+            self.commit()
+        self._pending = HistoryEntry(label)
+        self._pending_tiles = TileChange(ink) if ink is not None else None
+
+    def capture(self, rect):
+        """바뀔 영역의 현재 타일 기록 (잉크를 수정하기 직전에 호출)"""
+        if self._pending_tiles is not None:
+            self._pending_tiles.capture(rect)
+
+    def add_change(self, change):
+        """진행 중인 동작에 변경 추가"""
+        if self._pending is not None:
+            self._pending.changes.append(change)
+
+    def commit(self):
+        """진행 중인 동작을 기록으로 확정
+
+        Returns:
+            HistoryEntry: 추가된 기록 (바뀐 것이 없으면 None)
+        """
+        entry, tiles = self._pending, self._pending_tiles
+        self._pending = self._pending_tiles = None
+        if entry is None:
+            return None
+        if tiles is not None:
+            tiles.finish()
+            if not tiles.is_empty():
+                entry.changes.insert(0, tiles)
+        if not entry.changes:
+            return None
+
+        entry.size = sum(change.nbytes() for change in entry.changes)
+        self._undo_stack.append(entry)
+        self._redo_stack.clear()
+        self._evict()
+        return entry
+
+    def push(self, label, changes):
+        """잉크 변경이 없는 동작을 바로 기록
+
+        Returns:
+            HistoryEntry: 추가된 기록
+        """
+        self.begin(label)
+        for change in changes:
+            self.add_change(change)
+        return self.commit()
+
+    def discard(self, entry):
+        """되돌린 동작의 기록 제거 (실행 취소하지 않고 기록만 삭제)"""
+        for stack in (self._undo_stack, self._redo_stack):
+            if entry in stack:
+                stack.remove(entry)
+
+    def undo(self):
+        """가장 최근 동작 실행 취소
+
+        Returns:
+            HistoryEntry: 취소한 기록 (없으면 None)
+        """
+        if self._pending is not None:
+            self.commit()
+        if not self._undo_stack:
+            return None
+        entry = self._undo_stack.pop()
+        entry.undo()
+        self._redo_stack.append(entry)
+        return entry
+
+    def redo(self):
+        """마지막으로 취소한 동작 다시 실행
+
+        Returns:
+            HistoryEntry: 다시 실행한 기록 (없으면 None)
+        """
+        if not self._redo_stack:
+            return None
+        entry = self._redo_stack.pop()
+        entry.redo()
+        self._undo_stack.append(entry)
+        return entry
+
+    def can_undo(self):
+        return bool(self._undo_stack)
+
+    def can_redo(self):
+        return bool(self._redo_stack)
+
+    def memory_bytes(self):
+        """기록이 사용하는 메모리(바이트)"""
+        return sum(entry.size for entry in self._undo_stack + self._redo_stack)
+
+    def clear(self):
+        """모든 기록 삭제"""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
+        self._pending = self._pending_tiles = None
+
+    def _evict(self):
+        """메모리 상한을 넘으면 다시 실행 기록의 먼 쪽, 실행 취소 기록의 오래된 쪽부터 제거"""
+        total = self.memory_bytes()
+        while total > self.memory_limit and self._redo_stack:
+            total -= self._redo_stack.pop(0).size
+        # 방금 추가한 기록 하나는 항상 유지
+        while total > self.memory_limit and len(self._undo_stack) > 1:
+            total -= self._undo_stack.pop(0).size
@@ -1,6 +1,8 @@
+import logging
 import sys
 from PyQt5.QtWidgets import QApplication
 from src.gui.main_window import MainWindow
+from src.utils.telemetry import telemetry
 import argparse
 
 def main():
@@ -10,7 +12,16 @@ def main():
     parser.add_argument('--debug', action='store_true', help='디버그 모드 활성화')
     args = parser.parse_args()
 
+    # 디버그 모드에서는 OCR 단계별 로그까지 출력
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s"
+    )
+
     app = QApplication(sys.argv)
+    if args.debug:
+        # 종료 시 OCR 지연 시간 분포 출력
+        app.aboutToQuit.connect(telemetry.dump)
     window = MainWindow(debug_mode=args.debug)
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,49 @@
+import os
+import tempfile
+
+def _read_umask():
+    """현재 umask (바꿨다가 바로 되돌리므로 스레드가 생기기 전에 한 번만 호출)"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+# mkstemp는 권한을 0600으로 만들기 때문에 새 파일에는 open()과 같은 기본 권한을 적용
+_DEFAULT_MODE = 0o666 & ~_read_umask()
+
+def _target_mode(path):
+    """교체할 파일의 권한 (없으면 기본 권한)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return _DEFAULT_MODE
+
+def atomic_write(path, data):
+    """파일을 임시 파일에 쓴 뒤 교체하여 원자적으로 저장
+
+    같은 디렉토리의 임시 파일에 모두 쓰고 디스크에 반영한 다음 이름을 바꾸므로,
+    저장 중에 프로그램이 종료되어도 대상 경로에는 이전 파일이나 완전한 새 파일만 남습니다.
+    파일 권한은 기존 파일의 권한을 유지하고, 새 파일이면 umask를 적용한 기본 권한을 사용합니다.
+
+    Args:
+        path (str): 저장 경로
+        data (bytes | str): 저장할 내용 (str이면 UTF-8로 인코딩)
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            if hasattr(os, "fchmod"):  # Windows에는 유닉스 권한이 없음
+                os.fchmod(f.fileno(), _target_mode(path))
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
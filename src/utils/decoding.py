@@ -0,0 +1,104 @@
+import math
+
+import numpy as np
+
+from .line_segmenter import ink_mask
+
+# 토큰 예산 기본값
+MIN_NEW_TOKENS = 4
+MAX_NEW_TOKENS = 64
+
+def estimate_token_budget(image, min_tokens=MIN_NEW_TOKENS, max_tokens=MAX_NEW_TOKENS):
+    """잉크 폭과 높이 비율로 한 줄 이미지의 생성 토큰 수 상한 추정
+
+    손글씨 한 글자의 폭은 대략 글자 높이의 절반 정도이고, BPE 토큰 하나는
+    보통 두 글자 이상을 담으므로 (폭 / 높이) 비율에 여유를 더해 상한을 정합니다.
+    짧은 단어는 적은 토큰에서 디코딩을 끝내고, 긴 줄은 충분한 예산을 받습니다.
+
+    Args:
+        image (PIL.Image): 한 줄 텍스트 이미지
+        min_tokens (int): 최소 토큰 수
+        max_tokens (int): 최대 토큰 수
+
+    Returns:
+        int: max_new_tokens 값
+    """
+    mask = ink_mask(image)
+    rows = np.flatnonzero(mask.any(axis=1))
+    columns = np.flatnonzero(mask.any(axis=0))
+    if rows.size == 0:
+        return min_tokens
+
+    ink_height = rows[-1] - rows[0] + 1
+    ink_width = columns[-1] - columns[0] + 1
+    estimated_chars = 2.0 * ink_width / max(1, ink_height)
+    budget = math.ceil(estimated_chars * 0.75) + 4
+    return int(min(max_tokens, max(min_tokens, budget)))
+
+def build_generate_kwargs(params, token_budget=None):
+    """디코딩 설정을 model.generate 인자로 변환
+
+    Args:
+        params (dict): {"num_beams", "max_new_tokens", "early_stopping"} 설정.
+            max_new_tokens가 None이면 token_budget을 사용
+        token_budget (int): 이미지에서 추정한 토큰 예산
+
+    Returns:
+        dict: generate 키워드 인자
+    """
+    num_beams = max(1, int(params.get("num_beams") or 1))
+    kwargs = {"num_beams": num_beams, "do_sample": False}
+
+    max_new_tokens = params.get("max_new_tokens") or token_budget
+    if max_new_tokens:
+        kwargs["max_new_tokens"] = int(max_new_tokens)
+
+    # early_stopping은 빔 서치에서만 의미가 있음
+    if num_beams > 1:
+        kwargs["early_stopping"] = bool(params.get("early_stopping", True))
+    return kwargs
+
+def make_generation_params(num_beams=1, max_new_tokens=0, early_stopping=True):
+    """디코딩 설정 dict 생성
+
+    Args:
+        num_beams (int): 빔 개수 (1이면 greedy)
+        max_new_tokens (int): 생성 토큰 수 상한 (0이면 이미지 폭으로 자동 추정)
+        early_stopping (bool): 빔 서치 조기 종료 여부
+
+    Returns:
+        dict: {"num_beams", "max_new_tokens", "early_stopping"} 설정
+    """
+    return {
+        "num_beams": max(1, int(num_beams)),
+        "max_new_tokens": int(max_new_tokens) or None,
+        "early_stopping": bool(early_stopping),
+    }
+
+def update_generation_params(params, strategy=None, num_beams=None, max_new_tokens=None, early_stopping=None):
+    """디코딩 설정 일부를 바꾼 새 dict 반환 (원본은 수정하지 않음)
+
+    Args:
+        params (dict): 현재 설정
+        strategy (str): "greedy" 또는 "beam"
+        num_beams (int): 빔 개수 (strategy가 "beam"일 때 기본 4)
+        max_new_tokens (int): 생성 토큰 수 상한 (0이면 이미지 폭으로 자동 추정)
+        early_stopping (bool): 빔 서치 조기 종료 여부
+
+    Returns:
+        dict: 바뀐 설정
+    """
+    params = dict(params)
+    if strategy == "greedy":
+        params["num_beams"] = 1
+    elif strategy == "beam":
+        params["num_beams"] = num_beams or (params["num_beams"] if params["num_beams"] > 1 else 4)
+    elif strategy is not None:
+        raise ValueError(f"알 수 없는 디코딩 방식: {strategy}")
+    elif num_beams is not None:
+        params["num_beams"] = max(1, int(num_beams))
+    if max_new_tokens is not None:
+        params["max_new_tokens"] = int(max_new_tokens) or None
+    if early_stopping is not None:
+        params["early_stopping"] = bool(early_stopping)
+    return params
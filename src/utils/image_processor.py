@@ -1,6 +1,5 @@
-from PIL import Image
-import numpy as np
 from PyQt5.QtGui import QImage
+from .qimage_bridge import qimage_to_pil
 from .text_processor import text_processor
 
 def process_image_region(qimage: QImage) -> str:
@@ -13,18 +12,8 @@ def process_image_region(qimage: QImage) -> str:
         str: 변환된 텍스트
     """
     try:
-        # QImage를 PIL Image로 변환
-        width = qimage.width()
-        height = qimage.height()
-        
-        # QImage를 바이트 배열로 변환
-        ptr = qimage.bits()
-        ptr.setsize(height * width * 4)  # 32비트 이미지 (RGBA)
-        arr = np.frombuffer(ptr, np.uint8).reshape((height, width, 4))
-        
-        # RGBA to RGB
-        rgb_arr = arr[..., :3]  # alpha 채널 제거
-        rgb_image = Image.fromarray(rgb_arr)
+        # QImage를 PIL Image로 변환 (bytesPerLine과 픽셀 포맷 반영)
+        rgb_image = qimage_to_pil(qimage).convert("RGB")
         
         # 텍스트 처리기를 사용하여 이미지 처리
         markup_text = text_processor.process_image(rgb_image)
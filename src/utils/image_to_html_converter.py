@@ -1,45 +1,174 @@
+"""Tesseract로 노트 이미지를 HTML로 변환
+
+여러 장을 변환할 때는 Tesseract를 이미지마다 새로 실행하지 않습니다.
+tesserocr가 설치되어 있으면 프로세스 안의 Tesseract API를 계속 재사용하고,
+없으면 tesseract 실행 파일에 이미지 목록을 넘겨 배치마다 한 번만 실행합니다.
+
+디렉토리 일괄 변환:
+    python -m src.utils.image_to_html_converter saved_notes --workers 4
+"""
+import argparse
+import multiprocessing
+import os
+import subprocess
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
 import pytesseract
 from PIL import Image
-import numpy as np
-import os
+
+from .atomic_file import atomic_write
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+DEFAULT_LANG = 'kor+eng'
+
+# tesseract가 페이지(이미지) 사이에 출력하는 구분자
+PAGE_SEPARATOR = "\f"
+
+# 워커 프로세스마다 하나씩 생성되는 변환기
+_worker_converter = None
+
+class TesserocrEngine:
+    """tesserocr로 프로세스 안의 Tesseract API를 재사용하는 엔진
+
+    언어 데이터는 생성 시 한 번만 불러오며, 이미지는 임시 파일 없이 바로 전달합니다.
+    """
+
+    def __init__(self, lang=DEFAULT_LANG):
+        self.api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    def recognize(self, image):
+        """이미지 한 장 인식"""
+        self.api.SetImage(image)
+        return self.api.GetUTF8Text()
+
+    def recognize_files(self, image_paths):
+        """이미지 파일 여러 장 인식 (경로 순서대로)"""
+        texts = []
+        for path in image_paths:
+            with Image.open(path) as image:
+                texts.append(self.recognize(image))
+        return texts
+
+    def close(self):
+        self.api.End()
+
+class TesseractCliEngine:
+    """tesseract 실행 파일을 배치마다 한 번만 실행하는 엔진
+
+    tesseract 실행 파일에는 상주 모드가 없으므로, 이미지 경로 목록 파일을 넘겨
+    한 프로세스에서 여러 장을 인식하고 결과를 페이지 구분자로 나눕니다.
+    """
+
+    def __init__(self, lang=DEFAULT_LANG):
+        self.lang = lang
+
+    def recognize(self, image):
+        """이미지 한 장 인식"""
+        return pytesseract.image_to_string(image, lang=self.lang)
+
+    def recognize_files(self, image_paths):
+        """이미지 파일 여러 장 인식 (경로 순서대로)"""
+        if len(image_paths) <= 1:
+            return [pytesseract.image_to_string(path, lang=self.lang) for path in image_paths]
+
+        fd, list_path = tempfile.mkstemp(suffix=".txt")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(os.path.abspath(path) for path in image_paths) + "\n")
+            try:
+                result = subprocess.run(
+                    [pytesseract.pytesseract.tesseract_cmd, list_path, "stdout", "-l", self.lang],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True
+                )
+            except FileNotFoundError:
+                raise pytesseract.TesseractNotFoundError()
+        finally:
+            os.remove(list_path)
+
+        pages = result.stdout.decode("utf-8").split(PAGE_SEPARATOR)
+        if len(pages) < len(image_paths):
+            # 일부 이미지를 읽지 못해 페이지 수가 맞지 않으면 한 장씩 다시 인식
+            return [pytesseract.image_to_string(path, lang=self.lang) for path in image_paths]
+        return pages[:len(image_paths)]
+
+    def close(self):
+        pass
+
+def create_engine(lang=DEFAULT_LANG):
+    """사용할 수 있는 가장 빠른 Tesseract 엔진 생성 (tesserocr 우선)"""
+    if tesserocr is not None:
+        return TesserocrEngine(lang)
+    return TesseractCliEngine(lang)
 
 class ImageToHtmlConverter:
-    def __init__(self):
+    def __init__(self, lang=DEFAULT_LANG, engine=None):
         # Tesseract 설정
         if os.name == 'nt':  # Windows
             pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+        self.lang = lang
+        self.engine = engine or create_engine(lang)
 
     def preprocess_image(self, image_path):
         """이미지 전처리"""
         # 이미지 로드
         image = Image.open(image_path)
-        
+
         # RGB로 변환
         if image.mode != 'RGB':
             image = image.convert('RGB')
-            
+
         return image
 
     def extract_text_from_image(self, image):
         """이미지에서 텍스트 추출"""
-        # OCR 수행
-        text = pytesseract.image_to_string(image, lang='kor+eng')
+        # OCR 수행 (엔진은 변환기와 함께 유지)
+        text = self.engine.recognize(image)
         return text.strip()
 
+    def extract_texts(self, image_paths):
+        """이미지 파일 여러 장에서 텍스트 추출 (한 번의 엔진 호출)
+
+        Args:
+            image_paths (list[str]): 이미지 경로 목록
+
+        Returns:
+            list[str]: 경로 순서대로의 텍스트
+        """
+        return [text.strip() for text in self.engine.recognize_files(list(image_paths))]
+
     def convert_to_html(self, image_path):
         # 이미지 전처리
         image = self.preprocess_image(image_path)
-        
+
         # 텍스트 추출
         extracted_text = self.extract_text_from_image(image)
-        
+        return self.text_to_html(extracted_text)
+
+    def convert_many(self, image_paths):
+        """이미지 파일 여러 장을 HTML로 변환
+
+        Args:
+            image_paths (list[str]): 이미지 경로 목록
+
+        Returns:
+            list[str]: 경로 순서대로의 HTML
+        """
+        return [self.text_to_html(text) for text in self.extract_texts(image_paths)]
+
+    def text_to_html(self, extracted_text):
+        """추출한 텍스트를 HTML 문서로 변환"""
         # 줄바꿈 처리
         text_blocks = extracted_text.split('\n\n')
         formatted_text = ''
         for block in text_blocks:
             if block.strip():
                 formatted_text += f'<p>{block.replace(chr(10), "<br>")}</p>\n'
-        
+
         # HTML 형식으로 변환
         html_content = f"""
         <!DOCTYPE html>
@@ -71,5 +200,99 @@ class ImageToHtmlConverter:
         </body>
         </html>
         """
-        
-        return html_content 
\ No newline at end of file
+
+        return html_content
+
+    def close(self):
+        """엔진 해제"""
+        self.engine.close()
+
+def _init_worker(converter_factory):
+    """워커 프로세스 초기화 (변환기와 Tesseract 엔진 생성)"""
+    global _worker_converter
+    # 워커끼리 CPU 코어를 나눠 쓰도록 Tesseract 내부 스레드는 하나만 사용
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _worker_converter = converter_factory()
+
+def _convert_batch(image_paths):
+    """이미지 묶음을 변환 (워커 프로세스에서 실행)
+
+    Returns:
+        list[tuple]: (이미지 경로, HTML, 오류 메시지) 목록
+    """
+    try:
+        return [(path, html, None) for path, html in zip(image_paths, _worker_converter.convert_many(image_paths))]
+    except Exception:
+        pass
+    # 묶음 중 문제가 있는 이미지만 실패로 남기도록 한 장씩 다시 변환
+    results = []
+    for path in image_paths:
+        try:
+            results.append((path, _worker_converter.convert_many([path])[0], None))
+        except Exception as e:
+            results.append((path, None, str(e)))
+    return results
+
+def convert_directory(directory="saved_notes", workers=None, batch_size=8, converter_factory=ImageToHtmlConverter):
+    """디렉토리의 PNG 이미지를 프로세스 풀에서 HTML로 변환
+
+    동시에 처리 중인 묶음을 워커 수의 두 배로 제한해 메모리 사용량을 일정하게
+    유지하고, 결과는 끝나는 대로 하나씩 반환합니다 (순서는 보장하지 않음).
+
+    Args:
+        directory (str): 이미지 디렉토리
+        workers (int): 워커 프로세스 수 (None이면 CPU 코어 수)
+        batch_size (int): 워커에 한 번에 넘길 이미지 수
+        converter_factory (callable): 워커에서 변환기를 만드는 함수 (피클 가능해야 함)
+
+    Yields:
+        tuple: (이미지 경로, HTML, 오류 메시지) - 실패하면 HTML은 None
+    """
+    image_paths = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.lower().endswith(".png")
+    )
+    batches = iter([image_paths[i:i + batch_size] for i in range(0, len(image_paths), batch_size)])
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(converter_factory,)
+    )
+    try:
+        pending = set()
+        while True:
+            while len(pending) < workers * 2:
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                pending.add(pool.submit(_convert_batch, batch))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def main():
+    """디렉토리 일괄 변환 실행"""
+    parser = argparse.ArgumentParser(description='MarkUpNote 이미지 일괄 HTML 변환')
+    parser.add_argument('directory', nargs='?', default='saved_notes', help='이미지 디렉토리')
+    parser.add_argument('--output', default=None, help='HTML 저장 디렉토리 (기본값: <directory>/ocr)')
+    parser.add_argument('--workers', type=int, default=None, help='워커 프로세스 수')
+    parser.add_argument('--batch-size', type=int, default=8, help='워커에 한 번에 넘길 이미지 수')
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.directory, "ocr")
+    for image_path, html_content, error in convert_directory(args.directory, args.workers, args.batch_size):
+        if error is not None:
+            print(f"변환 실패: {image_path} ({error})")
+            continue
+        html_path = os.path.join(output, os.path.splitext(os.path.basename(image_path))[0] + ".html")
+        atomic_write(html_path, html_content)
+        print(f"변환 완료: {image_path} -> {html_path}")
+
+if __name__ == "__main__":
+    main()
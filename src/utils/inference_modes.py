@@ -0,0 +1,190 @@
+import argparse
+import contextlib
+import time
+
+from .telemetry import logger
+
+# 선택 가능한 CPU 추론 모드
+#   fp32: 기본 정밀도
+#   int8: Linear 레이어 동적 int8 양자화
+#   bf16: bfloat16 autocast (CPU가 지원하는 경우)
+INFERENCE_MODES = ("fp32", "int8", "bf16")
+
+def bf16_supported():
+    """CPU가 bfloat16 연산을 하드웨어로 지원하는지 확인
+
+    Returns:
+        bool: 지원 여부
+    """
+    import torch
+
+    check = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    if check is not None:
+        try:
+            if check():
+                return True
+        except Exception:
+            pass
+    try:
+        with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+            flags = f.read()
+        return "avx512_bf16" in flags or "amx_bf16" in flags
+    except OSError:
+        return False
+
+def resolve_inference_mode(mode, device):
+    """요청한 모드를 현재 환경에서 사용 가능한 모드로 변환
+
+    Args:
+        mode (str): 요청한 추론 모드
+        device (str): 연산 장치 ('cpu' 또는 'cuda')
+
+    Returns:
+        str: 실제로 사용할 추론 모드
+    """
+    if mode not in INFERENCE_MODES:
+        raise ValueError(f"알 수 없는 추론 모드: {mode}")
+    if mode != "fp32" and device != "cpu":
+        logger.warning("%s 모드는 CPU 전용이므로 fp32로 실행합니다.", mode)
+        return "fp32"
+    if mode == "bf16" and not bf16_supported():
+        logger.warning("CPU가 bf16을 지원하지 않아 fp32로 실행합니다.")
+        return "fp32"
+    return mode
+
+def apply_inference_mode(model, mode):
+    """모델에 추론 모드 적용
+
+    Args:
+        model (torch.nn.Module): fp32 모델
+        mode (str): resolve_inference_mode로 확인된 추론 모드
+
+    Returns:
+        torch.nn.Module: 추론에 사용할 모델
+    """
+    import torch
+
+    if mode == "int8":
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+def inference_context(mode):
+    """generate 호출을 감쌀 컨텍스트
+
+    Args:
+        mode (str): 추론 모드
+
+    Returns:
+        contextlib.AbstractContextManager: bf16이면 autocast, 아니면 빈 컨텍스트
+    """
+    if mode == "bf16":
+        import torch
+        return torch.autocast("cpu", dtype=torch.bfloat16)
+    return contextlib.nullcontext()
+
+def character_error_rate(reference, hypothesis):
+    """문자 오류율(CER) 계산
+
+    Args:
+        reference (str): 기준 텍스트
+        hypothesis (str): 비교할 텍스트
+
+    Returns:
+        float: 편집 거리 / 기준 텍스트 길이
+    """
+    reference = reference or ""
+    hypothesis = hypothesis or ""
+    if not reference:
+        return 0.0 if not hypothesis else 1.0
+
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_char in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_char in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_char != hyp_char)
+            ))
+        previous = current
+    return previous[-1] / len(reference)
+
+def compare_inference_modes(images, modes=INFERENCE_MODES, tolerance=0.02, processor_factory=None):
+    """추론 모드별 정확도/지연 시간 비교
+
+    fp32 결과를 기준으로 각 모드의 평균 CER과 이미지당 지연 시간을 측정합니다.
+    결과 캐시의 영향을 받지 않도록 전처리된 이미지를 직접 인식합니다.
+
+    Args:
+        images (list[PIL.Image]): 비교에 사용할 이미지
+        modes (tuple[str]): 비교할 추론 모드
+        tolerance (float): 허용할 최대 평균 CER
+        processor_factory (callable): inference_mode 인자를 받아 처리기를 생성하는 함수
+
+    Returns:
+        dict: 모드별 {"latency_ms", "cer", "within_tolerance"} 결과
+    """
+    if processor_factory is None:
+        from .text_processor import TextProcessor
+        processor_factory = TextProcessor
+
+    modes = ["fp32"] + [mode for mode in modes if mode != "fp32"]
+    reference = None
+    report = {}
+    for mode in modes:
+        processor = processor_factory(inference_mode=mode)
+        if processor.inference_mode != mode:
+            logger.warning("%s 모드를 사용할 수 없어 비교에서 제외합니다.", mode)
+            continue
+        preprocessed = [processor.preprocess_image(image) for image in images]
+
+        processor.recognize_texts(preprocessed[:1])  # 워밍업
+        start = time.perf_counter()
+        texts = processor.recognize_texts(preprocessed)
+        elapsed = time.perf_counter() - start
+
+        if reference is None:
+            reference = texts
+        cer = sum(character_error_rate(ref, hyp) for ref, hyp in zip(reference, texts)) / max(1, len(texts))
+        report[mode] = {
+            "latency_ms": elapsed * 1000 / max(1, len(images)),
+            "cer": cer,
+            "within_tolerance": cer <= tolerance,
+        }
+        del processor
+    return report
+
+def select_fastest_mode(report):
+    """허용 오차 안에서 가장 빠른 추론 모드 선택
+
+    Args:
+        report (dict): compare_inference_modes 결과
+
+    Returns:
+        str: 추론 모드 이름
+    """
+    candidates = [mode for mode, result in report.items() if result["within_tolerance"]]
+    if not candidates:
+        return "fp32"
+    return min(candidates, key=lambda mode: report[mode]["latency_ms"])
+
+def main():
+    """추론 모드 비교 실행"""
+    from PIL import Image
+
+    parser = argparse.ArgumentParser(description='TrOCR 추론 모드 정확도/지연 시간 비교')
+    parser.add_argument('images', nargs='+', help='비교에 사용할 이미지 경로')
+    parser.add_argument('--tolerance', type=float, default=0.02, help='허용할 최대 평균 CER')
+    args = parser.parse_args()
+
+    images = [Image.open(path).convert("RGB") for path in args.images]
+    report = compare_inference_modes(images, tolerance=args.tolerance)
+
+    print(f"\n{'모드':<6} {'지연(ms/이미지)':>16} {'CER':>8}  허용")
+    for mode, result in report.items():
+        mark = "O" if result["within_tolerance"] else "X"
+        print(f"{mode:<6} {result['latency_ms']:>16.1f} {result['cer']:>8.3f}  {mark}")
+    print(f"\n권장 모드: {select_fastest_mode(report)} (MARKUPNOTE_OCR_INFERENCE_MODE로 설정)")
+
+if __name__ == "__main__":
+    main()
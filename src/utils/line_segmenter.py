@@ -0,0 +1,105 @@
+import numpy as np
+
+def otsu_threshold(gray):
+    """Otsu 방법으로 이진화 임계값 계산
+
+    Args:
+        gray (np.ndarray): uint8 그레이스케일 배열
+
+    Returns:
+        int: 임계값 (이 값 이하를 잉크로 간주)
+    """
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    total = hist.sum()
+    if total == 0:
+        return 127
+    levels = np.arange(256)
+    weight_bg = np.cumsum(hist)
+    weight_fg = total - weight_bg
+    cumulative_mean = np.cumsum(hist * levels)
+    global_mean = cumulative_mean[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_bg = cumulative_mean / weight_bg
+        mean_fg = (global_mean - cumulative_mean) / weight_fg
+        variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    variance = np.nan_to_num(variance)
+    return int(np.argmax(variance))
+
+def ink_mask(image):
+    """이미지에서 잉크(글씨) 픽셀 마스크 생성
+
+    Args:
+        image (PIL.Image): 입력 이미지
+
+    Returns:
+        np.ndarray: 잉크 위치가 True인 2차원 bool 배열
+    """
+    gray = np.asarray(image.convert("L"))
+    threshold = otsu_threshold(gray)
+    # 거의 단색인 이미지는 Otsu 임계값이 의미 없으므로 잉크 없음으로 처리
+    if int(gray.max()) - int(gray.min()) < 32:
+        return np.zeros(gray.shape, dtype=bool)
+    return gray <= threshold
+
+def find_line_bands(mask, min_gap=None, min_height=3):
+    """가로 투영 프로파일로 텍스트 줄의 세로 범위 찾기
+
+    Args:
+        mask (np.ndarray): 잉크 마스크
+        min_gap (int): 이보다 좁은 빈 줄 간격은 같은 줄로 합침
+            (None이면 줄 높이 중앙값의 1/4)
+        min_height (int): 이보다 낮은 띠는 잡음으로 보고 제거
+
+    Returns:
+        list[tuple[int, int]]: 각 줄의 (top, bottom) 범위 (bottom은 포함하지 않음)
+    """
+    profile = mask.sum(axis=1)
+    rows = profile > 0
+    if not rows.any():
+        return []
+
+    # 잉크가 있는 연속 구간 찾기
+    padded = np.concatenate(([False], rows, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    bands = list(zip(edges[0::2], edges[1::2]))
+
+    if min_gap is None:
+        heights = [bottom - top for top, bottom in bands]
+        min_gap = max(2, int(np.median(heights)) // 4)
+
+    # 점, 획 사이의 좁은 틈으로 나뉜 구간은 하나의 줄로 병합
+    merged = [list(bands[0])]
+    for top, bottom in bands[1:]:
+        if top - merged[-1][1] < min_gap:
+            merged[-1][1] = bottom
+        else:
+            merged.append([top, bottom])
+
+    return [(int(top), int(bottom)) for top, bottom in merged if bottom - top >= min_height]
+
+def segment_lines(image, padding=4):
+    """선택 영역 이미지를 텍스트 줄 단위 이미지로 분할
+
+    각 줄은 잉크가 있는 가로 범위로 잘라내므로 여백이 큰 선택 영역도
+    작은 이미지로 줄어듭니다.
+
+    Args:
+        image (PIL.Image): 입력 이미지
+        padding (int): 잘라낸 줄 주위에 남길 여백(픽셀)
+
+    Returns:
+        list[PIL.Image]: 위에서 아래 순서의 줄 이미지 (잉크가 없으면 빈 리스트)
+    """
+    mask = ink_mask(image)
+    lines = []
+    for top, bottom in find_line_bands(mask):
+        columns = np.flatnonzero(mask[top:bottom].any(axis=0))
+        left, right = columns[0], columns[-1] + 1
+        box = (
+            max(0, int(left) - padding),
+            max(0, top - padding),
+            min(image.width, int(right) + padding),
+            min(image.height, bottom + padding),
+        )
+        lines.append(image.crop(box))
+    return lines
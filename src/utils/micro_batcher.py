@@ -0,0 +1,97 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+class MicroBatcher:
+    """짧은 시간 안에 들어온 요청을 하나의 배치로 묶어 처리하는 큐
+
+    submit()으로 들어온 항목은 전용 스레드에서 모이며, 첫 항목이 도착한 뒤
+    max_delay초가 지나거나 max_batch_size개가 모이면 process_batch로 한 번에
+    전달됩니다. 각 요청은 concurrent.futures.Future로 결과를 받습니다.
+
+    Attributes:
+        process_batch (callable): 항목 리스트를 받아 같은 길이의 결과 리스트를 반환하는 함수
+        max_batch_size (int): 한 배치의 최대 항목 수
+        max_delay (float): 배치를 모으는 최대 대기 시간(초)
+    """
+
+    def __init__(self, process_batch, max_batch_size=8, max_delay=0.005):
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_delay = max_delay
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()  # 종료 신호 뒤에 요청이 들어가지 않도록 _closed 확인과 put을 묶음
+        self._thread = threading.Thread(target=self._run, name="ocr-micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, item):
+        """항목을 큐에 추가
+
+        Args:
+            item: 처리할 항목
+
+        Returns:
+            Future: 처리 결과를 담을 Future
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("이미 종료된 배치 큐입니다.")
+            self._queue.put((item, future))
+        return future
+
+    def close(self):
+        """남은 요청을 처리한 뒤 작업 스레드 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first):
+        """첫 항목 이후 max_delay 동안 도착한 항목을 모아 배치 구성"""
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is None:
+                # 종료 신호는 현재 배치 처리 후 반영
+                self._queue.put(None)
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            batch = self._collect(entry)
+
+            # 취소된 요청은 배치에서 제외
+            batch = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            try:
+                results = list(self.process_batch([item for item, _ in batch]))
+                if len(results) != len(batch):
+                    # 결과가 모자라면 어느 요청의 결과인지 알 수 없으므로 배치 전체를 실패 처리
+                    # (그대로 짝지으면 남은 Future가 영원히 완료되지 않음)
+                    raise RuntimeError(f"배치 처리 결과 수가 맞지 않습니다: 요청 {len(batch)}개, 결과 {len(results)}개")
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
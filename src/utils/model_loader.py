@@ -0,0 +1,155 @@
+import argparse
+import glob
+import importlib.util
+import os
+import time
+
+from .telemetry import logger
+
+# Hugging Face 캐시 위치 (HF_HOME 기준)
+HF_HOME = os.environ.get("HF_HOME", os.path.join(os.path.expanduser("~"), ".cache", "huggingface"))
+TOKEN_PATH = os.path.join("util", "access_token", "token")
+
+def read_auth_token(path=TOKEN_PATH):
+    """Hugging Face 토큰 파일 읽기
+
+    Args:
+        path (str): 토큰 파일 경로
+
+    Returns:
+        str: ASCII 문자만 남긴 토큰 (파일이 없으면 None)
+    """
+    try:
+        with open(path, "r", encoding='utf-8') as f:
+            auth_token = f.read().strip()
+    except FileNotFoundError:
+        return None
+    # ASCII 문자만 허용
+    return ''.join(c for c in auth_token if ord(c) < 128) or None
+
+def _cache_roots():
+    """모델 스냅샷을 찾을 캐시 디렉토리 후보"""
+    roots = [os.environ.get("HUGGINGFACE_HUB_CACHE"), os.path.join(HF_HOME, "hub"), HF_HOME]
+    return [root for root in roots if root]
+
+def resolve_snapshot_dir(model_id, revision=None):
+    """로컬에 저장된 모델 스냅샷 디렉토리 찾기
+
+    MARKUPNOTE_MODEL_DIR이 지정되어 있으면 그 디렉토리를 사용하고, 아니면 Hugging Face
+    캐시에서 revision(브랜치 이름 또는 커밋 해시)에 고정된 스냅샷을 찾습니다.
+
+    Args:
+        model_id (str): 모델 식별자 (예: "microsoft/trocr-base-handwritten")
+        revision (str): 고정할 리비전 (None이면 MARKUPNOTE_MODEL_REVISION 또는 "main")
+
+    Returns:
+        str: config.json이 있는 스냅샷 디렉토리 (없으면 None)
+    """
+    explicit = os.environ.get("MARKUPNOTE_MODEL_DIR")
+    if explicit:
+        return explicit if os.path.isfile(os.path.join(explicit, "config.json")) else None
+
+    revision = revision or os.environ.get("MARKUPNOTE_MODEL_REVISION", "main")
+    repo_dir_name = "models--" + model_id.replace("/", "--")
+    for root in _cache_roots():
+        repo_dir = os.path.join(root, repo_dir_name)
+        ref_path = os.path.join(repo_dir, "refs", revision)
+        if os.path.isfile(ref_path):
+            with open(ref_path, "r", encoding="utf-8") as f:
+                commit = f.read().strip()
+        else:
+            commit = revision  # 커밋 해시로 직접 고정한 경우
+        snapshot = os.path.join(repo_dir, "snapshots", commit)
+        if os.path.isfile(os.path.join(snapshot, "config.json")):
+            return snapshot
+    return None
+
+def load_model_components(model_id, allow_network=False, revision=None):
+    """TrOCR 프로세서와 모델을 오프라인 우선으로 로드
+
+    로컬 스냅샷이 있으면 네트워크를 전혀 사용하지 않고 디렉토리에서 직접 로드합니다.
+    safetensors 가중치가 있으면 메모리 매핑으로 읽습니다.
+
+    Args:
+        model_id (str): 모델 식별자
+        allow_network (bool): 로컬 스냅샷이 없을 때 Hugging Face Hub에서 내려받을지 여부
+        revision (str): 고정할 리비전
+
+    Returns:
+        tuple: (processor, model, timings) - timings는 구성 요소별 로딩 시간(초)
+    """
+    from transformers import TrOCRProcessor, VisionEncoderDecoderModel
+
+    timings = {}
+    start = time.perf_counter()
+    snapshot = resolve_snapshot_dir(model_id, revision)
+    timings["resolve"] = time.perf_counter() - start
+
+    if snapshot:
+        logger.info("로컬 스냅샷에서 모델 로드: %s", snapshot)
+        source = snapshot
+        options = {"local_files_only": True}
+        has_safetensors = bool(glob.glob(os.path.join(snapshot, "*.safetensors")))
+    elif allow_network:
+        logger.info("로컬 스냅샷이 없어 Hugging Face Hub에서 내려받습니다: %s", model_id)
+        source = model_id
+        options = {"token": read_auth_token(), "revision": revision or os.environ.get("MARKUPNOTE_MODEL_REVISION", "main")}
+        has_safetensors = False
+    else:
+        raise FileNotFoundError(
+            f"로컬에 {model_id} 스냅샷이 없습니다. "
+            "'python -m src.utils.model_loader --download'로 내려받거나 "
+            "MARKUPNOTE_ALLOW_NETWORK=1 로 네트워크 사용을 허용하세요."
+        )
+
+    start = time.perf_counter()
+    processor = TrOCRProcessor.from_pretrained(source, **options)
+    timings["processor"] = time.perf_counter() - start
+
+    model_options = dict(options)
+    if has_safetensors:
+        model_options["use_safetensors"] = True
+    if importlib.util.find_spec("accelerate") is not None:
+        # 무작위 초기화 없이 가중치를 바로 채워 넣음
+        model_options["low_cpu_mem_usage"] = True
+
+    start = time.perf_counter()
+    model = VisionEncoderDecoderModel.from_pretrained(source, **model_options)
+    timings["model"] = time.perf_counter() - start
+
+    return processor, model, timings
+
+def download_snapshot(model_id, revision=None):
+    """모델 스냅샷을 Hugging Face 캐시에 내려받기
+
+    Args:
+        model_id (str): 모델 식별자
+        revision (str): 내려받을 리비전
+
+    Returns:
+        str: 스냅샷 디렉토리
+    """
+    from huggingface_hub import snapshot_download
+
+    return snapshot_download(
+        model_id,
+        revision=revision or os.environ.get("MARKUPNOTE_MODEL_REVISION", "main"),
+        token=read_auth_token()
+    )
+
+def main():
+    """모델 스냅샷 확인/다운로드"""
+    from .text_processor import MODEL_ID
+
+    parser = argparse.ArgumentParser(description='TrOCR 모델 스냅샷 관리')
+    parser.add_argument('--download', action='store_true', help='스냅샷 내려받기')
+    parser.add_argument('--revision', default=None, help='고정할 리비전 (브랜치 또는 커밋 해시)')
+    args = parser.parse_args()
+
+    if args.download:
+        print(f"내려받은 스냅샷: {download_snapshot(MODEL_ID, args.revision)}")
+    snapshot = resolve_snapshot_dir(MODEL_ID, args.revision)
+    print(f"사용할 스냅샷: {snapshot or '없음'}")
+
+if __name__ == "__main__":
+    main()
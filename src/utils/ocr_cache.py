@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from .telemetry import logger
+
+# 영구 캐시 기본 위치 (Hugging Face 캐시 디렉토리 하위)
+DEFAULT_DISK_DIR = os.path.join(
+    os.environ.get("HF_HOME", os.path.join(os.path.expanduser("~"), ".cache", "huggingface")),
+    "markupnote",
+    "ocr-cache"
+)
+
+def normalize_crop(image, threshold=250):
+    """캐시 키 계산용으로 선택 영역을 정규화
+
+    그레이스케일로 바꾼 뒤 잉크가 있는 영역만 남겨, 같은 글씨를 조금 다른
+    크기의 사각형으로 다시 선택해도 같은 결과가 나오도록 합니다.
+
+    Args:
+        image (PIL.Image): 선택 영역 이미지
+        threshold (int): 이 값보다 어두운 픽셀을 잉크로 간주
+
+    Returns:
+        PIL.Image: 정규화된 그레이스케일 이미지
+    """
+    gray = image.convert("L")
+    ink = gray.point(lambda value: 255 if value < threshold else 0)
+    bbox = ink.getbbox()
+    return gray.crop(bbox) if bbox else gray.resize((1, 1))
+
+def make_cache_key(image, model_id, params=None):
+    """이미지 내용, 모델, 생성 파라미터로 캐시 키 생성
+
+    Args:
+        image (PIL.Image): 선택 영역 이미지
+        model_id (str): 모델 식별자
+        params (dict): 생성 파라미터
+
+    Returns:
+        str: SHA-256 해시 문자열
+    """
+    normalized = normalize_crop(image)
+    digest = hashlib.sha256()
+    digest.update(f"{normalized.width}x{normalized.height}".encode("ascii"))
+    digest.update(normalized.tobytes())
+    digest.update(model_id.encode("utf-8"))
+    digest.update(json.dumps(params or {}, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+class OcrResultCache:
+    """OCR 결과 캐시
+
+    메모리에는 최대 max_entries개의 결과를 LRU로 유지하고, disk_dir가 주어지면
+    결과를 파일로도 저장해 프로세스를 다시 시작해도 재사용합니다.
+
+    Attributes:
+        max_entries (int): 메모리 캐시 최대 항목 수
+        disk_dir (str): 영구 캐시 디렉토리 (None이면 사용 안 함)
+        hits (int): 캐시 적중 횟수 (메모리 + 디스크)
+        disk_hits (int): 디스크 캐시 적중 횟수
+        misses (int): 캐시 미스 횟수
+    """
+
+    def __init__(self, max_entries=256, disk_dir=None):
+        self.max_entries = max(1, int(max_entries))
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key[:2], f"{key}.txt")
+
+    def get(self, key):
+        """캐시된 결과 조회
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            str: 캐시된 텍스트 (없으면 None)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        text = self._read_disk(key)
+        with self._lock:
+            if text is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store(key, text)
+        return text
+
+    def put(self, key, text):
+        """결과 저장
+
+        Args:
+            key (str): 캐시 키
+            text (str): 인식된 텍스트
+        """
+        with self._lock:
+            self._store(key, text)
+        self._write_disk(key, text)
+
+    def _store(self, key, text):
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key, text):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체하여 다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록 함
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("OCR 캐시 저장 실패: %s", e)
+
+    def clear(self):
+        """메모리 캐시와 통계 초기화 (디스크 캐시는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """모니터링용 캐시 통계
+
+        Returns:
+            dict: 적중/미스 횟수, 적중률, 현재 항목 수
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
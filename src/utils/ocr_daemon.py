@@ -0,0 +1,404 @@
+"""여러 MarkUpNote 프로세스가 공유하는 로컬 OCR 데몬
+
+데몬은 Unix 소켓으로 요청을 받고, TrOCR 모델을 한 번만 로드한 워커 프로세스
+풀에서 인식을 수행합니다. 이미지 데이터는 multiprocessing.shared_memory로
+전달되며 소켓에는 공유 메모리 이름과 배열 형태만 담긴 한 줄짜리 JSON이 오갑니다.
+
+실행:
+    python -m src.utils.ocr_daemon --workers 2
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from PIL import Image
+
+from .micro_batcher import MicroBatcher
+from .telemetry import logger, telemetry
+from .decoding import make_generation_params, update_generation_params
+from .text_processor import DEFAULT_MAX_NEW_TOKENS, DEFAULT_NUM_BEAMS, OCR_ERROR_PREFIX
+
+DEFAULT_SOCKET_PATH = os.environ.get(
+    "MARKUPNOTE_OCR_SOCKET",
+    os.path.join(tempfile.gettempdir(), f"markupnote-ocr-{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+)
+
+# 워커 프로세스마다 하나씩 생성되는 처리기
+_worker_processor = None
+
+def _init_worker(processor_factory, num_threads):
+    """워커 프로세스 초기화 (모델 로드)"""
+    global _worker_processor
+    if num_threads:
+        import torch
+        torch.set_num_threads(num_threads)
+    _worker_processor = processor_factory()
+
+def _load_shared(items):
+    """공유 메모리에 담긴 이미지들을 PIL 이미지로 복사 (워커 프로세스에서 실행)
+
+    Args:
+        items (list[dict]): 공유 메모리 이름(shm), 형태(shape), 자료형(dtype) 목록
+
+    Returns:
+        list[PIL.Image]: 이미지 목록
+    """
+    images = []
+    for item in items:
+        shm = shared_memory.SharedMemory(name=item["shm"])
+        try:
+            # 공유 메모리의 소유자는 클라이언트이므로 워커 종료 시 해제되지 않도록 추적 해제
+            # (POSIX에서 추적기는 공개 이름 앞에 "/"를 붙인 이름으로 등록함)
+            resource_tracker.unregister("/" + shm.name, "shared_memory")
+            array = np.ndarray(tuple(item["shape"]), dtype=item["dtype"], buffer=shm.buf)
+            images.append(Image.fromarray(array.copy()))
+            del array
+        finally:
+            shm.close()
+    return images
+
+def _apply_generation_params(generation_params):
+    """요청에 담긴 클라이언트의 디코딩 설정을 워커 처리기에 적용
+
+    워커 프로세스는 한 번에 요청 하나만 처리하므로 요청마다 바꿔 써도 안전하며,
+    캐시 키에 설정이 포함되어 다른 설정의 결과와 섞이지 않습니다.
+    """
+    if generation_params is not None:
+        _worker_processor.generation_params = generation_params
+
+def _recognize_shared(items, generation_params=None):
+    """한 줄짜리 이미지들을 배치로 인식 (워커 프로세스에서 실행)
+
+    Returns:
+        list[str]: 이미지별 인식 결과
+    """
+    _apply_generation_params(generation_params)
+    return _worker_processor.process_images(_load_shared(items))
+
+def _recognize_pages_shared(items, generation_params=None):
+    """선택 영역 이미지들을 줄 분할과 결과 캐시를 거쳐 인식 (워커 프로세스에서 실행)
+
+    Returns:
+        list[str]: 이미지별 인식 결과 (여러 줄은 줄바꿈으로 연결)
+    """
+    _apply_generation_params(generation_params)
+    return [_worker_processor.process_image(image) for image in _load_shared(items)]
+
+# 요청 종류별 워커 함수
+_RECOGNIZERS = {
+    "ocr": _recognize_shared,
+    "ocr_page": _recognize_pages_shared,
+}
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """한 줄에 하나의 JSON 요청을 처리하는 핸들러"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                response = self.server.ocr_daemon.handle_request(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class OcrDaemon:
+    """OCR 워커 프로세스 풀을 소유하는 Unix 소켓 서버
+
+    Attributes:
+        socket_path (str): 요청을 받을 소켓 경로
+        workers (int): 워커 프로세스 수
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, workers=1, processor_factory=None, num_threads=None):
+        if processor_factory is None:
+            from .text_processor import TextProcessor
+            processor_factory = TextProcessor
+
+        self.socket_path = socket_path
+        self.workers = max(1, int(workers))
+        if num_threads is None:
+            # 워커끼리 CPU 코어를 나눠 쓰도록 torch 스레드 수 제한 (0이면 설정하지 않음)
+            num_threads = max(1, (os.cpu_count() or 1) // self.workers)
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(processor_factory, num_threads)
+        )
+        self.server = None
+
+    def handle_request(self, request):
+        """요청 처리
+
+        Args:
+            request (dict): {"op": "ping"} 또는 {"op": "ocr" | "ocr_page", "items": [...], "generation_params": {...}}
+                ("ocr"은 이미지를 한 줄로 보고 배치 인식, "ocr_page"는 선택 영역을 줄 단위로 나눠 인식,
+                generation_params가 없으면 워커의 디코딩 설정 사용)
+
+        Returns:
+            dict: 응답
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "workers": self.workers}
+        if op in _RECOGNIZERS:
+            texts = self.pool.submit(_RECOGNIZERS[op], request["items"], request.get("generation_params")).result()
+            return {"ok": True, "texts": texts}
+        return {"ok": False, "error": f"알 수 없는 요청: {op}"}
+
+    def serve_forever(self):
+        """소켓을 열고 요청 대기"""
+        if os.path.exists(self.socket_path):
+            if daemon_available(self.socket_path):
+                raise RuntimeError(f"이미 실행 중인 OCR 데몬이 있습니다: {self.socket_path}")
+            os.unlink(self.socket_path)  # 비정상 종료로 남은 소켓 파일
+
+        self.server = _UnixServer(self.socket_path, _RequestHandler)
+        self.server.ocr_daemon = self
+        logger.info("OCR 데몬 시작: %s (워커 %d개)", self.socket_path, self.workers)
+        try:
+            self.server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self):
+        """다른 스레드에서 서버 종료 요청"""
+        if self.server:
+            self.server.shutdown()
+
+    def close(self):
+        """서버와 워커 풀 정리"""
+        if self.server:
+            self.server.server_close()
+            self.server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        self.pool.shutdown(cancel_futures=True)
+
+def daemon_available(socket_path=DEFAULT_SOCKET_PATH, timeout=0.5):
+    """데몬이 실행 중이며 응답하는지 확인
+
+    Args:
+        socket_path (str): 데몬 소켓 경로
+        timeout (float): 응답 대기 시간(초)
+
+    Returns:
+        bool: 사용 가능 여부
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return False
+    try:
+        return OcrDaemonClient(socket_path, timeout=timeout).ping()
+    except (OSError, ValueError):
+        return False
+
+class OcrDaemonClient:
+    """OCR 데몬 클라이언트
+
+    TextProcessor와 같은 process_image / process_images / submit_image /
+    set_decoding / cache_stats 인터페이스와 generation_params 속성을 제공하므로
+    text_processor 핸들이 그대로 사용할 수 있습니다. 디코딩 설정은 요청마다
+    데몬에 함께 보냅니다. 데몬에 연결할 수 없게 되면 fallback_factory로 로컬
+    처리기를 만들어 사용합니다.
+
+    Attributes:
+        socket_path (str): 데몬 소켓 경로
+        timeout (float): 요청 타임아웃(초)
+        generation_params (dict): 디코딩 설정 num_beams, max_new_tokens, early_stopping
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, timeout=120, fallback_factory=None,
+                 max_batch_size=8, batch_delay=0.005):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.fallback_factory = fallback_factory
+        self.max_batch_size = max_batch_size
+        self.batch_delay = batch_delay
+        self.generation_params = make_generation_params(DEFAULT_NUM_BEAMS, DEFAULT_MAX_NEW_TOKENS)
+        self._fallback = None
+        self._lock = threading.Lock()
+        self._batcher = None
+
+    def _request(self, request):
+        """요청 한 건을 보내고 응답 수신"""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            with sock.makefile("rwb") as stream:
+                stream.write(json.dumps(request).encode("utf-8") + b"\n")
+                stream.flush()
+                line = stream.readline()
+        if not line:
+            raise ConnectionError("OCR 데몬이 응답 없이 연결을 종료했습니다.")
+        return json.loads(line)
+
+    def ping(self):
+        """데몬 응답 확인"""
+        return bool(self._request({"op": "ping"}).get("ok"))
+
+    def _get_fallback(self):
+        with self._lock:
+            if self._fallback is None:
+                if self.fallback_factory is None:
+                    return None
+                logger.warning("OCR 데몬에 연결할 수 없어 로컬 처리기로 전환합니다.")
+                self._fallback = self.fallback_factory()
+                self._fallback.generation_params = self.generation_params
+            return self._fallback
+
+    def set_decoding(self, strategy=None, num_beams=None, max_new_tokens=None, early_stopping=None):
+        """디코딩 설정 변경 (이후 데몬 요청에 적용, TextProcessor.set_decoding 참고)"""
+        self.generation_params = update_generation_params(
+            self.generation_params, strategy, num_beams, max_new_tokens, early_stopping
+        )
+        if self._fallback is not None:
+            self._fallback.generation_params = self.generation_params
+
+    def cache_stats(self):
+        """결과 캐시 통계
+
+        데몬 워커의 캐시는 프로세스마다 따로 있어 하나로 합칠 수 없으므로,
+        로컬 처리기로 전환한 경우에만 통계를 돌려줍니다.
+
+        Returns:
+            dict: 로컬 처리기의 캐시 통계 (데몬을 사용 중이면 None)
+        """
+        if self._fallback is None:
+            return None
+        return self._fallback.cache_stats()
+
+    def process_image(self, image):
+        """선택 영역 이미지를 텍스트로 변환
+
+        여러 줄이 담긴 영역도 데몬 워커의 process_image가 줄 단위로 나눠 인식합니다.
+
+        Args:
+            image (PIL.Image): 처리할 이미지
+
+        Returns:
+            str: 변환된 텍스트 또는 오류 메시지
+        """
+        if image is None:
+            logger.warning("이미지가 선택되지 않았습니다.")
+            return None
+        if self._fallback is not None:
+            return self._fallback.process_image(image)
+        texts = self._recognize("ocr_page", [image])
+        if texts is None:
+            return self._fallback.process_image(image)
+        return texts[0]
+
+    def process_images(self, images):
+        """여러 한 줄짜리 이미지를 데몬에서 한 번에 텍스트로 변환
+
+        Args:
+            images (list[PIL.Image]): 처리할 이미지 리스트
+
+        Returns:
+            list[str]: 이미지별 변환 결과
+        """
+        if self._fallback is not None:
+            return self._fallback.process_images(images)
+        texts = self._recognize("ocr", images)
+        if texts is None:
+            return self._fallback.process_images(images)
+        return texts
+
+    def _recognize(self, op, images):
+        """공유 메모리로 이미지를 넘겨 데몬에 인식 요청
+
+        Args:
+            op (str): 요청 종류 ("ocr" 또는 "ocr_page")
+            images (list[PIL.Image]): 처리할 이미지 리스트 (None은 건너뜀)
+
+        Returns:
+            list[str]: 이미지별 결과 (데몬을 쓸 수 없어 로컬 처리기로 전환했으면 None)
+        """
+        results = [None] * len(images)
+        indices = [i for i, image in enumerate(images) if image is not None]
+        if not indices:
+            return results
+
+        segments = []
+        try:
+            items = []
+            for i in indices:
+                array = np.ascontiguousarray(np.asarray(images[i].convert("RGB")))
+                shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+                segments.append(shm)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+                items.append({"shm": shm.name, "shape": list(array.shape), "dtype": array.dtype.str})
+
+            with telemetry.span("daemon_request"):
+                response = self._request({"op": op, "items": items, "generation_params": self.generation_params})
+            if response.get("ok") and len(response.get("texts") or ()) != len(indices):
+                # 결과가 모자라면 어느 이미지의 결과인지 알 수 없음
+                raise ValueError(f"OCR 데몬 응답 결과 수가 맞지 않습니다: 요청 {len(indices)}개, "
+                                 f"결과 {len(response.get('texts') or ())}개")
+        except (OSError, ValueError) as e:  # 연결 실패 또는 깨진 응답
+            if self._get_fallback() is None:
+                raise
+            logger.warning("OCR 데몬 요청 실패: %s", e)
+            return None
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+        if not response.get("ok"):
+            message = f"{OCR_ERROR_PREFIX}{response.get('error')}"
+            for i in indices:
+                results[i] = message
+            return results
+
+        for i, text in zip(indices, response["texts"]):
+            results[i] = text
+        return results
+
+    def submit_image(self, image):
+        """마이크로 배치 큐에 이미지 인식 요청
+
+        Args:
+            image (PIL.Image): 처리할 이미지
+
+        Returns:
+            concurrent.futures.Future: 변환된 텍스트를 담을 Future
+        """
+        with self._lock:
+            if self._batcher is None:
+                self._batcher = MicroBatcher(
+                    self.process_images,
+                    max_batch_size=self.max_batch_size,
+                    max_delay=self.batch_delay
+                )
+        return self._batcher.submit(image)
+
+def main():
+    """OCR 데몬 실행"""
+    parser = argparse.ArgumentParser(description='MarkUpNote OCR 데몬')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='Unix 소켓 경로')
+    parser.add_argument('--workers', type=int, default=1, help='워커 프로세스 수')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    daemon = OcrDaemon(args.socket, workers=args.workers)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
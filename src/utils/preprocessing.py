@@ -0,0 +1,174 @@
+import time
+
+import numpy as np
+from PIL import Image
+
+from .telemetry import telemetry
+
+# 전처리 단계 함수들 (모두 numpy 배열을 받아 numpy 배열을 반환)
+# cv2는 import 비용이 크므로 각 함수 안에서 import
+
+def ensure_rgb(array):
+    """RGBA/그레이스케일 배열을 RGB로 변환"""
+    import cv2
+
+    if array.ndim == 2:
+        return cv2.cvtColor(array, cv2.COLOR_GRAY2RGB)
+    if array.shape[-1] == 4:
+        return cv2.cvtColor(array, cv2.COLOR_RGBA2RGB)
+    return array
+
+def upscale(array, scale_factor=2):
+    """텍스트가 더 선명해지도록 이미지 확대"""
+    import cv2
+
+    height, width = array.shape[:2]
+    size = (int(width * scale_factor), int(height * scale_factor))
+    return cv2.resize(array, size, interpolation=cv2.INTER_CUBIC)
+
+def denoise(array):
+    """Non-local means 노이즈 제거 (가장 비용이 큰 단계)"""
+    import cv2
+
+    if array.ndim == 3:
+        return cv2.fastNlMeansDenoisingColored(array, None, 10, 10, 7, 21)
+    return cv2.fastNlMeansDenoising(array)
+
+def grayscale(array):
+    """그레이스케일 변환"""
+    import cv2
+
+    if array.ndim == 3:
+        return cv2.cvtColor(array, cv2.COLOR_RGB2GRAY)
+    return array
+
+def adaptive_threshold(array, block_size=11, c=2):
+    """조명이 고르지 않은 이미지를 위한 적응형 이진화"""
+    import cv2
+
+    return cv2.adaptiveThreshold(
+        array,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        block_size,
+        c
+    )
+
+def fixed_threshold(array, threshold=128):
+    """고정 임계값 이진화 (이미 깨끗한 캔버스 잉크용)"""
+    return np.where(array < threshold, 0, 255).astype(np.uint8)
+
+def morphology_close(array, kernel_size=2):
+    """모폴로지 닫힘 연산으로 끊어진 획 연결"""
+    import cv2
+
+    kernel = np.ones((kernel_size, kernel_size), np.uint8)
+    return cv2.morphologyEx(array, cv2.MORPH_CLOSE, kernel)
+
+class PreprocessStage:
+    """전처리 파이프라인의 한 단계
+
+    Attributes:
+        name (str): 단계 이름 (시간 측정 결과의 키)
+        func (callable): 배열을 받아 배열을 반환하는 함수
+        params (dict): func에 전달할 추가 인자
+    """
+
+    def __init__(self, name, func, **params):
+        self.name = name
+        self.func = func
+        self.params = params
+
+    def __call__(self, array):
+        return self.func(array, **self.params)
+
+class PreprocessPipeline:
+    """단계별 시간을 측정하며 전처리 단계를 순서대로 실행하는 파이프라인
+
+    각 단계의 소요 시간은 telemetry의 단계 이름별 히스토그램에도 누적됩니다.
+
+    Attributes:
+        name (str): 프로필 이름
+        stages (list[PreprocessStage]): 실행할 단계 목록
+    """
+
+    def __init__(self, name, stages):
+        self.name = name
+        self.stages = list(stages)
+
+    def run(self, image, timings=None):
+        """전처리 실행
+
+        Args:
+            image (PIL.Image): 입력 이미지
+            timings (dict): 전달되면 단계 이름별 소요 시간(초)을 기록
+
+        Returns:
+            PIL.Image: 전처리된 RGB 이미지
+        """
+        array = np.asarray(image)
+        for stage in self.stages:
+            start = time.perf_counter()
+            array = stage(array)
+            elapsed = time.perf_counter() - start
+            telemetry.record(stage.name, elapsed)
+            if timings is not None:
+                timings[stage.name] = elapsed
+        # 모델 입력은 3채널이어야 함
+        if array.ndim == 2:
+            array = np.stack([array] * 3, axis=-1)
+        return Image.fromarray(array)
+
+# 선택 가능한 전처리 프로필
+PROFILES = {
+    # 스캔/사진 이미지: 기존 전체 파이프라인
+    "photo": PreprocessPipeline("photo", [
+        PreprocessStage("convert", ensure_rgb),
+        PreprocessStage("upscale", upscale, scale_factor=2),
+        PreprocessStage("denoise", denoise),
+        PreprocessStage("grayscale", grayscale),
+        PreprocessStage("threshold", adaptive_threshold, block_size=11, c=2),
+        PreprocessStage("morphology", morphology_close, kernel_size=2),
+    ]),
+    # DrawMode로 그린 잉크: 이미 흑백이고 잡음이 없으므로 확대/노이즈 제거 생략
+    "canvas_ink": PreprocessPipeline("canvas_ink", [
+        PreprocessStage("convert", ensure_rgb),
+        PreprocessStage("grayscale", grayscale),
+        PreprocessStage("threshold", fixed_threshold, threshold=128),
+    ]),
+}
+
+def detect_profile(image, clean_ratio=0.98):
+    """이미지 통계로 적절한 전처리 프로필 추정
+
+    거의 모든 픽셀이 순수한 흰색 또는 검은색이면 캔버스 잉크로 판단합니다.
+
+    Args:
+        image (PIL.Image): 입력 이미지
+        clean_ratio (float): 캔버스 잉크로 판단할 흑백 픽셀 비율
+
+    Returns:
+        str: 프로필 이름 ("canvas_ink" 또는 "photo")
+    """
+    gray = np.asarray(image.convert("L"))
+    if gray.size == 0:
+        return "canvas_ink"
+    extremes = np.count_nonzero((gray <= 16) | (gray >= 239))
+    return "canvas_ink" if extremes / gray.size >= clean_ratio else "photo"
+
+def get_pipeline(profile, image=None):
+    """프로필 이름으로 파이프라인 조회
+
+    Args:
+        profile (str): 프로필 이름 또는 "auto"
+        image (PIL.Image): "auto"일 때 프로필 추정에 사용할 이미지
+
+    Returns:
+        PreprocessPipeline: 전처리 파이프라인
+    """
+    if profile == "auto":
+        profile = detect_profile(image)
+    if profile not in PROFILES:
+        raise ValueError(f"알 수 없는 전처리 프로필: {profile}")
+    return PROFILES[profile]
@@ -0,0 +1,160 @@
+import sys
+
+import numpy as np
+from PIL import Image
+from PyQt5 import sip
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QImage
+
+# 32비트 포맷은 0xAARRGGBB 정수로 저장되므로 바이트 순서가 엔디언에 따라 달라짐
+_ARGB32_ORDER = "BGRA" if sys.byteorder == "little" else "ARGB"
+
+# QImage 포맷별 (픽셀당 바이트 수, 메모리상의 채널 순서)
+PIXEL_LAYOUTS = {
+    QImage.Format.Format_RGB32: (4, _ARGB32_ORDER),
+    QImage.Format.Format_ARGB32: (4, _ARGB32_ORDER),
+    QImage.Format.Format_ARGB32_Premultiplied: (4, _ARGB32_ORDER),
+    QImage.Format.Format_RGBX8888: (4, "RGBA"),
+    QImage.Format.Format_RGBA8888: (4, "RGBA"),
+    QImage.Format.Format_RGBA8888_Premultiplied: (4, "RGBA"),
+    QImage.Format.Format_RGB888: (3, "RGB"),
+    QImage.Format.Format_Grayscale8: (1, "L"),
+}
+
+# 알파를 미리 곱한 포맷과 같은 채널 순서의 일반 알파 포맷
+# (PIL의 RGBA는 곱하기 전 값이므로 그대로 옮기면 반투명 픽셀이 어두워짐)
+_STRAIGHT_ALPHA_FORMATS = {
+    QImage.Format.Format_ARGB32_Premultiplied: QImage.Format.Format_ARGB32,
+    QImage.Format.Format_RGBA8888_Premultiplied: QImage.Format.Format_RGBA8888,
+}
+
+# 채널 수별 array_to_qimage 기본 포맷 (바이트 순서가 엔디언과 무관한 포맷)
+_ARRAY_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+
+def pixel_layout(image):
+    """QImage의 픽셀 메모리 배치 조회
+
+    Args:
+        image (QImage): 대상 이미지
+
+    Returns:
+        tuple: (픽셀당 바이트 수, 채널 순서 문자열 예: "BGRA")
+    """
+    layout = PIXEL_LAYOUTS.get(image.format())
+    if layout is None:
+        raise ValueError(f"지원하지 않는 QImage 포맷: {image.format()}")
+    return layout
+
+def qimage_to_array(image, rect=None, writable=False):
+    """QImage 픽셀을 복사 없이 NumPy 배열 뷰로 노출
+
+    bytesPerLine(행 패딩)을 반영한 strided 뷰를 반환하므로 행 끝의 패딩 바이트는
+    포함되지 않습니다. 뷰는 이미지 메모리를 직접 참조하므로 사용하는 동안
+    QImage를 살아 있게 유지해야 합니다.
+
+    Args:
+        image (QImage): 원본 이미지
+        rect (QRect): 잘라낼 영역 (None이면 전체, 이미지 밖은 잘림)
+        writable (bool): True이면 쓰기 가능한 뷰 (공유 중인 이미지는 분리됨)
+
+    Returns:
+        numpy.ndarray: (높이, 폭, 채널) uint8 뷰. 그레이스케일은 (높이, 폭)
+    """
+    bytes_per_pixel, order = pixel_layout(image)
+    rect = image.rect() if rect is None else QRect(rect).intersected(image.rect())
+    if rect.isEmpty():
+        shape = (0, 0) if bytes_per_pixel == 1 else (0, 0, bytes_per_pixel)
+        return np.zeros(shape, dtype=np.uint8)
+
+    pointer = image.bits() if writable else image.constBits()
+    pointer.setsize(image.sizeInBytes())
+    stride = image.bytesPerLine()
+    rows = np.frombuffer(pointer, dtype=np.uint8).reshape(image.height(), stride)
+
+    left = rect.left() * bytes_per_pixel
+    right = (rect.right() + 1) * bytes_per_pixel
+    region = rows[rect.top():rect.bottom() + 1, left:right]
+    if bytes_per_pixel == 1:
+        return region
+    return region.reshape(region.shape[0], rect.width(), bytes_per_pixel)
+
+def qimage_to_pil(image, rect=None):
+    """QImage 영역을 RGBA PIL 이미지로 변환 (복사 1회)
+
+    채널 순서를 맞추면서 한 번만 복사하고, PIL 이미지는 그 버퍼를 그대로 공유합니다.
+    원본 QImage와는 메모리를 공유하지 않으므로 이후 캔버스를 수정해도 안전합니다.
+    알파를 미리 곱한 포맷은 영역만 일반 알파 포맷으로 변환한 뒤 옮깁니다.
+
+    Args:
+        image (QImage): 원본 이미지
+        rect (QRect): 잘라낼 영역 (None이면 전체)
+
+    Returns:
+        PIL.Image: RGBA 이미지 (그레이스케일 포맷은 L 이미지)
+    """
+    straight_format = _STRAIGHT_ALPHA_FORMATS.get(image.format())
+    if straight_format is not None:
+        if rect is not None:
+            image = image.copy(QRect(rect).intersected(image.rect()))
+            rect = None
+        image = image.convertToFormat(straight_format)
+    elif image.format() not in PIXEL_LAYOUTS:
+        image = image.convertToFormat(QImage.Format.Format_ARGB32)
+    view = qimage_to_array(image, rect)
+    _, order = pixel_layout(image)
+    height, width = view.shape[:2]
+
+    if order == "L":
+        return Image.frombuffer("L", (width, height), np.array(view), "raw", "L", 0, 1)
+
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    if "A" in order:
+        np.take(view, [order.index(channel) for channel in "RGBA"], axis=2, out=pixels)
+    else:
+        pixels[..., :3] = view[..., [order.index(channel) for channel in "RGB"]]
+        pixels[..., 3] = 255
+    if image.format() in (QImage.Format.Format_RGB32, QImage.Format.Format_RGBX8888):
+        # 사용하지 않는 알파 바이트는 불투명으로 취급
+        pixels[..., 3] = 255
+    return Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+
+def array_to_qimage(array, image_format=None):
+    """NumPy 배열을 복사 없이 QImage로 감싸기
+
+    반환된 QImage는 배열 메모리를 직접 참조하며, 배열이 해제되지 않도록
+    참조를 함께 보관합니다. 쓰기 가능한 배열이면 QImage에 그린 내용이 배열에
+    바로 반영됩니다. 행 안의 픽셀이 연속되지 않은 배열만 복사합니다.
+
+    Args:
+        array (numpy.ndarray): (높이, 폭) 또는 (높이, 폭, 채널) uint8 배열
+        image_format (QImage.Format): 배열의 채널 순서에 맞는 포맷
+            (None이면 채널 수로 Grayscale8/RGB888/RGBA8888 선택)
+
+    Returns:
+        QImage: 배열을 감싼 이미지
+    """
+    if array.dtype != np.uint8:
+        raise ValueError(f"uint8 배열만 지원합니다: {array.dtype}")
+    channels = 1 if array.ndim == 2 else array.shape[2]
+    if image_format is None:
+        image_format = _ARRAY_FORMATS.get(channels)
+        if image_format is None:
+            raise ValueError(f"지원하지 않는 채널 수: {channels}")
+    elif PIXEL_LAYOUTS.get(image_format, (None,))[0] != channels:
+        raise ValueError(f"포맷과 채널 수가 맞지 않습니다: {channels}")
+
+    # 행 단위 stride는 허용하지만 행 안의 픽셀은 연속이어야 함
+    if array.strides[-1] != 1 or (array.ndim == 3 and array.strides[1] != channels):
+        array = np.ascontiguousarray(array)
+    height, width = array.shape[:2]
+    if array.flags.writeable:
+        # 쓰기 가능한 포인터로 넘겨야 QPainter로 그릴 때 분리(복사)되지 않음
+        image = QImage(sip.voidptr(array.ctypes.data), width, height, array.strides[0], image_format)
+    else:
+        image = QImage(array.data, width, height, array.strides[0], image_format)
+    image._array = array  # 버퍼 수명 유지
+    return image
@@ -0,0 +1,140 @@
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger("markupnote.ocr")
+
+class LatencyHistogram:
+    """로그 간격 버킷으로 지연 시간을 누적하는 히스토그램
+
+    메모리 사용량은 버킷 수로 고정되며, 백분위수는 해당 버킷의 상한값으로
+    추정합니다 (버킷 간격 비율만큼의 오차).
+
+    Attributes:
+        count (int): 기록된 샘플 수
+        total (float): 샘플 합계(초)
+        max (float): 최댓값(초)
+    """
+
+    # 0.1ms ~ 약 100초를 1.25배 간격으로 나눈 버킷 상한값
+    BOUNDS = [0.0001 * 1.25 ** i for i in range(int(math.log(1e6, 1.25)) + 2)]
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """샘플 기록
+
+        Args:
+            seconds (float): 소요 시간(초)
+        """
+        self.buckets[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p):
+        """백분위수 추정
+
+        Args:
+            p (float): 0~100 사이의 백분위
+
+        Returns:
+            float: 추정값(초), 샘플이 없으면 0.0
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                bound = self.BOUNDS[index] if index < len(self.BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        """요약 통계 (밀리초 단위)"""
+        return {
+            "count": self.count,
+            "mean_ms": self.total * 1000 / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+class Telemetry:
+    """OCR 경로의 단계별 지연 시간 수집기
+
+    span()으로 감싼 구간의 시간을 단계 이름별 히스토그램에 누적하고,
+    DEBUG 레벨 로그로도 남깁니다.
+    """
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        """단계 소요 시간 기록
+
+        Args:
+            name (str): 단계 이름
+            seconds (float): 소요 시간(초)
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+        logger.debug("%s: %.1fms", name, seconds * 1000)
+
+    @contextmanager
+    def span(self, name):
+        """with 블록의 소요 시간을 기록하는 컨텍스트
+
+        Args:
+            name (str): 단계 이름
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def summary(self):
+        """단계별 요약 통계
+
+        Returns:
+            dict: 단계 이름 -> {"count", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"}
+        """
+        with self._lock:
+            return {name: histogram.summary() for name, histogram in self._histograms.items()}
+
+    def format_summary(self):
+        """요약 통계를 표 형태의 문자열로 변환"""
+        lines = [f"{'stage':<16}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"]
+        for name, stats in sorted(self.summary().items()):
+            lines.append(
+                f"{name:<16}{stats['count']:>8}{stats['mean_ms']:>10.1f}{stats['p50_ms']:>10.1f}"
+                f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, level=logging.INFO):
+        """요약 통계를 로그로 출력"""
+        logger.log(level, "OCR 단계별 지연 시간 (ms)\n%s", self.format_summary())
+
+    def reset(self):
+        """수집된 통계 초기화"""
+        with self._lock:
+            self._histograms.clear()
+
+# 프로세스 전역 수집기
+telemetry = Telemetry()
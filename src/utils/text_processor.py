@@ -1,9 +1,43 @@
 from PIL import Image, ImageEnhance
 import numpy as np
-import cv2
-import torch
-from transformers import TrOCRProcessor, VisionEncoderDecoderModel
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .inference_modes import apply_inference_mode, inference_context, resolve_inference_mode
+from .decoding import build_generate_kwargs, estimate_token_budget, make_generation_params, update_generation_params
+from .line_segmenter import segment_lines
+from .micro_batcher import MicroBatcher
+from .model_loader import load_model_components
+from .ocr_cache import DEFAULT_DISK_DIR, OcrResultCache, make_cache_key
+from .preprocessing import PROFILES, get_pipeline
+from .telemetry import logger, telemetry
+
+MODEL_ID = "microsoft/trocr-base-handwritten"
+NO_TEXT_MESSAGE = "텍스트를 찾을 수 없습니다."
+OCR_ERROR_PREFIX = "오류: OCR 처리 실패 - "  # process_image가 실패를 알리는 결과의 머리말
+
+# 로컬 스냅샷이 없을 때 Hugging Face Hub 사용 허용 여부
+DEFAULT_ALLOW_NETWORK = os.environ.get("MARKUPNOTE_ALLOW_NETWORK") == "1"
+
+# 배치 인식 기본 설정 (환경 변수로 변경 가능)
+DEFAULT_MAX_BATCH_SIZE = int(os.environ.get("MARKUPNOTE_OCR_MAX_BATCH", "8"))
+DEFAULT_BATCH_DELAY = float(os.environ.get("MARKUPNOTE_OCR_BATCH_DELAY_MS", "5")) / 1000
+
+# 결과 캐시 기본 설정 (MARKUPNOTE_OCR_DISK_CACHE=1 이면 디스크 캐시 사용)
+DEFAULT_CACHE_SIZE = int(os.environ.get("MARKUPNOTE_OCR_CACHE_SIZE", "256"))
+DEFAULT_CACHE_DIR = DEFAULT_DISK_DIR if os.environ.get("MARKUPNOTE_OCR_DISK_CACHE") == "1" else None
+
+# 전처리 프로필 ("auto"는 이미지 통계로 자동 선택)
+DEFAULT_PREPROCESS_PROFILE = os.environ.get("MARKUPNOTE_OCR_PROFILE", "auto")
+
+# 디코딩 설정 (빔 1개는 greedy, 토큰 상한 0은 이미지 폭으로 자동 추정)
+DEFAULT_NUM_BEAMS = int(os.environ.get("MARKUPNOTE_OCR_NUM_BEAMS", "1"))
+DEFAULT_MAX_NEW_TOKENS = int(os.environ.get("MARKUPNOTE_OCR_MAX_NEW_TOKENS", "0"))
+
+# 추론 모드 ("fp32", "int8", "bf16")
+DEFAULT_INFERENCE_MODE = os.environ.get("MARKUPNOTE_OCR_INFERENCE_MODE", "fp32")
 
 class TextProcessor:
     """텍스트 처리기 클래스
@@ -15,122 +49,92 @@ class TextProcessor:
         processor (TrOCRProcessor): TrOCR 전처리기
         model (VisionEncoderDecoderModel): TrOCR 모델
         device (torch.device): 연산 장치 (CPU/GPU)
+        max_batch_size (int): 한 번의 generate에 넣을 최대 이미지 수
+        batch_delay (float): 마이크로 배치 큐가 요청을 모으는 시간(초)
+        model_id (str): 사용 중인 모델 식별자
+        generation_params (dict): 디코딩 설정 num_beams, max_new_tokens, early_stopping (캐시 키에 포함)
+        cache (OcrResultCache): 인식 결과 캐시
+        preprocess_profile (str): 전처리 프로필 이름
+        last_preprocess_timings (dict): 마지막 전처리의 단계별 소요 시간(초)
+        inference_mode (str): 실제 적용된 추론 모드
+        load_timings (dict): 구성 요소별 로딩 시간(초)
     """
     
-    def __init__(self):
+    def __init__(self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, batch_delay=DEFAULT_BATCH_DELAY,
+                 cache_size=DEFAULT_CACHE_SIZE, cache_dir=DEFAULT_CACHE_DIR,
+                 preprocess_profile=DEFAULT_PREPROCESS_PROFILE, inference_mode=DEFAULT_INFERENCE_MODE,
+                 num_beams=DEFAULT_NUM_BEAMS, max_new_tokens=DEFAULT_MAX_NEW_TOKENS, early_stopping=True,
+                 allow_network=DEFAULT_ALLOW_NETWORK):
         """텍스트 처리기 초기화"""
-        print("텍스트 처리기 초기화 시작...")
+        # torch/transformers는 무거우므로 실제 생성 시점에 import
+        import torch
+
+        logger.info("텍스트 처리기 초기화 시작...")
     
         # GPU 사용 가능 여부 확인
         self.device = 'cuda' if torch.cuda.is_available() else 'cpu'
-        print(f"사용 장치: {self.device}")
+        logger.info("사용 장치: %s", self.device)
         
-        # 1. 환경 변수 설정
-        os.environ['TRANSFORMERS_CACHE'] = os.path.join(os.path.expanduser("~"), ".cache", "huggingface")
-        
-        try:
-            # 2. ASCII 문자만 포함된 토큰 확인
-            with open("util/access_token/token", "r", encoding='utf-8') as f:
-                auth_token = f.read().strip()
-                # ASCII 문자만 허용
-                auth_token = ''.join(c for c in auth_token if ord(c) < 128)
-        except FileNotFoundError:
-            print("토큰 파일을 찾을 수 없습니다.")
-            auth_token = None
-            
-        try:
-            # 3. 모델 로드 시도
-            self.processor = TrOCRProcessor.from_pretrained(
-                "microsoft/trocr-base-handwritten",
-                use_auth_token=auth_token,  # token 대신 use_auth_token 사용
-                trust_remote_code=True
-            )
-        except Exception as e:
-            print(f"모델 로드 실패: {str(e)}")
-            # 4. 오프라인 모드로 재시도
-            try:
-                self.processor = TrOCRProcessor.from_pretrained(
-                    "microsoft/trocr-base-handwritten",
-                    local_files_only=True
-                )
-            except Exception as offline_e:
-                print(f"오프라인 로드도 실패: {str(offline_e)}")
-                raise
-        
-        # 모델과 프로세서 로드
-        model_name = "microsoft/trocr-base-handwritten"
-        self.model = VisionEncoderDecoderModel.from_pretrained(model_name, use_auth_token=auth_token)
+        # 로컬 스냅샷에서 프로세서와 모델 로드 (허용된 경우에만 네트워크 사용)
+        model_name = MODEL_ID
+        self.processor, self.model, self.load_timings = load_model_components(model_name, allow_network)
         
         # 모델을 해당 장치로 이동
+        start = time.perf_counter()
         self.model.to(self.device)
-        print("텍스트 처리기 초기화 완료")
+        self.model.eval()
+        self.load_timings["to_device"] = time.perf_counter() - start
+        logger.info("구성 요소별 로딩 시간: %s", ", ".join(
+            f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.load_timings.items()
+        ))
+        
+        # 추론 모드 적용 (int8 양자화 / bf16 autocast)
+        self.inference_mode = resolve_inference_mode(inference_mode, self.device)
+        self.model = apply_inference_mode(self.model, self.inference_mode)
+        logger.info("추론 모드: %s", self.inference_mode)
+
+        # 배치 처리 설정
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.batch_delay = batch_delay
+        self._preprocess_pool = ThreadPoolExecutor(
+            max_workers=min(self.max_batch_size, os.cpu_count() or 1),
+            thread_name_prefix="ocr-preprocess"
+        )
+        self._batcher = None
+        self._batcher_lock = threading.Lock()
+
+        # 결과 캐시 설정
+        self.model_id = model_name
+        self.generation_params = make_generation_params(num_beams, max_new_tokens, early_stopping)
+        self.cache = OcrResultCache(cache_size, cache_dir)
 
-    def preprocess_image(self, image):
+        # 전처리 설정
+        if preprocess_profile != "auto" and preprocess_profile not in PROFILES:
+            raise ValueError(f"알 수 없는 전처리 프로필: {preprocess_profile}")
+        self.preprocess_profile = preprocess_profile
+        self.last_preprocess_timings = {}
+        logger.info("텍스트 처리기 초기화 완료")
+
+    def preprocess_image(self, image, profile=None):
         """이미지 전처리
         
         Args:
             image (PIL.Image): 처리할 이미지
+            profile (str): 전처리 프로필 ("canvas_ink", "photo", "auto").
+                None이면 preprocess_profile 설정을 따름
             
         Returns:
             PIL.Image: 전처리된 이미지
         """
-        print("이미지 전처리 시작...")
-        
-        # PIL Image를 numpy 배열로 변환
-        img_array = np.array(image)
-        print(f"원본 이미지 배열 형태: {img_array.shape}")
-        
-        # RGBA to RGB 변환 (알파 채널 제거)
-        if len(img_array.shape) == 3 and img_array.shape[-1] == 4:
-            img_array = cv2.cvtColor(img_array, cv2.COLOR_RGBA2RGB)
-            print("RGBA에서 RGB로 변환 완료")
-        
-        # 이미지 크기 조정 (텍스트가 더 선명해지도록)
-        scale_factor = 2
-        height, width = img_array.shape[:2]
-        width = int(width * scale_factor)
-        height = int(height * scale_factor)
-        img_array = cv2.resize(img_array, (width, height), interpolation=cv2.INTER_CUBIC)
-        print(f"이미지 크기 조정 완료: {width}x{height}")
-        
-        # 노이즈 제거
-        if len(img_array.shape) == 3:
-            img_array = cv2.fastNlMeansDenoisingColored(img_array, None, 10, 10, 7, 21)
-        else:
-            img_array = cv2.fastNlMeansDenoising(img_array)
-        print("노이즈 제거 완료")
+        pipeline = get_pipeline(profile or self.preprocess_profile, image)
+        logger.debug("이미지 전처리 시작... (프로필: %s)", pipeline.name)
         
-        # 그레이스케일 변환
-        if len(img_array.shape) == 3:
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        else:
-            gray = img_array
-        print("그레이스케일 변환 완료")
-        
-        # 적응형 이진화
-        binary = cv2.adaptiveThreshold(
-            gray,
-            255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY,
-            11,
-            2
-        )
-        print("적응형 이진화 완료")
+        # 단계별 시간은 파이프라인이 telemetry에 기록
+        timings = {}
+        enhanced_image = pipeline.run(image, timings)
+        self.last_preprocess_timings = timings
         
-        # 모폴로지 연산으로 텍스트 선명도 향상
-        kernel = np.ones((2,2), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-        print("모폴로지 연산 완료")
-        
-        # 이진화된 이미지를 3채널 RGB로 변환
-        rgb_image = cv2.cvtColor(binary, cv2.COLOR_GRAY2RGB)
-        print("RGB 변환 완료")
-        
-        # numpy 배열을 PIL Image로 변환
-        enhanced_image = Image.fromarray(rgb_image)
-        print(f"전처리된 이미지 크기: {enhanced_image.size}")
-        print(f"전처리된 이미지 모드: {enhanced_image.mode}")
+        logger.debug("전처리된 이미지 크기: %s", enhanced_image.size)
         
         return enhanced_image
 
@@ -143,35 +147,81 @@ class TextProcessor:
         Returns:
             str: 인식된 텍스트
         """
-        try:
-            print("텍스트 인식 처리 시작...")
-            
-            # 이미지를 모델 입력 형식으로 변환
-            pixel_values = self.processor(preprocessed_image, return_tensors="pt").pixel_values
-            print(f"입력 텐서 형태: {pixel_values.shape}")
-            
-            pixel_values = pixel_values.to(self.device)
-            print("텐서를 GPU로 이동 완료")
+        return self.recognize_texts([preprocessed_image])[0]
+
+    def recognize_texts(self, preprocessed_images):
+        """여러 이미지의 텍스트를 배치로 인식
+        
+        토큰 예산이 비슷한 이미지끼리 max_batch_size 단위로 묶어
+        각 묶음마다 한 번의 generate를 수행합니다.
+        
+        Args:
+            preprocessed_images (list[PIL.Image]): 전처리된 이미지 리스트
             
-            with torch.no_grad():
-                # 텍스트 생성
-                generated_ids = self.model.generate(pixel_values)
-                print("텍스트 생성 완료")
+        Returns:
+            list[str]: 이미지별 인식된 텍스트 (실패한 묶음은 None)
+        """
+        import torch
+
+        # 이미지별 토큰 예산 (max_new_tokens가 고정된 경우 추정하지 않음)
+        if self.generation_params.get("max_new_tokens"):
+            budgets = [None] * len(preprocessed_images)
+        else:
+            budgets = [estimate_token_budget(image) for image in preprocessed_images]
+        
+        # 짧은 단어가 긴 줄의 예산에 묶이지 않도록 예산 순으로 정렬해 배치 구성
+        order = sorted(range(len(preprocessed_images)), key=lambda i: budgets[i] or 0)
+        results = [None] * len(preprocessed_images)
+        for start in range(0, len(order), self.max_batch_size):
+            indices = order[start:start + self.max_batch_size]
+            chunk = [preprocessed_images[i] for i in indices]
+            try:
+                logger.debug("텍스트 인식 처리 시작... (배치 크기: %d)", len(chunk))
                 
+                # 이미지를 모델 입력 형식으로 변환
+                # TrOCR 프로세서가 고정 크기로 리사이즈하므로 하나의 텐서로 쌓임
+                with telemetry.span("tensorize"):
+                    pixel_values = self.processor(images=chunk, return_tensors="pt").pixel_values
+                    pixel_values = pixel_values.to(self.device)
+                logger.debug("입력 텐서 형태: %s", tuple(pixel_values.shape))
+                
+                chunk_budget = max(budgets[i] or 0 for i in indices) or None
+                generate_kwargs = build_generate_kwargs(self.generation_params, chunk_budget)
+                with telemetry.span("generate"), torch.no_grad(), inference_context(self.inference_mode):
+                    # 텍스트 생성
+                    generated_ids = self.model.generate(pixel_values, **generate_kwargs)
+                logger.debug("텍스트 생성 완료 (%s)", generate_kwargs)
+                    
                 # 토큰을 텍스트로 변환
-                generated_text = self.processor.batch_decode(generated_ids, skip_special_tokens=True)[0]
-                print("토큰 디코딩 완료")
+                with telemetry.span("decode"):
+                    texts = self.processor.batch_decode(generated_ids, skip_special_tokens=True)
+                for i, text in zip(indices, texts):
+                    results[i] = text
                 
-                return generated_text
-            
-        except Exception as e:
-            print(f"텍스트 인식 중 오류 발생: {str(e)}")
-            print(f"오류 타입: {type(e).__name__}")
-            return None
+            except Exception:
+                logger.exception("텍스트 인식 중 오류 발생")
+        return results
+
+    def set_decoding(self, strategy=None, num_beams=None, max_new_tokens=None, early_stopping=None):
+        """디코딩 설정 변경
+        
+        Args:
+            strategy (str): "greedy" 또는 "beam"
+            num_beams (int): 빔 개수 (strategy가 "beam"일 때 기본 4)
+            max_new_tokens (int): 생성 토큰 수 상한 (0이면 이미지 폭으로 자동 추정)
+            early_stopping (bool): 빔 서치 조기 종료 여부
+        """
+        # 캐시 키가 generation_params에 의존하므로 새 dict로 교체
+        self.generation_params = update_generation_params(
+            self.generation_params, strategy, num_beams, max_new_tokens, early_stopping
+        )
 
     def process_image(self, image):
         """이미지를 텍스트로 변환
         
+        TrOCR은 한 줄 인식 모델이므로 여러 줄이 담긴 선택 영역은 줄 단위로
+        나누어 배치로 인식한 뒤 줄바꿈으로 이어 붙입니다.
+        
         Args:
             image (PIL.Image): 처리할 이미지
             
@@ -179,31 +229,252 @@ class TextProcessor:
             str: 변환된 텍스트 또는 오류 메시지
         """
         if image is None:
-            print("이미지가 선택되지 않았습니다.")
+            logger.warning("이미지가 선택되지 않았습니다.")
             return None
             
         try:
-            print("이미지 텍스트 변환 시작...")
-            print(f"이미지 크기: {image.size}")
-            print(f"이미지 모드: {image.mode}")
+            with telemetry.span("process_image"):
+                return self._process_image(image)
+        except Exception as e:
+            logger.exception("이미지 텍스트 변환 중 오류 발생")
+            return f"{OCR_ERROR_PREFIX}{e}"
+
+    def _process_image(self, image):
+        """process_image의 본체 (예외는 호출자가 처리)"""
+        logger.debug("이미지 텍스트 변환 시작... (크기: %s, 모드: %s)", image.size, image.mode)
             
-            # 이미지 전처리
-            preprocessed_image = self.preprocess_image(image)
+        # 같은 잉크를 다시 선택한 경우 캐시된 결과 사용
+        cache_key = self.cache_key(image)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug("캐시된 텍스트 사용: %s", cached)
+            return cached
             
-            # 텍스트 인식
-            print("텍스트 인식 시작...")
-            text = self.recognize_text(preprocessed_image)
+        # 줄 단위 분할 (잉크 영역만 잘라냄)
+        with telemetry.span("segment"):
+            lines = segment_lines(image)
+        logger.debug("분할된 줄 수: %d", len(lines))
+
+        if len(lines) > 1:
+            # 여러 줄은 병렬 전처리 후 한 번의 배치로 인식
+            preprocessed = list(self._preprocess_pool.map(self.preprocess_image, lines))
+        else:
+            preprocessed = [self.preprocess_image(line) for line in lines]
+        texts = self.recognize_texts(preprocessed)
+        if any(t is None for t in texts):
+            # 일부 줄만 인식한 결과는 캐시하지 않고 실패로 처리
+            raise RuntimeError(f"{len(texts)}줄 중 {texts.count(None)}줄을 인식하지 못했습니다.")
+        text = "\n".join(t.strip() for t in texts if t.strip())
             
-            if not text:
-                print("인식된 텍스트가 없습니다.")
-                return "텍스트를 찾을 수 없습니다."
+        if not text:
+            logger.info("인식된 텍스트가 없습니다.")
+            return NO_TEXT_MESSAGE
             
-            print(f"\n인식된 텍스트: {text}")
-            return text.strip()
-                
+        logger.info("인식된 텍스트: %s", text)
+        self.cache.put(cache_key, text)
+        return text
+
+    def process_images(self, images):
+        """여러 이미지를 한 번에 텍스트로 변환
+        
+        전처리는 스레드 풀에서 병렬로 수행하고, 인식은 배치 generate로 처리합니다.
+        각 이미지는 한 줄짜리 텍스트로 간주합니다.
+        
+        Args:
+            images (list[PIL.Image]): 처리할 이미지 리스트
+            
+        Returns:
+            list[str]: 이미지별 변환 결과 (process_image와 같은 형식)
+        """
+        results = [None] * len(images)
+        indices = [i for i, image in enumerate(images) if image is not None]
+        if not indices:
+            return results
+            
+        try:
+            # 캐시에 있는 이미지는 인식 대상에서 제외
+            cache_keys = {}
+            for i in list(indices):
+                cache_keys[i] = self.cache_key(images[i])
+                cached = self.cache.get(cache_keys[i])
+                if cached is not None:
+                    results[i] = cached
+                    indices.remove(i)
+            if not indices:
+                return results
+            
+            logger.debug("이미지 %d개 텍스트 변환 시작...", len(indices))
+            
+            # 이미지 전처리 (병렬)
+            preprocessed = list(self._preprocess_pool.map(
+                self.preprocess_image, [images[i] for i in indices]
+            ))
+            
+            # 텍스트 인식 (배치)
+            texts = self.recognize_texts(preprocessed)
+        except Exception as e:
+            logger.exception("이미지 텍스트 변환 중 오류 발생")
+            message = f"{OCR_ERROR_PREFIX}{e}"
+            for i in indices:
+                results[i] = message
+            return results
+            
+        for i, text in zip(indices, texts):
+            if text:
+                results[i] = text.strip()
+                self.cache.put(cache_keys[i], results[i])
+            else:
+                results[i] = NO_TEXT_MESSAGE
+        return results
+
+    def cache_key(self, image):
+        """이미지의 결과 캐시 키 계산
+        
+        Args:
+            image (PIL.Image): 처리할 이미지
+            
+        Returns:
+            str: 캐시 키
+        """
+        params = dict(
+            self.generation_params,
+            preprocess_profile=self.preprocess_profile,
+            inference_mode=self.inference_mode
+        )
+        return make_cache_key(image, self.model_id, params)
+
+    def cache_stats(self):
+        """결과 캐시 통계 (적중/미스 횟수 등)"""
+        return self.cache.stats()
+
+    def submit_image(self, image):
+        """마이크로 배치 큐에 이미지 인식 요청
+        
+        짧은 시간 안에 들어온 요청들은 하나의 배치로 묶여 처리됩니다.
+        
+        Args:
+            image (PIL.Image): 처리할 이미지
+            
+        Returns:
+            concurrent.futures.Future: 변환된 텍스트를 담을 Future
+        """
+        with self._batcher_lock:
+            if self._batcher is None:
+                self._batcher = MicroBatcher(
+                    self.process_images,
+                    max_batch_size=self.max_batch_size,
+                    max_delay=self.batch_delay
+                )
+        return self._batcher.submit(image)
+
+def create_text_processor():
+    """사용할 텍스트 처리기 생성
+
+    OCR 데몬이 실행 중이면 데몬 클라이언트를, 아니면 로컬 TextProcessor를 반환합니다.
+    MARKUPNOTE_OCR_DAEMON=0 으로 데몬 사용을 끌 수 있습니다.
+
+    Returns:
+        TextProcessor 또는 OcrDaemonClient: 텍스트 처리기
+    """
+    if os.environ.get("MARKUPNOTE_OCR_DAEMON", "1") != "0":
+        from .ocr_daemon import OcrDaemonClient, daemon_available
+        if daemon_available():
+            logger.info("실행 중인 OCR 데몬을 사용합니다.")
+            return OcrDaemonClient(
+                fallback_factory=TextProcessor,
+                max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                batch_delay=DEFAULT_BATCH_DELAY
+            )
+    return TextProcessor()
+
+class LazyTextProcessor:
+    """TextProcessor 지연 생성 핸들
+
+    모듈 import 시점에는 아무것도 로드하지 않고, warmup() 호출 시 백그라운드
+    스레드에서 torch/transformers import와 모델 가중치 로딩을 수행합니다.
+    워밍업 전에 속성에 접근하면 로딩을 시작하고 완료될 때까지 대기합니다.
+
+    Attributes:
+        factory (callable): 실제 처리기를 생성하는 함수
+    """
+
+    def __init__(self, factory=create_text_processor):
+        self.factory = factory
+        self._instance = None
+        self._error = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._ready_callbacks = []
+
+    def warmup(self):
+        """백그라운드 스레드에서 모델 로딩 시작 (이미 시작된 경우 무시)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._load, name="ocr-warmup", daemon=True)
+            self._thread.start()
+
+    def _load(self):
+        """처리기 생성 후 대기 중인 콜백 호출"""
+        try:
+            instance = self.factory()
+            error = None
         except Exception as e:
-            print(f"이미지 텍스트 변환 중 오류 발생: {str(e)}")
-            return f"오류: OCR 처리 실패 - {str(e)}"
+            logger.exception("텍스트 처리기 워밍업 실패")
+            instance = None
+            error = e
+
+        with self._lock:
+            self._instance = instance
+            self._error = error
+            self._ready.set()
+            callbacks = self._ready_callbacks
+            self._ready_callbacks = []
+
+        for callback in callbacks:
+            try:
+                callback(error is None)
+            except Exception:
+                logger.exception("워밍업 완료 콜백 오류")
+
+    def is_ready(self):
+        """모델 로딩이 성공적으로 끝났는지 여부"""
+        return self._ready.is_set() and self._instance is not None
+
+    def add_ready_callback(self, callback):
+        """로딩 완료 시 호출될 콜백 등록
+
+        콜백은 성공 여부(bool)를 인자로 받으며 로딩 스레드에서 호출됩니다.
+        이미 로딩이 끝난 경우 즉시 호출됩니다.
+
+        Args:
+            callback (callable): 완료 콜백
+        """
+        with self._lock:
+            if not self._ready.is_set():
+                self._ready_callbacks.append(callback)
+                return
+        callback(self._error is None)
+
+    def get(self):
+        """로딩 완료까지 대기 후 실제 처리기 반환
+
+        Returns:
+            TextProcessor: 초기화된 텍스트 처리기
+        """
+        if not self._ready.is_set():
+            self.warmup()
+            self._ready.wait()
+        if self._instance is None:
+            raise RuntimeError("텍스트 처리기 초기화 실패") from self._error
+        return self._instance
+
+    def __getattr__(self, name):
+        # 내부 속성은 위임하지 않음 (초기화 전 접근 시 무한 재귀 방지)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
 
-# 싱글톤 인스턴스 생성
-text_processor = TextProcessor() 
\ No newline at end of file
+# 싱글톤 핸들 생성 (모델은 warmup() 또는 첫 사용 시 로드)
+text_processor = LazyTextProcessor() 
\ No newline at end of file
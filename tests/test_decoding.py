@@ -0,0 +1,42 @@
+import unittest
+
+from PIL import Image, ImageDraw
+
+from src.utils.decoding import MAX_NEW_TOKENS, MIN_NEW_TOKENS, build_generate_kwargs, estimate_token_budget
+
+def make_stroke_image(ink_width, ink_height=30):
+    """주어진 폭과 높이의 잉크가 있는 한 줄 이미지 생성"""
+    image = Image.new("RGB", (ink_width + 40, ink_height + 40), "white")
+    ImageDraw.Draw(image).rectangle((20, 20, 20 + ink_width - 1, 20 + ink_height - 1), fill="black")
+    return image
+
+class TestTokenBudget(unittest.TestCase):
+    def test_budget_grows_with_ink_width(self):
+        """잉크 폭이 넓을수록 토큰 예산이 커지는지 테스트"""
+        short = estimate_token_budget(make_stroke_image(45))
+        long = estimate_token_budget(make_stroke_image(600))
+        self.assertLess(short, long)
+        self.assertLessEqual(short, 10)
+
+    def test_budget_is_clamped(self):
+        """토큰 예산이 최소/최대 범위 안에 있는지 테스트"""
+        self.assertEqual(estimate_token_budget(Image.new("RGB", (50, 50), "white")), MIN_NEW_TOKENS)
+        self.assertEqual(estimate_token_budget(make_stroke_image(4000, 10)), MAX_NEW_TOKENS)
+
+class TestGenerateKwargs(unittest.TestCase):
+    def test_greedy_uses_budget(self):
+        """greedy 디코딩은 추정 예산을 사용하고 early_stopping을 넣지 않는지 테스트"""
+        kwargs = build_generate_kwargs({"num_beams": 1, "max_new_tokens": None}, token_budget=12)
+        self.assertEqual(kwargs, {"num_beams": 1, "do_sample": False, "max_new_tokens": 12})
+
+    def test_beam_with_fixed_limit(self):
+        """고정 토큰 상한과 빔 서치 설정 테스트"""
+        kwargs = build_generate_kwargs(
+            {"num_beams": 4, "max_new_tokens": 20, "early_stopping": True}, token_budget=8
+        )
+        self.assertEqual(kwargs["max_new_tokens"], 20)
+        self.assertEqual(kwargs["num_beams"], 4)
+        self.assertTrue(kwargs["early_stopping"])
+
+if __name__ == '__main__':
+    unittest.main()
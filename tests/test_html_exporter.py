@@ -0,0 +1,62 @@
+import unittest
+
+from PyQt5.QtCore import QPoint
+from PyQt5.QtWidgets import QApplication
+
+from src.gui.html_exporter import NoteHtmlExporter, element_name
+from src.gui.stroke_model import Stroke, StrokeDocument
+from src.gui.text_box_layer import TextBoxModel
+from src.gui.tiled_canvas import TiledCanvas
+
+class TestNoteHtmlExporter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def make_box(self, pos, text, tag="HTML"):
+        box = TextBoxModel(pos, text)
+        box.tag = tag
+        return box
+
+    def test_element_name(self):
+        """태그 버튼 텍스트가 안전한 요소 이름으로 바뀌는지 테스트"""
+        self.assertEqual(element_name("H1"), "h1")
+        self.assertEqual(element_name("HTML"), "div")
+        self.assertEqual(element_name("a b"), "div")
+        self.assertEqual(element_name("<script>"), "div")
+
+    def test_text_is_exact_and_escaped(self):
+        """텍스트 박스 문자열이 그대로(이스케이프되어) 들어가는지 테스트"""
+        boxes = [
+            self.make_box(QPoint(10, 200), "second", tag="p"),
+            self.make_box(QPoint(10, 20), "a < b & \"c\"", tag="h1"),
+        ]
+        html = NoteHtmlExporter().export(boxes)
+        self.assertIn('>a &lt; b &amp; &quot;c&quot;</h1>', html)
+        self.assertIn('data-tag="p"', html)
+        self.assertIn("left: 10px; top: 20px;", html)
+        # 읽는 순서로 배치
+        self.assertLess(html.index("</h1>"), html.index("second</p>"))
+        self.assertNotIn("<img", html)
+
+    def test_hidden_boxes_are_skipped(self):
+        """숨겨진 텍스트 박스는 내보내지 않는지 테스트"""
+        box = self.make_box(QPoint(0, 0), "hidden")
+        box.hide()
+        self.assertNotIn("hidden", NoteHtmlExporter().export([box]))
+
+    def test_ink_is_embedded_as_cropped_image(self):
+        """잉크가 있는 영역만 PNG로 포함되는지 테스트"""
+        ink = TiledCanvas()
+        strokes = StrokeDocument()
+        stroke = Stroke(points=(300, 300, 340, 300))
+        strokes.add(stroke)
+        ink.paint(stroke.bounds(), stroke.render)
+        bounds = stroke.bounds()
+
+        html = NoteHtmlExporter().export([], ink, strokes)
+        self.assertIn('src="data:image/png;base64,', html)
+        self.assertIn(f"left: {bounds.x()}px; top: {bounds.y()}px; width: {bounds.width()}px;", html)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,4 +24,4 @@ def test_save_image(test_image, tmp_path):
     
     assert success
     assert os.path.exists(save_path)
-    assert os.path.getsize(save_path) > 0 
\ No newline at end of file
+    assert os.path.getsize(save_path) > 0
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from src.utils import image_to_html_converter
+from src.utils.image_to_html_converter import (ImageToHtmlConverter, TesseractCliEngine,
+                                               convert_directory)
+
+class FakeEngine:
+    """파일 이름을 인식 결과로 돌려주는 테스트용 엔진 (이름에 bad가 있으면 실패)"""
+    def __init__(self):
+        self.calls = []
+
+    def recognize(self, image):
+        return f"image {image.size[0]}x{image.size[1]}"
+
+    def recognize_files(self, image_paths):
+        self.calls.append(list(image_paths))
+        if any("bad" in path for path in image_paths):
+            raise RuntimeError("읽을 수 없는 이미지")
+        return [os.path.basename(path) + "\n" for path in image_paths]
+
+def fake_converter():
+    """워커 프로세스용 변환기 팩토리"""
+    return ImageToHtmlConverter(engine=FakeEngine())
+
+class TestImageToHtmlConverter(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for name in ("a.png", "b.png", "c.png", "bad.png", "d.png"):
+            path = os.path.join(self.tmp.name, name)
+            Image.new("RGB", (20, 10), "white").save(path)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batch_uses_one_engine_call(self):
+        """여러 장을 한 번의 엔진 호출로 변환하는지 테스트"""
+        converter = fake_converter()
+        htmls = converter.convert_many(self.paths[:3])
+        self.assertEqual(converter.engine.calls, [self.paths[:3]])
+        self.assertIn("<p>a.png</p>", htmls[0])
+        self.assertIn("<p>c.png</p>", htmls[2])
+        self.assertIn("<p>image 20x10</p>", converter.convert_to_html(self.paths[0]))
+
+    def test_convert_directory_streams_all_results(self):
+        """프로세스 풀 일괄 변환이 모든 이미지 결과를 반환하고 실패는 그 이미지만 표시하는지 테스트"""
+        results = list(convert_directory(self.tmp.name, workers=2, batch_size=2, converter_factory=fake_converter))
+        by_path = {path: (html, error) for path, html, error in results}
+        self.assertEqual(sorted(by_path), sorted(self.paths))
+
+        html, error = by_path[os.path.join(self.tmp.name, "bad.png")]
+        self.assertIsNone(html)
+        self.assertIn("읽을 수 없는 이미지", error)
+        html, error = by_path[os.path.join(self.tmp.name, "d.png")]
+        self.assertIsNone(error)
+        self.assertIn("<p>d.png</p>", html)
+
+    def test_cli_engine_splits_pages(self):
+        """tesseract 실행 파일을 한 번만 실행하고 결과를 이미지별로 나누는지 테스트"""
+        engine = TesseractCliEngine()
+        completed = subprocess.CompletedProcess([], 0, stdout="첫째\n\f둘째\n\f".encode("utf-8"), stderr=b"")
+        with mock.patch.object(image_to_html_converter.subprocess, "run", return_value=completed) as run:
+            texts = engine.recognize_files(self.paths[:2])
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(texts, ["첫째\n", "둘째\n"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from src.utils.inference_modes import (
+    character_error_rate,
+    compare_inference_modes,
+    select_fastest_mode,
+)
+
+class FakeProcessor:
+    """추론 모드에 따라 정해진 결과를 내는 테스트용 처리기"""
+    outputs = {"fp32": "hello world", "int8": "hello world", "bf16": "jello wirld"}
+
+    def __init__(self, inference_mode):
+        self.inference_mode = inference_mode
+
+    def preprocess_image(self, image):
+        return image
+
+    def recognize_texts(self, images):
+        return [self.outputs[self.inference_mode] for _ in images]
+
+class TestInferenceModes(unittest.TestCase):
+    def test_character_error_rate(self):
+        """문자 오류율 계산 테스트"""
+        self.assertEqual(character_error_rate("abcd", "abcd"), 0.0)
+        self.assertEqual(character_error_rate("abcd", "abed"), 0.25)
+        self.assertEqual(character_error_rate("abcd", None), 1.0)
+        self.assertEqual(character_error_rate("", ""), 0.0)
+
+    def test_compare_against_fp32(self):
+        """fp32 결과를 기준으로 허용 오차를 판단하는지 테스트"""
+        report = compare_inference_modes(["img"] * 3, tolerance=0.05, processor_factory=FakeProcessor)
+        self.assertEqual(list(report), ["fp32", "int8", "bf16"])
+        self.assertTrue(report["int8"]["within_tolerance"])
+        self.assertFalse(report["bf16"]["within_tolerance"])
+
+    def test_select_fastest_mode_within_tolerance(self):
+        """허용 오차 안에서 가장 빠른 모드를 고르는지 테스트"""
+        report = {
+            "fp32": {"latency_ms": 100, "cer": 0.0, "within_tolerance": True},
+            "int8": {"latency_ms": 40, "cer": 0.01, "within_tolerance": True},
+            "bf16": {"latency_ms": 30, "cer": 0.2, "within_tolerance": False},
+        }
+        self.assertEqual(select_fastest_mode(report), "int8")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.utils.line_segmenter import find_line_bands, segment_lines
+
+class TestLineSegmenter(unittest.TestCase):
+    def make_paragraph(self, line_count):
+        """줄 간격을 두고 가로 획을 그린 테스트 이미지 생성"""
+        image = Image.new("RGB", (300, 60 * line_count + 20), "white")
+        draw = ImageDraw.Draw(image)
+        for i in range(line_count):
+            top = 20 + i * 60
+            # 한 줄 안에 높이가 다른 획 여러 개
+            draw.rectangle((20, top, 120, top + 20), fill="black")
+            draw.rectangle((140, top + 5, 260, top + 25), fill="black")
+        return image
+
+    def test_splits_paragraph_into_lines(self):
+        """여러 줄 이미지가 줄 수만큼 분할되는지 테스트"""
+        lines = segment_lines(self.make_paragraph(3))
+        self.assertEqual(len(lines), 3)
+        for line in lines:
+            self.assertLess(line.height, 60)
+
+    def test_single_line_is_trimmed(self):
+        """한 줄 이미지는 잉크 영역으로 잘리는지 테스트"""
+        lines = segment_lines(self.make_paragraph(1), padding=4)
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0].size, (260 - 20 + 1 + 8, 25 + 1 + 8))
+
+    def test_blank_image_has_no_lines(self):
+        """잉크가 없는 이미지는 빈 리스트를 반환하는지 테스트"""
+        self.assertEqual(segment_lines(Image.new("RGB", (100, 100), "white")), [])
+        self.assertEqual(segment_lines(Image.new("RGB", (100, 100), "black")), [])
+
+    def test_small_gaps_are_merged(self):
+        """좁은 틈으로 나뉜 구간은 한 줄로 합쳐지는지 테스트"""
+        mask = np.zeros((100, 10), dtype=bool)
+        mask[10:30] = True
+        mask[32:40] = True  # i의 점처럼 가까이 붙은 구간
+        mask[70:90] = True
+        self.assertEqual(find_line_bands(mask), [(10, 40), (70, 90)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+
+from src.utils.micro_batcher import MicroBatcher
+
+class TestMicroBatcher(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def process(self, items):
+        self.release.wait(5)
+        self.batches.append(list(items))
+        return [item * 2 for item in items]
+
+    def test_requests_are_coalesced(self):
+        """짧은 시간 안의 요청이 하나의 배치로 묶이는지 테스트"""
+        batcher = MicroBatcher(self.process, max_batch_size=8, max_delay=0.2)
+        futures = [batcher.submit(i) for i in range(5)]
+        self.assertEqual([f.result(5) for f in futures], [0, 2, 4, 6, 8])
+        self.assertEqual(self.batches, [[0, 1, 2, 3, 4]])
+        batcher.close()
+
+    def test_max_batch_size(self):
+        """최대 배치 크기를 넘지 않는지 테스트"""
+        batcher = MicroBatcher(self.process, max_batch_size=2, max_delay=0.2)
+        futures = [batcher.submit(i) for i in range(5)]
+        [f.result(5) for f in futures]
+        self.assertTrue(all(len(batch) <= 2 for batch in self.batches))
+        self.assertEqual(sum(self.batches, []), [0, 1, 2, 3, 4])
+        batcher.close()
+
+    def test_cancelled_requests_are_skipped(self):
+        """취소된 요청은 처리되지 않는지 테스트"""
+        self.release.clear()
+        batcher = MicroBatcher(self.process, max_batch_size=1, max_delay=0)
+        first = batcher.submit(1)
+        second = batcher.submit(2)
+        self.assertTrue(second.cancel())
+        self.release.set()
+        self.assertEqual(first.result(5), 2)
+        batcher.close()
+        self.assertEqual(self.batches, [[1]])
+
+    def test_errors_propagate(self):
+        """배치 처리 오류가 모든 Future에 전달되는지 테스트"""
+        def fail(items):
+            raise ValueError("boom")
+
+        batcher = MicroBatcher(fail, max_delay=0.05)
+        future = batcher.submit(1)
+        with self.assertRaises(ValueError):
+            future.result(5)
+        batcher.close()
+
+    def test_missing_results_fail_batch(self):
+        """결과 수가 요청 수보다 적으면 남은 요청이 기다리지 않고 실패하는지 테스트"""
+        batcher = MicroBatcher(lambda items: items[:1], max_batch_size=8, max_delay=0.2)
+        futures = [batcher.submit(i) for i in range(3)]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result(5)
+        batcher.close()
+
+    def test_submit_racing_close(self):
+        """submit()이 큐에 넣는 도중 close()가 호출되어도 그 Future가 완료되는지 테스트"""
+        batcher = MicroBatcher(lambda items: items, max_delay=0)
+        putting = threading.Event()
+        put = batcher._queue.put
+
+        def slow_put(entry):
+            if entry is not None:
+                putting.set()
+                time.sleep(0.2)  # _closed 확인과 put 사이에 close()가 끼어들 틈
+            put(entry)
+
+        batcher._queue.put = slow_put
+        futures = []
+        thread = threading.Thread(target=lambda: futures.append(batcher.submit(1)))
+        thread.start()
+        self.assertTrue(putting.wait(5))
+        batcher.close()
+        thread.join()
+        self.assertEqual(futures[0].result(5), 1)
+        with self.assertRaises(RuntimeError):
+            batcher.submit(2)
+
+if __name__ == '__main__':
+    unittest.main()
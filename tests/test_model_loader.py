@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.utils import model_loader
+
+class TestResolveSnapshotDir(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_dir = os.path.join(self.tmp.name, "hub", "models--org--model")
+        for commit in ("aaa111", "bbb222"):
+            snapshot = os.path.join(self.repo_dir, "snapshots", commit)
+            os.makedirs(snapshot)
+            open(os.path.join(snapshot, "config.json"), "w").close()
+        os.makedirs(os.path.join(self.repo_dir, "refs"))
+        with open(os.path.join(self.repo_dir, "refs", "main"), "w") as f:
+            f.write("bbb222\n")
+
+        patcher = mock.patch.object(model_loader, "HF_HOME", self.tmp.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        env = mock.patch.dict(os.environ, {}, clear=False)
+        env.start()
+        self.addCleanup(env.stop)
+        for name in ("MARKUPNOTE_MODEL_DIR", "MARKUPNOTE_MODEL_REVISION", "HUGGINGFACE_HUB_CACHE"):
+            os.environ.pop(name, None)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resolves_ref(self):
+        """refs/main이 가리키는 스냅샷을 찾는지 테스트"""
+        path = model_loader.resolve_snapshot_dir("org/model")
+        self.assertEqual(path, os.path.join(self.repo_dir, "snapshots", "bbb222"))
+
+    def test_pinned_commit(self):
+        """커밋 해시로 고정한 스냅샷을 찾는지 테스트"""
+        os.environ["MARKUPNOTE_MODEL_REVISION"] = "aaa111"
+        path = model_loader.resolve_snapshot_dir("org/model")
+        self.assertEqual(path, os.path.join(self.repo_dir, "snapshots", "aaa111"))
+
+    def test_missing_model(self):
+        """캐시에 없는 모델은 None을 반환하는지 테스트"""
+        self.assertIsNone(model_loader.resolve_snapshot_dir("org/other"))
+
+    def test_explicit_directory(self):
+        """MARKUPNOTE_MODEL_DIR 지정 시 해당 디렉토리를 사용하는지 테스트"""
+        explicit = os.path.join(self.repo_dir, "snapshots", "aaa111")
+        os.environ["MARKUPNOTE_MODEL_DIR"] = explicit
+        self.assertEqual(model_loader.resolve_snapshot_dir("org/other"), explicit)
+
+if __name__ == '__main__':
+    unittest.main()
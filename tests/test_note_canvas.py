@@ -16,7 +16,7 @@ def test_initial_state(canvas):
     assert not canvas.drawing
     assert canvas.last_point is None
     assert len(canvas.text_boxes) == 0
-    assert isinstance(canvas.image, QImage)
+    assert isinstance(canvas.render_image(), QImage)
 
 def test_text_mode(canvas, qtbot):
     """텍스트 모드 테스트"""
@@ -0,0 +1,191 @@
+import os
+import tempfile
+import unittest
+
+from PyQt5.QtCore import QPoint
+from PyQt5.QtWidgets import QApplication
+
+from src.gui import note_file
+from src.gui.note_file import NoteJournal
+from src.gui.stroke_model import Stroke, StrokeDocument
+from src.gui.text_box_layer import TextBoxModel
+
+def boxes_of(models):
+    """편집 중인 박스가 없는 (박스, 박스) 목록"""
+    return [(model, model) for model in models]
+
+def line(y, length=50):
+    """가로선 획"""
+    return Stroke(points=[value for x in range(0, length, 5) for value in (x, y)])
+
+class TestNoteJournal(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "note.mun")
+        self.strokes = StrokeDocument()
+        for y in (10, 20, 30):
+            self.strokes.add(line(y))
+        box = TextBoxModel(QPoint(40, 60), "안녕하세요", font_size=14)
+        box.tag = "h1"
+        self.boxes = [box]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertSameDocument(self, strokes, boxes):
+        self.assertEqual([list(s.points) for s in strokes], [list(s.points) for s in self.strokes])
+        self.assertEqual([box.state() for box in boxes], [box.state() for box in self.boxes])
+
+    def test_round_trip(self):
+        """만든 파일을 다시 읽으면 획과 텍스트 박스가 같은지 테스트"""
+        journal = NoteJournal.create(self.path, self.strokes, boxes_of(self.boxes), title="회의")
+        loaded, strokes, boxes = NoteJournal.load(self.path)
+        self.assertSameDocument(strokes, boxes)
+        self.assertEqual(loaded.meta["title"], "회의")
+        self.assertEqual(boxes[0].tag, "h1")
+        self.assertEqual(boxes[0].font_size, 14)
+        self.assertEqual(journal.journal_bytes, 0)
+
+    def test_sync_appends_only_changes(self):
+        """변경량만큼만 덧붙이고, 다시 읽으면 순서까지 복원되는지 테스트"""
+        journal = NoteJournal.create(self.path, self.strokes, boxes_of(self.boxes))
+        self.assertEqual(journal.sync(self.strokes, boxes_of(self.boxes)), 0)
+
+        size = os.path.getsize(self.path)
+        removed = self.strokes.strokes[1]
+        self.strokes.remove(removed)
+        self.strokes.add(line(40))
+        appended = journal.sync(self.strokes, boxes_of(self.boxes))
+        self.assertEqual(os.path.getsize(self.path), size + appended)
+        self.assertLess(appended, size)
+
+        # 실행 취소처럼 원래 위치에 다시 넣기, 박스 이동과 추가
+        self.strokes.insert(1, removed)
+        self.boxes[0].move(QPoint(100, 100))
+        self.boxes.append(TextBoxModel(QPoint(0, 300), "second"))
+        journal.sync(self.strokes, boxes_of(self.boxes))
+
+        _, strokes, boxes = NoteJournal.load(self.path)
+        self.assertSameDocument(strokes, boxes)
+
+    def test_loaded_journal_keeps_appending(self):
+        """읽은 문서에 이어서 기록해도 ID가 겹치지 않는지 테스트"""
+        journal = NoteJournal.create(self.path, self.strokes, boxes_of(self.boxes))
+        self.strokes.add(line(50))
+        journal.sync(self.strokes, boxes_of(self.boxes))
+
+        journal, self.strokes, self.boxes = NoteJournal.load(self.path)
+        self.strokes.remove(self.strokes.strokes[0])
+        self.strokes.add(line(60))
+        self.assertGreater(journal.sync(self.strokes, boxes_of(self.boxes)), 0)
+        _, strokes, boxes = NoteJournal.load(self.path)
+        self.assertSameDocument(strokes, boxes)
+
+    def test_torn_tail_is_ignored(self):
+        """쓰는 중에 잘린 마지막 기록은 버리고 이어서 쓸 수 있는지 테스트"""
+        journal = NoteJournal.create(self.path, self.strokes, boxes_of(self.boxes))
+        expected = [list(s.points) for s in self.strokes]
+        self.strokes.add(line(70))
+        journal.sync(self.strokes, boxes_of(self.boxes))
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 20)
+
+        journal, self.strokes, self.boxes = NoteJournal.load(self.path)
+        self.assertEqual([list(s.points) for s in self.strokes], expected)
+        self.strokes.add(line(80))
+        journal.sync(self.strokes, boxes_of(self.boxes))
+        _, strokes, boxes = NoteJournal.load(self.path)
+        self.assertSameDocument(strokes, boxes)
+
+    def test_compaction(self):
+        """기록이 커지면 스냅샷 하나로 다시 쓰는지 테스트"""
+        original = note_file.COMPACT_MIN_BYTES
+        note_file.COMPACT_MIN_BYTES = 0
+        try:
+            journal = NoteJournal.create(self.path, self.strokes, boxes_of(self.boxes))
+            for y in range(100, 200, 5):
+                self.strokes.add(line(y, length=200))
+                journal.sync(self.strokes, boxes_of(self.boxes))
+            for stroke in list(self.strokes)[3:]:
+                self.strokes.remove(stroke)
+            journal.sync(self.strokes, boxes_of(self.boxes))
+            self.assertTrue(journal.needs_compaction())
+
+            size = os.path.getsize(self.path)
+            journal.compact(self.strokes, boxes_of(self.boxes))
+            self.assertLess(os.path.getsize(self.path), size)
+            self.assertEqual(journal.journal_bytes, 0)
+            _, strokes, boxes = NoteJournal.load(self.path)
+            self.assertSameDocument(strokes, boxes)
+        finally:
+            note_file.COMPACT_MIN_BYTES = original
+
+    def test_rejects_other_files(self):
+        """노트 파일이 아니면 ValueError를 내는지 테스트"""
+        with open(self.path, "wb") as f:
+            f.write(b"not a note")
+        with self.assertRaises(ValueError):
+            NoteJournal.load(self.path)
+
+class TestCanvasDocument(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        from src.gui.note_canvas import NoteCanvas
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        self.canvas = NoteCanvas()
+
+    def tearDown(self):
+        self.canvas.saver.wait()
+        self.canvas.deleteLater()
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_autosave_and_reopen(self):
+        """자동 저장한 문서를 다시 열면 편집 중이던 내용까지 복원되는지 테스트"""
+        canvas = self.canvas
+        canvas.autosave()
+        self.assertIsNone(canvas.journal)  # 빈 캔버스는 문서를 만들지 않음
+
+        canvas.strokes.add(line(10))
+        text_box = canvas.text_mode.create_text_box(QPoint(20, 40), "draft")
+        canvas.text_layer.begin_edit(text_box)
+        canvas.text_layer.editor.setPlainText("edited")
+        canvas.autosave()
+        path = canvas.journal.path
+        self.assertTrue(path.endswith(".mun"))
+
+        canvas.clear_canvas()
+        canvas.journal = None
+        canvas.open_document(path)
+        self.assertEqual(len(canvas.strokes), 1)
+        self.assertEqual([box.toPlainText() for box in canvas.text_boxes], ["edited"])
+        self.assertFalse(canvas.ink.bounding_rect().isEmpty())
+        self.assertEqual(canvas.journal.path, path)
+
+    def test_reopen_active_document(self):
+        """편집 중인 문서를 다시 열어도 자동 저장 전의 변경이 사라지지 않는지 테스트"""
+        canvas = self.canvas
+        canvas.strokes.add(line(10))
+        canvas.autosave()
+        journal = canvas.journal
+        canvas.strokes.add(line(20))  # 아직 기록되지 않은 변경
+
+        with self.assertRaises(ValueError):
+            canvas.open_document(__file__)
+        self.assertIs(canvas.journal, journal)  # 읽지 못하면 현재 문서 유지
+
+        canvas.open_document(journal.path)
+        self.assertEqual([list(s.points) for s in canvas.strokes], [list(line(10).points), list(line(20).points)])
+        self.assertEqual(canvas.journal.path, journal.path)
+
+if __name__ == '__main__':
+    unittest.main()
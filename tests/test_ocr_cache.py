@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+
+from PIL import Image, ImageDraw
+
+from src.utils.ocr_cache import OcrResultCache, make_cache_key
+
+def make_ink_image(width, height, offset=(0, 0)):
+    """흰 배경에 같은 선이 그려진 테스트 이미지 생성"""
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    x, y = offset
+    draw.line((x + 10, y + 10, x + 40, y + 20), fill="black", width=2)
+    return image
+
+class TestOcrCacheKey(unittest.TestCase):
+    def test_same_ink_with_different_margins(self):
+        """여백만 다른 선택 영역은 같은 키를 갖는지 테스트"""
+        small = make_ink_image(60, 40)
+        large = make_ink_image(100, 80, offset=(15, 20))
+        self.assertEqual(
+            make_cache_key(small, "model"),
+            make_cache_key(large, "model")
+        )
+
+    def test_model_and_params_change_key(self):
+        """모델과 생성 파라미터가 키에 반영되는지 테스트"""
+        image = make_ink_image(60, 40)
+        key = make_cache_key(image, "model")
+        self.assertNotEqual(key, make_cache_key(image, "other-model"))
+        self.assertNotEqual(key, make_cache_key(image, "model", {"num_beams": 4}))
+
+class TestOcrResultCache(unittest.TestCase):
+    def test_lru_eviction_and_counters(self):
+        """LRU 제거와 적중/미스 카운터 테스트"""
+        cache = OcrResultCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        self.assertEqual(cache.get("a"), "A")  # a를 최근 사용으로 갱신
+        cache.put("c", "C")  # b가 제거됨
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "C")
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 2)
+
+    def test_disk_tier_survives_new_instance(self):
+        """디스크 캐시가 새 인스턴스에서도 사용되는지 테스트"""
+        with tempfile.TemporaryDirectory() as disk_dir:
+            OcrResultCache(disk_dir=disk_dir).put("abcdef", "hello")
+            self.assertTrue(os.path.exists(os.path.join(disk_dir, "ab", "abcdef.txt")))
+
+            cache = OcrResultCache(disk_dir=disk_dir)
+            self.assertEqual(cache.get("abcdef"), "hello")
+            self.assertEqual(cache.stats()["disk_hits"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from PIL import Image, ImageDraw
+
+from src.utils.line_segmenter import segment_lines
+from src.utils.ocr_daemon import OcrDaemon, OcrDaemonClient, daemon_available
+
+class FakeProcessor:
+    """이미지 크기와 픽셀 값을 텍스트로 돌려주는 테스트용 처리기"""
+
+    def process_images(self, images):
+        return [f"{image.width}x{image.height}:{image.getpixel((0, 0))[0]}" for image in images]
+
+    def process_image(self, image):
+        # TextProcessor처럼 줄 단위로 나눠 인식
+        return "\n".join(f"line {line.height}" for line in segment_lines(image))
+
+def two_line_crop():
+    """가로 획 두 줄이 있는 선택 영역 이미지"""
+    image = Image.new("RGB", (120, 70), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((10, 10, 100, 17), fill="black")
+    draw.rectangle((10, 45, 100, 52), fill="black")
+    return image
+
+class TestOcrDaemon(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.mkdtemp()
+        cls.socket_path = os.path.join(cls.tmp_dir, "ocr.sock")
+        cls.daemon = OcrDaemon(cls.socket_path, workers=2, processor_factory=FakeProcessor, num_threads=0)
+        cls.thread = threading.Thread(target=cls.daemon.serve_forever, daemon=True)
+        cls.thread.start()
+        for _ in range(100):
+            if daemon_available(cls.socket_path):
+                break
+            time.sleep(0.05)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.daemon.shutdown()
+        cls.thread.join(5)
+
+    def test_ping(self):
+        """데몬 응답 확인 테스트"""
+        self.assertTrue(daemon_available(self.socket_path))
+
+    def test_process_images_through_shared_memory(self):
+        """공유 메모리로 이미지를 전달해 인식하는지 테스트"""
+        client = OcrDaemonClient(self.socket_path)
+        images = [Image.new("RGB", (30, 10), (7, 7, 7)), None, Image.new("RGBA", (5, 4), (200, 0, 0, 255))]
+        self.assertEqual(client.process_images(images), ["30x10:7", None, "5x4:200"])
+
+    def test_multi_line_crop_is_segmented(self):
+        """선택 영역 한 장을 보내면 데몬 워커가 줄 단위로 나눠 인식하는지 테스트"""
+        client = OcrDaemonClient(self.socket_path)
+        self.assertEqual(client.process_image(two_line_crop()), "line 16\nline 16")
+
+    def test_invalid_response_falls_back(self):
+        """데몬 응답을 해석할 수 없으면 로컬 처리기로 전환하는지 테스트"""
+        client = OcrDaemonClient(self.socket_path, fallback_factory=FakeProcessor)
+        with mock.patch.object(client, "_request", side_effect=ValueError("잘못된 JSON")):
+            self.assertEqual(client.process_image(two_line_crop()), "line 16\nline 16")
+        self.assertEqual(client.process_images([Image.new("RGB", (3, 2), (9, 9, 9))]), ["3x2:9"])
+
+    def test_short_response_falls_back(self):
+        """데몬 결과 수가 요청보다 적으면 None을 채우지 않고 로컬 처리기로 전환하는지 테스트"""
+        client = OcrDaemonClient(self.socket_path, fallback_factory=FakeProcessor)
+        images = [Image.new("RGB", (3, 2), (9, 9, 9)), Image.new("RGB", (4, 2), (1, 1, 1))]
+        with mock.patch.object(client, "_request", return_value={"ok": True, "texts": ["3x2:9"]}):
+            self.assertEqual(client.process_images(images), ["3x2:9", "4x2:1"])
+
+    def test_decoding_settings_are_sent(self):
+        """set_decoding으로 바꾼 설정이 데몬 요청에 담기는지 테스트"""
+        client = OcrDaemonClient(self.socket_path)
+        client.set_decoding("beam", num_beams=3)
+        self.assertEqual(client.generation_params["num_beams"], 3)
+        with mock.patch.object(client, "_request", wraps=client._request) as request:
+            self.assertEqual(client.process_images([Image.new("RGB", (3, 2), (9, 9, 9))]), ["3x2:9"])
+        self.assertEqual(request.call_args[0][0]["generation_params"]["num_beams"], 3)
+        self.assertIsNone(client.cache_stats())  # 워커별 캐시는 합칠 수 없음
+
+    def test_unavailable_daemon(self):
+        """데몬이 없는 경로는 사용할 수 없다고 판단하는지 테스트"""
+        self.assertFalse(daemon_available(os.path.join(self.tmp_dir, "missing.sock")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import pytest
+from PyQt5.QtCore import QPoint, QRect
+from PyQt5.QtGui import QColor
+from src.gui.note_canvas import NoteCanvas
+from src.gui.page_renderer import BASE_DPI, PageRenderer
+from src.gui.stroke_model import Stroke
+
+@pytest.fixture
+def canvas(qtbot):
+    """테스트용 노트 캔버스 픽스처"""
+    canvas = NoteCanvas()
+    canvas.resize(400, 300)
+    qtbot.addWidget(canvas)
+    canvas.show()
+    return canvas
+
+def draw_line(canvas, y):
+    """획 문서와 잉크 타일에 가로선 그리기"""
+    stroke = Stroke(points=(20, y, 200, y), width=4)
+    canvas.strokes.add(stroke)
+    canvas.ink.paint(stroke.bounds(), stroke.render)
+
+def test_render_scales_with_dpi(canvas):
+    """해상도에 맞춰 이미지 크기와 해상도 정보가 바뀌는지 테스트"""
+    draw_line(canvas, 50)
+    renderer = PageRenderer.from_canvas(canvas)
+
+    image = renderer.render()
+    assert image.size() == canvas.size()
+    assert QColor(image.pixel(100, 50)) == QColor(0, 0, 0)
+
+    image = renderer.render(dpi=BASE_DPI * 2)
+    assert (image.width(), image.height()) == (800, 600)
+    assert abs(image.dotsPerMeterX() - BASE_DPI * 2 / 0.0254) < 1
+    assert QColor(image.pixel(200, 100)) == QColor(0, 0, 0)
+
+    image = renderer.render(rect=QRect(0, 0, 100, 100))
+    assert image.size() == QRect(0, 0, 100, 100).size()
+
+def test_render_leaves_live_state_alone(canvas):
+    """렌더링이 모드, 편집기, 텍스트 박스 내용을 바꾸지 않는지 테스트"""
+    text_box = canvas.text_mode.create_text_box(QPoint(50, 150), "hello")
+    canvas.text_layer.editor.setPlainText("edited")
+    mode = canvas.current_mode
+
+    renderer = PageRenderer.from_canvas(canvas)
+    renderer.render()
+
+    assert canvas.current_mode is mode
+    assert canvas.text_layer.editing is text_box
+    assert canvas.text_layer.editor.toPlainText() == "edited"
+    assert text_box.toPlainText() == "hello"
+    assert [box.tagged_text() for box in renderer.text_boxes] == ["<HTML>edited</HTML>"]
+
+def test_snapshot_is_independent(canvas):
+    """스냅샷 이후의 편집이 렌더링 결과에 반영되지 않는지 테스트"""
+    renderer = PageRenderer.from_canvas(canvas)
+    draw_line(canvas, 50)
+    image = renderer.render()
+    assert QColor(image.pixel(100, 50)) == QColor(255, 255, 255)
+    assert len(renderer.strokes) == 0
@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from src.utils.preprocessing import PROFILES, detect_profile, get_pipeline
+
+class TestPreprocessing(unittest.TestCase):
+    def setUp(self):
+        # 캔버스 잉크처럼 순수 흑백인 이미지
+        self.ink_image = Image.new("RGB", (120, 40), "white")
+        ImageDraw.Draw(self.ink_image).line((10, 20, 110, 20), fill="black", width=2)
+
+        # 스캔 이미지처럼 잡음이 섞인 이미지
+        rng = np.random.default_rng(0)
+        noisy = np.clip(rng.normal(180, 40, (40, 120, 3)), 0, 255).astype(np.uint8)
+        self.photo_image = Image.fromarray(noisy)
+
+    def test_detect_profile(self):
+        """이미지 통계로 프로필을 추정하는지 테스트"""
+        self.assertEqual(detect_profile(self.ink_image), "canvas_ink")
+        self.assertEqual(detect_profile(self.photo_image), "photo")
+
+    def test_canvas_ink_skips_upscale_and_denoise(self):
+        """캔버스 잉크 프로필은 확대/노이즈 제거를 하지 않는지 테스트"""
+        timings = {}
+        result = get_pipeline("canvas_ink").run(self.ink_image, timings)
+        self.assertEqual(result.size, self.ink_image.size)
+        self.assertEqual(result.mode, "RGB")
+        self.assertNotIn("denoise", timings)
+        self.assertNotIn("upscale", timings)
+
+    def test_photo_profile_records_stage_timings(self):
+        """사진 프로필이 단계별 시간을 기록하는지 테스트"""
+        timings = {}
+        result = PROFILES["photo"].run(self.photo_image, timings)
+        self.assertEqual(result.size, (240, 80))
+        self.assertEqual(
+            list(timings),
+            ["convert", "upscale", "denoise", "grayscale", "threshold", "morphology"]
+        )
+
+    def test_unknown_profile(self):
+        """알 수 없는 프로필 이름은 오류를 발생시키는지 테스트"""
+        with self.assertRaises(ValueError):
+            get_pipeline("nope")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QImage, QPainter
+
+from src.utils.qimage_bridge import array_to_qimage, qimage_to_array, qimage_to_pil
+
+class TestQImageToArray(unittest.TestCase):
+    def test_view_honors_bytes_per_line(self):
+        """행 패딩이 있는 이미지에서도 픽셀 위치가 맞는지 테스트"""
+        image = QImage(13, 7, QImage.Format.Format_RGB888)
+        image.fill(QColor(10, 20, 30))
+        image.setPixelColor(12, 6, QColor(1, 2, 3))
+        self.assertGreater(image.bytesPerLine(), 13 * 3)
+
+        view = qimage_to_array(image)
+        self.assertEqual(view.shape, (7, 13, 3))
+        self.assertEqual(view[6, 12].tolist(), [1, 2, 3])
+        self.assertEqual(view[0, 0].tolist(), [10, 20, 30])
+
+    def test_region_is_clipped_view(self):
+        """영역이 이미지 밖으로 나가면 잘리고, 쓰기 뷰가 원본을 수정하는지 테스트"""
+        image = QImage(20, 10, QImage.Format.Format_RGB32)
+        image.fill(QColor(255, 255, 255))
+
+        region = qimage_to_array(image, QRect(15, 5, 10, 10), writable=True)
+        self.assertEqual(region.shape, (5, 5, 4))
+        region[...] = 0
+        self.assertEqual(image.pixelColor(15, 5).red(), 0)
+        self.assertEqual(image.pixelColor(14, 5).red(), 255)
+
+class TestQImageToPil(unittest.TestCase):
+    def test_rgb32_channel_order(self):
+        """Format_RGB32의 메모리 순서와 관계없이 RGBA 값이 맞는지 테스트"""
+        image = QImage(8, 4, QImage.Format.Format_RGB32)
+        image.fill(QColor(200, 100, 50))
+
+        pil_image = qimage_to_pil(image, QRect(2, 1, 3, 2))
+        self.assertEqual(pil_image.mode, "RGBA")
+        self.assertEqual(pil_image.size, (3, 2))
+        self.assertEqual(pil_image.getpixel((0, 0)), (200, 100, 50, 255))
+
+    def test_result_does_not_share_memory(self):
+        """변환 후 원본을 수정해도 결과가 바뀌지 않는지 테스트"""
+        image = QImage(4, 4, QImage.Format.Format_ARGB32)
+        image.fill(QColor(0, 0, 0))
+        pil_image = qimage_to_pil(image)
+        image.fill(QColor(255, 255, 255))
+        self.assertEqual(pil_image.getpixel((0, 0)), (0, 0, 0, 255))
+
+    def test_premultiplied_alpha_is_undone(self):
+        """알파를 미리 곱한 포맷도 곱하기 전 색으로 변환되는지 테스트"""
+        for image_format in (QImage.Format.Format_ARGB32_Premultiplied,
+                             QImage.Format.Format_RGBA8888_Premultiplied):
+            image = QImage(6, 4, image_format)
+            image.fill(QColor(200, 100, 50, 128))
+
+            pil_image = qimage_to_pil(image, QRect(4, 2, 5, 5))
+            self.assertEqual(pil_image.size, (2, 2))
+            red, green, blue, alpha = pil_image.getpixel((0, 0))
+            self.assertEqual(alpha, 128)
+            self.assertAlmostEqual(red, 200, delta=2)
+            self.assertAlmostEqual(green, 100, delta=2)
+            self.assertAlmostEqual(blue, 50, delta=2)
+
+class TestArrayToQImage(unittest.TestCase):
+    def test_wraps_without_copy(self):
+        """배열을 수정하면 감싼 QImage에 반영되는지 테스트"""
+        array = np.zeros((4, 5, 4), dtype=np.uint8)
+        image = array_to_qimage(array)
+        array[1, 2] = [9, 8, 7, 255]
+        self.assertEqual(image.pixelColor(2, 1).getRgb(), (9, 8, 7, 255))
+
+    def test_painting_writes_through(self):
+        """QImage에 그린 내용이 배열에 반영되는지 테스트"""
+        array = np.zeros((4, 5, 4), dtype=np.uint8)
+        image = array_to_qimage(array)
+        painter = QPainter(image)
+        painter.fillRect(0, 0, 5, 4, QColor(1, 2, 3))
+        painter.end()
+        self.assertEqual(array[3, 4].tolist(), [1, 2, 3, 255])
+
+    def test_round_trip_grayscale(self):
+        """그레이스케일 배열이 그대로 왕복되는지 테스트"""
+        array = np.arange(30, dtype=np.uint8).reshape(5, 6)
+        image = array_to_qimage(array)
+        self.assertEqual(image.format(), QImage.Format.Format_Grayscale8)
+        np.testing.assert_array_equal(qimage_to_array(image), array)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import threading
+
+import pytest
+from PyQt5.QtCore import QPoint
+from PyQt5.QtGui import QImage
+from src.gui.note_canvas import NoteCanvas
+from src.gui.save_worker import NoteSaver
+from src.utils.atomic_file import atomic_write
+
+class BlockingRenderer:
+    """release()가 호출될 때까지 렌더링을 멈추는 테스트용 렌더러"""
+    def __init__(self, color):
+        self.color = color
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def release(self):
+        self.released.set()
+
+    def render(self):
+        self.started.set()
+        self.released.wait(5)
+        image = QImage(4, 4, QImage.Format.Format_RGB32)
+        image.fill(self.color)
+        return image
+
+def test_atomic_write_replaces_without_leftovers(tmp_path):
+    """원자적 쓰기가 파일을 교체하고 임시 파일을 남기지 않는지 테스트"""
+    path = tmp_path / "note.html"
+    atomic_write(str(path), "첫 번째")
+    atomic_write(str(path), b"second")
+    assert path.read_bytes() == b"second"
+    assert os.listdir(tmp_path) == ["note.html"]
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="유닉스 파일 권한 전용")
+def test_atomic_write_keeps_file_mode(tmp_path):
+    """새 파일은 umask를 적용한 기본 권한, 기존 파일은 원래 권한을 유지하는지 테스트"""
+    umask = os.umask(0)
+    os.umask(umask)
+    path = tmp_path / "new.html"
+    atomic_write(str(path), "새 파일")
+    assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    path.chmod(0o640)
+    atomic_write(str(path), "덮어쓰기")
+    assert path.stat().st_mode & 0o777 == 0o640
+
+def test_repeated_saves_are_coalesced(qapp, tmp_path):
+    """저장 중에 같은 대상으로 다시 저장하면 마지막 요청만 쓰이는지 테스트"""
+    saver = NoteSaver()
+    path = str(tmp_path / "note.png")
+    first, second, third = (BlockingRenderer(color) for color in (0xff0000, 0x00ff00, 0x0000ff))
+    saved = []
+    saver.saved.connect(saved.append)
+
+    saver.save(first, path)
+    assert first.started.wait(5)
+    saver.save(second, path)
+    saver.save(third, path)
+    assert len(saver.pending) == 1
+
+    first.release()
+    third.release()
+    saver.wait()
+    assert saved == [[path], [path]]
+    assert not second.started.is_set()
+    assert QImage(path).pixel(0, 0) & 0xffffff == 0x0000ff
+
+def test_save_canvas_runs_in_background(qtbot, tmp_path, monkeypatch):
+    """캔버스 저장이 스냅샷 후 바로 반환되고 파일은 백그라운드에서 쓰이는지 테스트"""
+    monkeypatch.chdir(tmp_path)
+    canvas = NoteCanvas()
+    qtbot.addWidget(canvas)
+    canvas.text_mode.create_text_box(QPoint(10, 10), "hello")
+
+    saved = []
+    canvas.saver.saved.connect(saved.append)
+    assert canvas.save_canvas() is not None
+    assert canvas.is_empty()
+    canvas.saver.wait()
+    image_path, html_path = saved[0]
+    assert os.path.exists(image_path)
+    with open(html_path, encoding="utf-8") as f:
+        assert "hello" in f.read()
+    assert canvas.save_canvas() is None  # 빈 캔버스는 저장하지 않음
+    assert not canvas.saver.is_busy()  # 기다리는 저장이 없어도 건너뜀
@@ -0,0 +1,77 @@
+import unittest
+
+from PyQt5.QtCore import QPoint, QRect
+
+from src.gui.spatial_index import ObjectRegistry, SpatialIndex
+from src.gui.stroke_model import Stroke, StrokeDocument
+
+class FakeWidget:
+    """geometry()만 가진 테스트용 위젯"""
+    def __init__(self, rect):
+        self.rect = rect
+
+    def geometry(self):
+        return self.rect
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SpatialIndex(cell_size=100)
+
+    def test_point_and_rect_queries(self):
+        """점/영역 조회가 겹치는 객체만 등록 순서로 반환하는지 테스트"""
+        self.index.insert("a", QRect(0, 0, 50, 50))
+        self.index.insert("b", QRect(40, 40, 300, 20))
+        self.index.insert("c", QRect(500, 500, 10, 10))
+
+        self.assertEqual(self.index.query_point(QPoint(45, 45)), ["a", "b"])
+        self.assertEqual(self.index.query_point(QPoint(250, 50)), ["b"])
+        self.assertEqual(self.index.query_point(QPoint(250, 90)), [])
+        self.assertEqual(self.index.query_rect(QRect(0, 0, 1000, 1000)), ["a", "b", "c"])
+        self.assertEqual(self.index.query_rect(QRect(200, 0, 400, 45)), ["b"])
+
+    def test_update_moves_between_cells(self):
+        """객체를 옮기면 이전 칸에서 조회되지 않는지 테스트"""
+        self.index.insert("a", QRect(0, 0, 10, 10))
+        self.index.update("a", QRect(450, 450, 10, 10))
+        self.assertEqual(self.index.query_point(QPoint(5, 5)), [])
+        self.assertEqual(self.index.query_point(QPoint(455, 455)), ["a"])
+        self.assertEqual(self.index._cells.keys(), {(4, 4)})
+
+    def test_remove_frees_cells(self):
+        """삭제하면 객체와 빈 칸이 모두 사라지는지 테스트"""
+        self.index.insert("a", QRect(0, 0, 250, 250))
+        self.index.remove("a")
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index._cells, {})
+        self.index.discard("a")  # 없는 객체는 무시
+
+    def test_registry_returns_topmost(self):
+        """등록부의 점 조회가 가장 위의 위젯을 반환하는지 테스트"""
+        registry = ObjectRegistry()
+        bottom = FakeWidget(QRect(0, 0, 100, 100))
+        top = FakeWidget(QRect(50, 50, 100, 100))
+        registry.add(bottom)
+        registry.add(top)
+        self.assertIs(registry.object_at(QPoint(60, 60)), top)
+        self.assertIs(registry.object_at(QPoint(10, 10)), bottom)
+
+        top.rect = QRect(300, 300, 10, 10)
+        registry.refresh(top)
+        self.assertIs(registry.object_at(QPoint(60, 60)), bottom)
+        self.assertEqual(list(registry), [bottom, top])
+
+class TestStrokeIndex(unittest.TestCase):
+    def test_insert_keeps_drawing_order(self):
+        """삭제했던 획을 원래 위치에 넣으면 그리는 순서가 유지되는지 테스트"""
+        document = StrokeDocument()
+        strokes = [Stroke(points=(0, y, 50, y)) for y in (10, 12, 14)]
+        for stroke in strokes:
+            document.add(stroke)
+        document.remove(strokes[1])
+        document.insert(1, strokes[1])
+        self.assertEqual(document.strokes, strokes)
+        self.assertEqual(document.strokes_in(QRect(0, 0, 60, 20)), strokes)
+        self.assertIs(document.hit_test(QPoint(25, 14)), strokes[2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+from PyQt5.QtCore import QPoint, QRect
+from PyQt5.QtGui import QColor
+
+from src.gui.stroke_model import STROKE_CLEAR, STROKE_ERASER, STROKE_PEN, Stroke, StrokeDocument, simplify_points
+from src.gui.tiled_canvas import TiledCanvas
+
+def make_stroke(points, kind=STROKE_PEN, width=2.0):
+    """테스트용 획 생성"""
+    stroke = Stroke(kind, width=width)
+    for x, y in points:
+        stroke.add_point(x, y)
+    return stroke
+
+class TestStroke(unittest.TestCase):
+    def test_compact_point_storage(self):
+        """점이 float32 배열로 저장되는지 테스트"""
+        stroke = make_stroke([(0, 0), (10, 5), (20, 0)])
+        self.assertEqual(len(stroke), 3)
+        self.assertEqual(stroke.points.itemsize * len(stroke.points), 3 * 8)
+        self.assertEqual(stroke.point_array().tolist(), [[0, 0], [10, 5], [20, 0]])
+        with self.assertRaises(AttributeError):
+            stroke.extra = 1
+
+    def test_bounds_include_pen_width(self):
+        """경계 영역에 펜 두께 여유가 포함되는지 테스트"""
+        bounds = make_stroke([(10, 10), (50, 10)], width=4).bounds()
+        self.assertTrue(bounds.contains(QRect(8, 8, 44, 4)))
+
+    def test_distance_to_segment(self):
+        """선분까지의 거리 계산 테스트"""
+        stroke = make_stroke([(0, 0), (100, 0)])
+        self.assertAlmostEqual(stroke.distance_to(50, 3), 3.0)
+        self.assertAlmostEqual(stroke.distance_to(103, 4), 5.0)
+
+class TestSimplify(unittest.TestCase):
+    def test_collinear_points_collapse(self):
+        """직선 위의 점들은 양 끝점만 남는지 테스트"""
+        points = np.array([[x, 2 * x] for x in range(100)], dtype=np.float32)
+        self.assertEqual(simplify_points(points, 0.5).tolist(), [[0, 0], [99, 198]])
+
+    def test_corners_are_kept(self):
+        """허용 오차보다 크게 꺾이는 점은 유지되는지 테스트"""
+        points = np.array([[0, 0], [5, 0.2], [10, 0], [10, 5], [10, 10]], dtype=np.float32)
+        self.assertEqual(simplify_points(points, 0.5).tolist(), [[0, 0], [10, 0], [10, 10]])
+
+    def test_stroke_simplify_stays_within_tolerance(self):
+        """단순화한 획이 원래 점에서 허용 오차 이상 벗어나지 않는지 테스트"""
+        xs = np.linspace(0, 200, 400)
+        original = [(x, 20 * np.sin(x / 30)) for x in xs]
+        stroke = make_stroke(original)
+        stroke.simplify(0.75)
+        self.assertLess(len(stroke), len(original) // 5)
+        self.assertTrue(all(stroke.distance_to(x, y) <= 0.75 + 1e-3 for x, y in original))
+
+class TestStrokeDocument(unittest.TestCase):
+    def test_serialization_round_trip(self):
+        """직렬화 후 복원했을 때 획이 같은지 테스트"""
+        document = StrokeDocument()
+        document.add(make_stroke([(1.5, 2.5), (30, 40)]))
+        document.add(make_stroke([(5, 5), (9, 9)], kind=STROKE_ERASER, width=10))
+        document.add(Stroke(STROKE_CLEAR, points=(0, 0, 10, 10)))
+
+        restored = StrokeDocument.from_bytes(document.to_bytes())
+        self.assertEqual(len(restored), 3)
+        for original, copy in zip(document, restored):
+            self.assertEqual((original.kind, original.color, original.width), (copy.kind, copy.color, copy.width))
+            self.assertEqual(original.points.tolist(), copy.points.tolist())
+
+    def test_rasterize_rebuilds_cache(self):
+        """획 삭제 후 캐시를 다시 만들면 잉크가 사라지는지 테스트"""
+        document = StrokeDocument()
+        first = make_stroke([(10, 10), (60, 10)])
+        second = make_stroke([(10, 40), (60, 40)])
+        document.add(first)
+        document.add(second)
+
+        ink = TiledCanvas(tile_size=32)
+        document.rasterize(ink)
+        self.assertEqual(ink.copy(QRect(0, 0, 80, 60)).pixelColor(30, 10), QColor(0, 0, 0))
+
+        self.assertIs(document.hit_test(QPoint(30, 11)), first)
+        document.remove(first)
+        document.rasterize(ink, first.bounds())
+        image = ink.copy(QRect(0, 0, 80, 60))
+        self.assertEqual(image.pixelColor(30, 10), QColor(255, 255, 255))
+        self.assertEqual(image.pixelColor(30, 40), QColor(0, 0, 0))
+
+    def test_render_image_scales(self):
+        """배율을 지정해 렌더링하면 이미지 크기가 커지는지 테스트"""
+        document = StrokeDocument()
+        document.add(make_stroke([(0, 0), (20, 0)]))
+        bounds = document.bounds()
+        image = document.render_image(scale=3.0)
+        self.assertEqual(image.width(), bounds.width() * 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from src.utils.telemetry import LatencyHistogram, Telemetry
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_percentiles_follow_distribution(self):
+        """백분위수가 샘플 분포를 버킷 오차 안에서 따르는지 테스트"""
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.percentile(50), 0.050, delta=0.050 * 0.25)
+        self.assertAlmostEqual(histogram.percentile(99), 0.099, delta=0.099 * 0.25)
+        self.assertLessEqual(histogram.percentile(100), histogram.max)
+
+    def test_empty_histogram(self):
+        """샘플이 없을 때 0을 반환하는지 테스트"""
+        summary = LatencyHistogram().summary()
+        self.assertEqual(summary["count"], 0)
+        self.assertEqual(summary["p95_ms"], 0.0)
+
+class TestTelemetry(unittest.TestCase):
+    def test_span_records_by_name(self):
+        """span이 단계 이름별로 시간을 기록하는지 테스트"""
+        telemetry = Telemetry()
+        for _ in range(3):
+            with telemetry.span("generate"):
+                pass
+        telemetry.record("decode", 0.002)
+
+        summary = telemetry.summary()
+        self.assertEqual(summary["generate"]["count"], 3)
+        self.assertAlmostEqual(summary["decode"]["max_ms"], 2.0)
+        self.assertIn("decode", telemetry.format_summary())
+
+    def test_span_records_on_exception(self):
+        """예외가 발생해도 시간이 기록되는지 테스트"""
+        telemetry = Telemetry()
+        with self.assertRaises(ValueError):
+            with telemetry.span("tensorize"):
+                raise ValueError("boom")
+        self.assertEqual(telemetry.summary()["tensorize"]["count"], 1)
+
+        telemetry.reset()
+        self.assertEqual(telemetry.summary(), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import pytest
+from PyQt5.QtCore import Qt, QEvent, QPoint
+from PyQt5.QtGui import QMouseEvent
+from PyQt5.QtWidgets import QTextEdit
+from src.gui.note_canvas import NoteCanvas
+from src.gui.text_box_layer import HANDLE_SIZE
+
+@pytest.fixture
+def canvas(qtbot):
+    """테스트용 노트 캔버스 픽스처"""
+    canvas = NoteCanvas()
+    canvas.resize(800, 600)
+    qtbot.addWidget(canvas)
+    canvas.show()
+    return canvas
+
+def add_box(canvas, pos, text):
+    """레이어에 텍스트 박스를 추가하고 편집은 마침"""
+    text_box = canvas.text_mode.create_text_box(pos, text)
+    canvas.text_layer.end_edit()
+    return text_box
+
+def test_idle_boxes_have_no_widgets(canvas):
+    """편집하지 않는 텍스트 박스는 위젯을 만들지 않는지 테스트"""
+    for i in range(50):
+        add_box(canvas, QPoint(10 + i * 5, 10 + i * 5), f"box {i}")
+    editors = canvas.findChildren(QTextEdit)
+    assert len(canvas.text_boxes) == 50
+    assert len(editors) == 1  # 공유 편집기 하나
+    assert not editors[0].isVisible()
+
+def test_click_edits_and_writes_back(canvas, qtbot):
+    """박스를 클릭하면 편집기가 붙고, 편집을 마치면 내용이 모델에 반영되는지 테스트"""
+    first = add_box(canvas, QPoint(50, 50), "first")
+    second = add_box(canvas, QPoint(300, 50), "second")
+
+    qtbot.mouseClick(canvas, Qt.MouseButton.LeftButton, pos=QPoint(100, 70))
+    layer = canvas.text_layer
+    assert layer.editing is first
+    assert layer.editor.geometry() == first.geometry()
+
+    original = first.geometry()
+    layer.editor.setPlainText("changed to a much longer line")
+    qtbot.mouseClick(canvas, Qt.MouseButton.LeftButton, pos=QPoint(350, 70))
+    assert layer.editing is second
+    assert first.toPlainText() == "changed to a much longer line"
+    edited = first.geometry()
+    assert edited.size() != original.size()  # 편집기가 내용에 맞춰 크기를 바꿈
+
+    layer.end_edit()
+    canvas.undo()
+    assert first.toPlainText() == "first"
+    assert first.geometry() == original  # 크기 자동 조절 없이 편집 전 크기로 복원
+    canvas.redo()
+    assert first.geometry() == edited
+
+def test_drag_handle_moves_box(canvas, qtbot):
+    """오버레이 드래그 핸들로 박스를 옮기면 인덱스도 갱신되는지 테스트"""
+    text_box = add_box(canvas, QPoint(100, 100), "drag me")
+    grip = QPoint(100 + HANDLE_SIZE // 2, 100 + HANDLE_SIZE // 2)
+    qtbot.mousePress(canvas, Qt.MouseButton.LeftButton, pos=grip)
+    # QTest.mouseMove는 버튼 상태를 보내지 않으므로 이벤트를 직접 전달
+    canvas.mouseMoveEvent(QMouseEvent(QEvent.Type.MouseMove, grip + QPoint(200, 100), Qt.MouseButton.LeftButton,
+                                      Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier))
+    qtbot.mouseRelease(canvas, Qt.MouseButton.LeftButton, pos=grip + QPoint(200, 100))
+
+    assert text_box.pos() == QPoint(300, 200)
+    assert canvas.text_layer.model_at(QPoint(310, 210)) is text_box
+    assert canvas.text_layer.model_at(QPoint(110, 110)) is None
+    assert canvas.text_layer.editing is None
+
+def test_view_mode_wraps_with_tag(canvas):
+    """View 모드에서 저장용 태그 감싸기와 복원 테스트"""
+    text_box = add_box(canvas, QPoint(10, 10), "hello")
+    text_box.wrapTextWithTags()
+    assert text_box.toPlainText() == "hello"  # View 모드가 아니면 그대로
+
+    canvas.set_mode("view")
+    text_box.tag = "button"
+    text_box.wrapTextWithTags()
+    assert text_box.toPlainText() == "<button>hello</button>"
+    text_box.restoreOriginalText()
+    assert text_box.toPlainText() == "hello"
+
+def drag(canvas, qtbot, start, end):
+    """버튼을 누른 채로 start에서 end까지 끌기"""
+    qtbot.mousePress(canvas, Qt.MouseButton.LeftButton, pos=start)
+    canvas.mouseMoveEvent(QMouseEvent(QEvent.Type.MouseMove, end, Qt.MouseButton.LeftButton,
+                                      Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier))
+    qtbot.mouseRelease(canvas, Qt.MouseButton.LeftButton, pos=end)
+
+def test_move_is_undoable(canvas, qtbot):
+    """드래그 이동을 실행 취소/다시 실행할 수 있는지 테스트"""
+    text_box = add_box(canvas, QPoint(100, 100), "move me")
+    grip = QPoint(100 + HANDLE_SIZE // 2, 100 + HANDLE_SIZE // 2)
+    drag(canvas, qtbot, grip, grip + QPoint(200, 100))
+    assert text_box.pos() == QPoint(300, 200)
+
+    canvas.undo()
+    assert text_box.pos() == QPoint(100, 100)
+    assert canvas.text_layer.model_at(QPoint(110, 110)) is text_box
+    canvas.redo()
+    assert text_box.pos() == QPoint(300, 200)
+
+def test_edit_undo_after_move_keeps_position(canvas, qtbot):
+    """이동 후 편집을 되돌려도 박스가 이동 전 위치로 돌아가지 않는지 테스트"""
+    text_box = add_box(canvas, QPoint(100, 100), "before")
+    grip = QPoint(100 + HANDLE_SIZE // 2, 100 + HANDLE_SIZE // 2)
+    drag(canvas, qtbot, grip, grip + QPoint(200, 100))
+    canvas.text_layer.begin_edit(text_box)
+    canvas.text_layer.editor.setPlainText("after")
+    canvas.text_layer.end_edit()
+
+    canvas.undo()
+    assert text_box.toPlainText() == "before"
+    assert text_box.pos() == QPoint(300, 200)
+
+def test_resize_is_undoable(canvas, qtbot):
+    """크기 조절을 실행 취소/다시 실행할 수 있는지 테스트"""
+    text_box = add_box(canvas, QPoint(100, 100), "resize me")
+    size = text_box.size()
+    grip = text_box.geometry().bottomRight() - QPoint(HANDLE_SIZE // 2, HANDLE_SIZE // 2)
+    drag(canvas, qtbot, grip, grip + QPoint(80, 40))
+    resized = text_box.size()
+    assert resized.width() == size.width() + 80
+
+    canvas.undo()
+    assert text_box.size() == size
+    canvas.redo()
+    assert text_box.size() == resized
+
+def test_delete_is_undoable(canvas, qtbot):
+    """Alt+우클릭 삭제를 실행 취소/다시 실행할 수 있는지 테스트"""
+    text_box = add_box(canvas, QPoint(100, 100), "delete me")
+    grip = QPoint(100 + HANDLE_SIZE // 2, 100 + HANDLE_SIZE // 2)
+    qtbot.mousePress(canvas, Qt.MouseButton.RightButton, Qt.KeyboardModifier.AltModifier, pos=grip)
+    assert text_box not in canvas.text_boxes
+
+    canvas.undo()
+    assert text_box in canvas.text_boxes
+    assert canvas.text_layer.model_at(QPoint(110, 110)) is text_box
+    canvas.redo()
+    assert text_box not in canvas.text_boxes
+
+def test_editor_delete_is_undoable(canvas):
+    """편집기 드래그 핸들로 지운 박스를 되살릴 수 있는지 테스트"""
+    text_box = add_box(canvas, QPoint(100, 100), "delete me")
+    canvas.text_layer.begin_edit(text_box)
+    canvas.text_layer.editor.deleteLater()
+    assert text_box not in canvas.text_boxes
+    assert canvas.text_layer.editing is None
+
+    canvas.undo()
+    assert text_box in canvas.text_boxes
+    assert text_box.toPlainText() == "delete me"
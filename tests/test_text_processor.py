@@ -0,0 +1,97 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageDraw
+
+from src.utils.ocr_cache import OcrResultCache
+from src.utils.text_processor import OCR_ERROR_PREFIX, LazyTextProcessor, TextProcessor
+
+class FakeProcessor:
+    """모델 없이 동작하는 테스트용 처리기"""
+
+    def process_image(self, image):
+        return f"text:{image}"
+
+class TestLazyTextProcessor(unittest.TestCase):
+    def test_not_loaded_until_used(self):
+        """생성 시점에는 처리기를 만들지 않는지 테스트"""
+        created = []
+        handle = LazyTextProcessor(lambda: created.append(1) or FakeProcessor())
+        self.assertFalse(handle.is_ready())
+        self.assertEqual(created, [])
+
+    def test_warmup_and_ready_callback(self):
+        """워밍업 완료 시 콜백이 호출되는지 테스트"""
+        handle = LazyTextProcessor(FakeProcessor)
+        done = threading.Event()
+        results = []
+        handle.add_ready_callback(lambda ok: (results.append(ok), done.set()))
+        handle.warmup()
+        self.assertTrue(done.wait(5))
+        self.assertEqual(results, [True])
+        self.assertTrue(handle.is_ready())
+
+    def test_attribute_access_waits_for_load(self):
+        """워밍업 전 사용 시 로딩 후 위임되는지 테스트"""
+        handle = LazyTextProcessor(FakeProcessor)
+        self.assertEqual(handle.process_image("a"), "text:a")
+
+    def test_failed_load(self):
+        """로딩 실패 시 오류를 전달하는지 테스트"""
+        def factory():
+            raise ValueError("no model")
+
+        handle = LazyTextProcessor(factory)
+        results = []
+        handle.add_ready_callback(results.append)
+        with self.assertRaises(RuntimeError):
+            handle.get()
+        self.assertEqual(results, [False])
+        self.assertFalse(handle.is_ready())
+
+def bare_processor():
+    """모델을 로드하지 않고 인식 함수만 바꿔 끼운 TextProcessor"""
+    processor = TextProcessor.__new__(TextProcessor)
+    processor.model_id = "test"
+    processor.generation_params = {"num_beams": 1, "max_new_tokens": None, "early_stopping": True}
+    processor.preprocess_profile = "canvas_ink"
+    processor.inference_mode = "fp32"
+    processor.cache = OcrResultCache(8)
+    processor._preprocess_pool = ThreadPoolExecutor(max_workers=2)
+    processor.preprocess_image = lambda image, profile=None: image
+    return processor
+
+def two_line_crop():
+    """가로 획 두 줄이 있는 선택 영역 이미지"""
+    image = Image.new("RGB", (120, 70), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((10, 10, 100, 17), fill="black")
+    draw.rectangle((10, 45, 100, 52), fill="black")
+    return image
+
+class TestMultiLineRecognition(unittest.TestCase):
+    def test_partial_failure_is_not_cached(self):
+        """일부 줄 인식이 실패하면 오류로 알리고 캐시하지 않는지 테스트"""
+        processor = bare_processor()
+        processor.recognize_texts = lambda images: ["first", None]
+        result = processor.process_image(two_line_crop())
+        self.assertTrue(result.startswith(OCR_ERROR_PREFIX))
+        self.assertNotIn("first", result)
+
+        processor.recognize_texts = lambda images: ["first", "second"]
+        self.assertEqual(processor.process_image(two_line_crop()), "first\nsecond")
+        processor.recognize_texts = lambda images: [None, None]
+        self.assertEqual(processor.process_image(two_line_crop()), "first\nsecond")  # 성공한 결과만 캐시
+
+    def test_preprocess_error_is_not_joined(self):
+        """전처리 오류 메시지가 텍스트에 섞이거나 캐시되지 않는지 테스트"""
+        processor = bare_processor()
+        def broken(image, profile=None):
+            raise ValueError("전처리 실패")
+        processor.preprocess_image = broken
+        self.assertTrue(processor.process_image(two_line_crop()).startswith(OCR_ERROR_PREFIX))
+        self.assertEqual(processor.cache.stats()["entries"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import threading
+
+import pytest
+from PyQt5.QtCore import QCoreApplication, QPoint, QRect
+from PyQt5.QtGui import QColor
+from src.gui import ocr_worker
+from src.gui.note_canvas import NoteCanvas
+from src.gui.stroke_model import Stroke
+from src.gui.undo_history import StrokeChange
+from src.utils.text_processor import OCR_ERROR_PREFIX
+
+AREA = QRect(10, 10, 100, 60)
+
+@pytest.fixture
+def canvas(qtbot):
+    """획 하나가 그려진 노트 캔버스 픽스처"""
+    canvas = NoteCanvas()
+    canvas.resize(400, 300)
+    qtbot.addWidget(canvas)
+    stroke = Stroke(points=(20, 40, 90, 40), width=4)
+    canvas.strokes.add(stroke)
+    canvas.ink.paint(stroke.bounds(), stroke.render)
+    return canvas
+
+def start_recognition(canvas):
+    """선택 영역을 고정하고 인식 시작"""
+    mode = canvas.text_recognition_mode
+    mode.selection_fixed = True
+    mode.process_selection(AREA)
+    return mode
+
+def finish_jobs(mode):
+    """백그라운드 작업을 마치고 결과 시그널 전달"""
+    mode.thread_pool.waitForDone()
+    QCoreApplication.sendPostedEvents()
+
+class FakeProcessor:
+    """주어진 함수로 인식하는 테스트용 처리기"""
+    def __init__(self, recognize):
+        self.process_image = recognize
+
+def use_processor(monkeypatch, recognize):
+    monkeypatch.setattr(ocr_worker, "text_processor", FakeProcessor(recognize))
+
+def ink_at(canvas, x, y):
+    return QColor(canvas.ink.copy(QRect(x, y, 1, 1)).pixel(0, 0))
+
+def draw_line(canvas, y):
+    """그리기 모드처럼 실행 취소 기록과 함께 가로선 그리기"""
+    stroke = Stroke(points=(20, y, 90, y), width=4)
+    canvas.history.begin("그리기", canvas.ink)
+    canvas.history.capture(stroke.bounds())
+    canvas.ink.paint(stroke.bounds(), stroke.render)
+    canvas.strokes.add(stroke)
+    canvas.history.add_change(StrokeChange(canvas.strokes, added=[stroke]))
+    canvas.history.commit()
+
+def test_failure_restores_area(canvas, monkeypatch):
+    """인식이 실패하면 자리 표시 박스를 지우고 지운 영역을 복원하는지 테스트"""
+    def fail(image):
+        raise RuntimeError("모델 없음")
+    use_processor(monkeypatch, fail)
+
+    mode = start_recognition(canvas)
+    assert ink_at(canvas, 50, 40) == QColor(255, 255, 255)
+    finish_jobs(mode)
+
+    assert mode.pending_job is None
+    assert len(canvas.text_boxes) == 0
+    assert len(canvas.strokes) == 1
+    assert ink_at(canvas, 50, 40) == QColor(0, 0, 0)
+
+def test_error_result_restores_area(canvas, monkeypatch):
+    """처리기가 오류 메시지를 돌려주면 텍스트로 넣지 않고 실패로 처리하는지 테스트"""
+    use_processor(monkeypatch, lambda image: OCR_ERROR_PREFIX + "일부 줄 인식 실패")
+
+    mode = start_recognition(canvas)
+    finish_jobs(mode)
+
+    assert len(canvas.text_boxes) == 0
+    assert ink_at(canvas, 50, 40) == QColor(0, 0, 0)
+
+def test_cancel_while_running(canvas, monkeypatch):
+    """실행 중에 취소하면 결과를 무시하고 영역을 복원하는지 테스트"""
+    started = threading.Event()
+    release = threading.Event()
+    def slow(image):
+        started.set()
+        release.wait(5)
+        return "늦은 결과"
+    use_processor(monkeypatch, slow)
+
+    mode = start_recognition(canvas)
+    assert started.wait(5)
+    mode.cancel_pending_recognition()
+    assert len(ocr_worker.OcrJob._active) == 1  # 참조를 놓아도 실행이 끝날 때까지 유지
+    release.set()
+    finish_jobs(mode)
+
+    assert not ocr_worker.OcrJob._active
+    assert len(canvas.text_boxes) == 0
+    assert ink_at(canvas, 50, 40) == QColor(0, 0, 0)
+    mode.cancel_pending_recognition()  # 취소할 작업이 없으면 무시
+
+def test_cancel_after_completion(canvas, monkeypatch):
+    """작업이 끝난 뒤 결과 전달 전에 취소해도 오류가 없는지 테스트"""
+    use_processor(monkeypatch, lambda image: "hello")
+
+    mode = start_recognition(canvas)
+    mode.thread_pool.waitForDone()
+    mode.cancel_pending_recognition()
+    QCoreApplication.sendPostedEvents()
+
+    assert len(canvas.text_boxes) == 0
+    assert ink_at(canvas, 50, 40) == QColor(0, 0, 0)
+
+def test_undo_after_cancel_keeps_ink_in_sync(canvas, monkeypatch):
+    """인식 중에 그린 획이 있어도 취소 후 실행 취소하면 잉크가 획과 일치하는지 테스트"""
+    release = threading.Event()
+    use_processor(monkeypatch, lambda image: release.wait(5) and "")
+
+    mode = start_recognition(canvas)
+    draw_line(canvas, 60)  # 지운 영역과 같은 타일에 그리기
+    mode.cancel_pending_recognition()
+    release.set()
+    finish_jobs(mode)
+    assert ink_at(canvas, 50, 40) == QColor(0, 0, 0)
+
+    # 취소 -> 인식 중에 그린 획 -> 인식 시작 순서로 되돌림
+    canvas.history.undo()
+    assert ink_at(canvas, 50, 40) == QColor(255, 255, 255)
+    assert ink_at(canvas, 50, 60) == QColor(0, 0, 0)
+    assert len(canvas.text_boxes) == 1
+    canvas.history.undo()
+    canvas.history.undo()
+    assert not canvas.history.can_undo()
+    assert len(canvas.strokes) == 1
+    assert len(canvas.text_boxes) == 0
+    assert ink_at(canvas, 50, 40) == QColor(0, 0, 0)
+    assert ink_at(canvas, 50, 60) == QColor(255, 255, 255)
+
+def test_success_fills_text_box(canvas, monkeypatch):
+    """인식 결과가 자리 표시 박스에 채워지는지 테스트"""
+    use_processor(monkeypatch, lambda image: "hello")
+
+    mode = start_recognition(canvas)
+    finish_jobs(mode)
+
+    boxes = list(canvas.text_boxes)
+    assert [box.toPlainText() for box in boxes] == ["hello"]
+    assert not boxes[0].isReadOnly()
+    assert boxes[0].pos() == QPoint(10, 10)
+
+def test_empty_result_placeholder_stays_removed(canvas, monkeypatch):
+    """빈 결과로 지운 자리 표시 박스가 실행 취소/다시 실행으로 되살아나지 않는지 테스트"""
+    use_processor(monkeypatch, lambda image: "")
+
+    mode = start_recognition(canvas)
+    finish_jobs(mode)
+    assert len(canvas.text_boxes) == 0
+
+    canvas.history.undo()
+    assert len(canvas.text_boxes) == 0
+    assert ink_at(canvas, 50, 40) == QColor(0, 0, 0)
+    canvas.history.redo()
+    assert len(canvas.text_boxes) == 0
+    assert ink_at(canvas, 50, 40) == QColor(255, 255, 255)
@@ -0,0 +1,88 @@
+import unittest
+
+from PyQt5.QtCore import Qt, QPoint, QRect
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen
+
+from src.gui.tiled_canvas import TiledCanvas
+
+def draw_line(canvas, start, end, width=2):
+    """테스트용 선 그리기"""
+    rect = QRect(start, end).normalized().adjusted(-width, -width, width, width)
+
+    def draw(painter):
+        painter.setPen(QPen(Qt.GlobalColor.black, width))
+        painter.drawLine(start, end)
+
+    canvas.paint(rect, draw)
+
+class TestTiledCanvas(unittest.TestCase):
+    def test_tiles_allocated_on_first_touch(self):
+        """그린 영역의 타일만 할당되는지 테스트"""
+        canvas = TiledCanvas(tile_size=64)
+        self.assertEqual(canvas.memory_bytes(), 0)
+
+        draw_line(canvas, QPoint(10, 10), QPoint(100, 10))
+        self.assertEqual(set(canvas.tiles), {(0, 0), (1, 0)})
+
+    def test_content_far_away_and_negative_coordinates(self):
+        """창 밖이나 음수 좌표의 잉크도 보존되는지 테스트"""
+        canvas = TiledCanvas(tile_size=64)
+        draw_line(canvas, QPoint(5000, 5000), QPoint(5010, 5000))
+        draw_line(canvas, QPoint(-30, -30), QPoint(-20, -30))
+        self.assertEqual(len(canvas.tiles), 2)
+
+        self.assertEqual(canvas.copy(QRect(5000, 4998, 11, 5)).pixelColor(5, 2).black(), 255)
+        self.assertEqual(canvas.copy(QRect(-30, -32, 11, 5)).pixelColor(5, 2).black(), 255)
+
+    def test_copy_spanning_tiles(self):
+        """여러 타일에 걸친 영역 복사와 빈 영역의 배경색 테스트"""
+        canvas = TiledCanvas(tile_size=32)
+        canvas.fill_rect(QRect(30, 30, 4, 4), QColor(Qt.GlobalColor.black))
+        self.assertEqual(len(canvas.tiles), 4)
+
+        image = canvas.copy(QRect(28, 28, 200, 8))
+        self.assertEqual(image.size().width(), 200)
+        self.assertEqual(image.pixelColor(2, 2), QColor(Qt.GlobalColor.black))
+        self.assertEqual(image.pixelColor(5, 5), QColor(Qt.GlobalColor.black))
+        self.assertEqual(image.pixelColor(150, 2), QColor(Qt.GlobalColor.white))
+
+        pil_image = canvas.to_pil(QRect(28, 28, 8, 8))
+        self.assertEqual(pil_image.getpixel((3, 3)), (0, 0, 0, 255))
+        self.assertEqual(pil_image.getpixel((0, 0)), (255, 255, 255, 255))
+
+    def test_render_touches_only_requested_rect(self):
+        """render가 요청한 영역 밖의 픽셀은 건드리지 않는지 테스트"""
+        canvas = TiledCanvas(tile_size=32)
+        canvas.fill_rect(QRect(0, 0, 64, 64), QColor(Qt.GlobalColor.black))
+        target = QImage(64, 64, QImage.Format.Format_RGB32)
+        target.fill(QColor(Qt.GlobalColor.red))
+
+        painter = QPainter(target)
+        canvas.render(painter, QRect(20, 20, 20, 20))
+        painter.end()
+        self.assertEqual(target.pixelColor(25, 25), QColor(Qt.GlobalColor.black))
+        self.assertEqual(target.pixelColor(39, 39), QColor(Qt.GlobalColor.black))
+        self.assertEqual(target.pixelColor(40, 40), QColor(Qt.GlobalColor.red))
+        self.assertEqual(target.pixelColor(19, 25), QColor(Qt.GlobalColor.red))
+
+    def test_fill_background_releases_covered_tiles(self):
+        """배경색으로 덮인 타일이 해제되는지 테스트"""
+        canvas = TiledCanvas(tile_size=32)
+        draw_line(canvas, QPoint(10, 10), QPoint(100, 10))
+        canvas.fill_rect(QRect(0, 0, 64, 32))
+        self.assertEqual(set(canvas.tiles), {(2, 0), (3, 0)})
+
+    def test_snapshot_is_not_affected_by_later_drawing(self):
+        """스냅샷 이후의 그리기가 스냅샷에 영향을 주지 않는지 테스트"""
+        canvas = TiledCanvas(tile_size=32)
+        canvas.fill_rect(QRect(0, 0, 4, 4), QColor(Qt.GlobalColor.black))
+        snapshot = canvas.snapshot()
+
+        canvas.fill_rect(QRect(10, 10, 4, 4), QColor(Qt.GlobalColor.black))
+        canvas.restore(snapshot)
+        image = canvas.copy(QRect(0, 0, 32, 32))
+        self.assertEqual(image.pixelColor(1, 1), QColor(Qt.GlobalColor.black))
+        self.assertEqual(image.pixelColor(11, 11), QColor(Qt.GlobalColor.white))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor
+
+from src.gui.stroke_model import Stroke, StrokeDocument
+from src.gui.tiled_canvas import TiledCanvas
+from src.gui.undo_history import StrokeChange, TextEditChange, UndoHistory
+
+def draw_line(history, document, ink, y):
+    """잉크와 문서에 가로선 하나를 그리고 기록"""
+    stroke = Stroke(points=(10, y, 60, y))
+    rect = stroke.bounds()
+    history.begin("그리기", ink)
+    history.capture(rect)
+    ink.paint(rect, stroke.render)
+    document.add(stroke)
+    history.add_change(StrokeChange(document, added=[stroke]))
+    return history.commit()
+
+class TestUndoHistory(unittest.TestCase):
+    def setUp(self):
+        self.history = UndoHistory()
+        self.document = StrokeDocument()
+        self.ink = TiledCanvas(tile_size=32)
+
+    def pixel(self, x, y):
+        return self.ink.copy(QRect(0, 0, 100, 100)).pixelColor(x, y)
+
+    def test_undo_redo_restores_tiles_and_strokes(self):
+        """실행 취소/다시 실행 시 타일과 획이 함께 복원되는지 테스트"""
+        draw_line(self.history, self.document, self.ink, 10)
+        draw_line(self.history, self.document, self.ink, 50)
+
+        self.history.undo()
+        self.assertEqual(len(self.document), 1)
+        self.assertEqual(self.pixel(30, 50), QColor(Qt.GlobalColor.white))
+        self.assertEqual(self.pixel(30, 10), QColor(0, 0, 0))
+
+        self.history.undo()
+        self.assertEqual(len(self.document), 0)
+        self.assertEqual(self.ink.tiles, {})  # 새로 할당된 타일은 해제
+
+        self.history.redo()
+        self.history.redo()
+        self.assertEqual(len(self.document), 2)
+        self.assertEqual(self.pixel(30, 50), QColor(0, 0, 0))
+        self.assertFalse(self.history.can_redo())
+
+    def test_only_changed_tiles_are_recorded(self):
+        """바뀌지 않은 타일은 기록에서 제외되는지 테스트"""
+        self.ink.tile((2, 2), create=True)
+        self.history.begin("그리기", self.ink)
+        self.history.capture(QRect(0, 0, 96, 96))
+        self.ink.fill_rect(QRect(0, 0, 10, 10), Qt.GlobalColor.black)
+        entry = self.history.commit()
+
+        tiles = entry.changes[0]
+        self.assertEqual(list(tiles.before), [(0, 0)])
+        self.assertLess(entry.size, self.ink.tile((0, 0)).sizeInBytes())
+
+    def test_new_action_clears_redo(self):
+        """실행 취소 후 새 동작을 하면 다시 실행 기록이 사라지는지 테스트"""
+        draw_line(self.history, self.document, self.ink, 10)
+        self.history.undo()
+        draw_line(self.history, self.document, self.ink, 50)
+        self.assertFalse(self.history.can_redo())
+        self.assertIsNone(self.history.redo())
+
+    def test_memory_limit_evicts_oldest(self):
+        """메모리 상한을 넘으면 가장 오래된 기록부터 버리는지 테스트"""
+        self.history.memory_limit = 1
+        first = self.history.push("편집", [TextEditChange(None, "a" * 10, "b" * 10)])
+        second = self.history.push("편집", [TextEditChange(None, "c" * 10, "d" * 10)])
+        self.assertTrue(self.history.can_undo())
+        self.assertIs(self.history._undo_stack[0], second)
+        self.assertNotIn(first, self.history._undo_stack)
+
+    def test_discard_removes_entry(self):
+        """discard()로 기록만 삭제되는지 테스트"""
+        entry = draw_line(self.history, self.document, self.ink, 10)
+        self.history.discard(entry)
+        self.assertFalse(self.history.can_undo())
+        self.assertEqual(self.history.memory_bytes(), 0)
+
+if __name__ == '__main__':
+    unittest.main()